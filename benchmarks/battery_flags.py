@@ -0,0 +1,100 @@
+"""Benchmark the per-frame cost of applying battery flags frames.
+
+Each frame of the frame mix of :mod:`benchmarks.bms_parse` carrying
+battery flags is applied to the cell and thermistor flags with the
+previous per-element dictionaries and with
+:meth:`revolution.utilities.FlagArray.assign`.
+
+Run from the project root with ``python -m benchmarks.battery_flags``.
+"""
+
+from time import perf_counter
+from unittest.mock import MagicMock
+
+from benchmarks.bms_parse import record
+from revolution.battery_management_system import (
+    BATTERY_CELL_COUNT,
+    BATTERY_THERMISTOR_COUNT,
+    BatteryFlag,
+    BatteryManagementSystem,
+    BatteryPackFlagsInformation,
+)
+from revolution.utilities import FlagArray
+
+REPEAT_COUNT = 200
+
+
+def _apply_previously(
+        information: BatteryPackFlagsInformation,
+        cell_flags: list[BatteryFlag],
+        thermistor_flags: list[BatteryFlag],
+) -> None:
+    for i in range(BATTERY_CELL_COUNT):
+        if information.flags & (1 << i):
+            flag = information.CELL_FLAG
+        else:
+            flag = BatteryFlag(0)
+
+        cell_flags[i] -= cell_flags[i] & information.CELL_FLAG
+        cell_flags[i] |= flag
+
+    for i in range(BATTERY_THERMISTOR_COUNT):
+        if information.flags & (1 << (i + BATTERY_CELL_COUNT)):
+            flag = information.THERMISTOR_FLAG
+        else:
+            flag = BatteryFlag(0)
+
+        thermistor_flags[i] -= (
+            thermistor_flags[i]
+            & information.THERMISTOR_FLAG
+        )
+        thermistor_flags[i] |= flag
+
+
+def _apply(
+        information: BatteryPackFlagsInformation,
+        cell_flags: FlagArray[BatteryFlag],
+        thermistor_flags: FlagArray[BatteryFlag],
+) -> None:
+    cell_flags.assign(information.CELL_FLAG, information.cell_flag_mask)
+    thermistor_flags.assign(
+        information.THERMISTOR_FLAG,
+        information.thermistor_flag_mask,
+    )
+
+
+def main() -> None:
+    battery_management_system = BatteryManagementSystem(MagicMock(), 0x500)
+    informations = [
+        information
+        for information in map(battery_management_system.parse, record())
+        if isinstance(information, BatteryPackFlagsInformation)
+    ]
+    results = []
+
+    for name, apply, create_flags in (
+            ('previous', _apply_previously, lambda n: [BatteryFlag(0)] * n),
+            ('flag array', _apply, FlagArray),
+    ):
+        cell_flags = create_flags(BATTERY_CELL_COUNT)
+        thermistor_flags = create_flags(BATTERY_THERMISTOR_COUNT)
+        start_time = perf_counter()
+
+        for _ in range(REPEAT_COUNT):
+            for information in informations:
+                apply(information, cell_flags, thermistor_flags)
+
+        frame_time = (perf_counter() - start_time) / (
+            REPEAT_COUNT * len(informations)
+        )
+
+        results.append((frame_time, list(cell_flags), list(thermistor_flags)))
+        print(f'{name:>10}: {frame_time * 1e6:6.2f}us/frame')
+
+    assert results[0][1:] == results[1][1:]
+
+    print(f'{"speedup":>10}: {results[0][0] / results[1][0]:6.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""Benchmark the per-frame cost of parsing battery management system
+frames.
+
+The frame mix follows the broadcast of the battery management system:
+the statuses, flags and LV frames and the cell voltage and thermistor
+temperature frames at 10 Hz, the hold frames at 1 Hz, along with frames
+of other devices on the bus. Each frame is parsed with the previous
+linear search over the information types and with
+:meth:`revolution.battery_management_system.BatteryManagementSystem.parse`.
+
+Run from the project root with ``python -m benchmarks.bms_parse``.
+"""
+
+from random import Random
+from struct import pack, unpack
+from time import perf_counter
+from unittest.mock import MagicMock
+
+from can import Message
+
+from revolution.battery_management_system import (
+    BatteryManagementSystem,
+    Information,
+)
+
+DURATION = 10
+FAST_RATE = 10
+SLOW_RATE = 1
+FOREIGN_ARBITRATION_IDS = (0x402, 0x403, 0x50B, 0x603)
+REPEAT_COUNT = 20
+
+
+def _create_data(message_identifier: int, random: Random) -> bytes:
+    if message_identifier == 0:
+        return pack('<BBeee', 0b101, 0, 0, random.uniform(100, 140), 1)
+    elif message_identifier in (1, 2, 4, 5):
+        return pack('<Q', random.getrandbits(55))
+    elif 6 <= message_identifier < 12:
+        return pack('<HHee', 10, 1, random.uniform(0, 5), 0)
+
+    return pack('<eeee', *(random.uniform(2.5, 4.2) for _ in range(4)))
+
+
+def record() -> list[Message]:
+    """Synthesize ``DURATION`` seconds of frames, shuffled."""
+    random = Random(0)
+    frames = []
+
+    for tick in range(DURATION * FAST_RATE):
+        message_identifiers = [*range(0, 4), *range(18, 32)]
+
+        if tick % (FAST_RATE // SLOW_RATE) == 0:
+            message_identifiers.extend(range(4, 12))
+
+        for message_identifier in message_identifiers:
+            frames.append(
+                Message(
+                    arbitration_id=(
+                        BatteryManagementSystem.BASE_ADDRESS
+                        + message_identifier
+                    ),
+                    data=_create_data(message_identifier, random),
+                    is_extended_id=False,
+                ),
+            )
+
+        for arbitration_id in FOREIGN_ARBITRATION_IDS:
+            frames.append(
+                Message(
+                    arbitration_id=arbitration_id,
+                    data=bytes(8),
+                    is_extended_id=False,
+                ),
+            )
+
+    random.shuffle(frames)
+
+    return frames
+
+
+def _parse_previously(message: Message) -> Information | None:
+    device_identifier = message.arbitration_id >> 5
+
+    if BatteryManagementSystem.BASE_ADDRESS != device_identifier << 5:
+        return None
+
+    message_identifier = message.arbitration_id & ((1 << 5) - 1)
+    information = None
+
+    for type_ in BatteryManagementSystem.INFORMATION_TYPES:
+        if message_identifier in type_.MESSAGE_IDENTIFIERS:
+            information = type_(
+                message_identifier,
+                *unpack(type_.FORMAT, message.data),
+            )
+
+            break
+
+    return information
+
+
+def main() -> None:
+    frames = record()
+    battery_management_system = BatteryManagementSystem(MagicMock(), 0x500)
+    results = []
+
+    for name, parse in (
+            ('previous', _parse_previously),
+            ('table', battery_management_system.parse),
+    ):
+        informations = [parse(frame) for frame in frames]
+        start_time = perf_counter()
+
+        for _ in range(REPEAT_COUNT):
+            for frame in frames:
+                parse(frame)
+
+        frame_time = (perf_counter() - start_time) / (
+            REPEAT_COUNT * len(frames)
+        )
+
+        results.append((frame_time, informations))
+        print(f'{name:>10}: {frame_time * 1e6:6.2f}us/frame')
+
+    assert results[0][1] == results[1][1]
+
+    print(f'{"speedup":>10}: {results[0][0] / results[1][0]:6.2f}x')
+
+
+if __name__ == '__main__':
+    main()
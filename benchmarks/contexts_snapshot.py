@@ -0,0 +1,125 @@
+"""Benchmark lock wait and hold times of contexts reads.
+
+A writer thread updates battery cell voltages the way
+``Power._handle_can`` does, while reader threads read the fields
+``Telemetry`` sends, either through the contexts door or through
+:meth:`revolution.environment.ContextsDoor.snapshot`.
+
+Run from the project root with ``python -m benchmarks.contexts_snapshot``.
+"""
+
+from dataclasses import fields, replace
+from statistics import quantiles
+from threading import Event, Thread
+from time import perf_counter, sleep
+
+from revolution.environment import ContextsDoor, Partition
+from revolution.utilities import AggregateArray
+from revolution.telemetry import Telemetry
+from revolution.tests import configurations
+
+DURATION = 2.0
+READER_COUNT = 8
+READER_PERIOD = 0.001
+WRITER_PERIOD = 0.0002
+
+
+def _summarize(name: str, samples: list[float]) -> str:
+    percentiles = quantiles(samples, n=100)
+
+    return (
+        f'{name:>12}: n={len(samples):6d}'
+        f' p50={percentiles[49] * 1e6:8.1f}us'
+        f' p99={percentiles[98] * 1e6:8.1f}us'
+        f' max={max(samples) * 1e6:8.1f}us'
+    )
+
+
+def _run(snapshot: bool) -> None:
+    door = ContextsDoor(
+        replace(
+            configurations.CONTEXTS,
+            power_battery_cell_voltages=AggregateArray('d', [3.0] * 36),
+        ),
+    )
+    stoppage = Event()
+    names = [field.name for field in fields(Telemetry.Data)]
+    writer_waits: list[float] = []
+    writer_holds: list[float] = []
+    reader_waits: list[float] = []
+    reader_holds: list[float] = []
+
+    def write() -> None:
+        i = 0
+
+        while not stoppage.is_set():
+            time_0 = perf_counter()
+
+            with door(Partition.POWER) as contexts:
+                time_1 = perf_counter()
+
+                for j in range(4):
+                    contexts.power_battery_cell_voltages[(i + j) % 36] = 3.1
+
+                cell_voltages = contexts.power_battery_cell_voltages
+                contexts.power_battery_min_cell_voltage = cell_voltages.minimum
+                contexts.power_battery_max_cell_voltage = cell_voltages.maximum
+                contexts.power_battery_mean_cell_voltage = cell_voltages.mean
+                contexts.power_battery_heartbeat_timestamp = time_1
+
+            time_2 = perf_counter()
+            writer_waits.append(time_1 - time_0)
+            writer_holds.append(time_2 - time_1)
+            i += 4
+
+            sleep(WRITER_PERIOD)
+
+    def read() -> None:
+        while not stoppage.is_set():
+            time_0 = perf_counter()
+
+            if snapshot:
+                contexts = door.snapshot()
+                time_1 = perf_counter()
+
+                for name in names:
+                    getattr(contexts, name)
+            else:
+                with door() as contexts:
+                    time_1 = perf_counter()
+
+                    for name in names:
+                        getattr(contexts, name)
+
+            time_2 = perf_counter()
+            reader_waits.append(time_1 - time_0)
+            reader_holds.append(0 if snapshot else time_2 - time_1)
+
+            sleep(READER_PERIOD)
+
+    threads = [Thread(target=write)]
+    threads.extend(Thread(target=read) for _ in range(READER_COUNT))
+
+    for thread in threads:
+        thread.start()
+
+    sleep(DURATION)
+    stoppage.set()
+
+    for thread in threads:
+        thread.join()
+
+    print('snapshot reads' if snapshot else 'locked reads')
+    print(_summarize('writer wait', writer_waits))
+    print(_summarize('writer hold', writer_holds))
+    print(_summarize('reader wait', reader_waits))
+    print(_summarize('reader hold', reader_holds))
+
+
+def main() -> None:
+    _run(False)
+    _run(True)
+
+
+if __name__ == '__main__':
+    main()
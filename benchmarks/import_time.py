@@ -0,0 +1,112 @@
+"""Benchmark and guard the cold-start import time.
+
+Each module is imported in a fresh interpreter with ``-X importtime``
+so that every run is a cold start. The median cumulative import time
+is checked against a budget, and the hardware and numerical libraries
+that are imported lazily must not be imported at all. The slowest
+imports of the last run are listed to point at regressions.
+
+Run from the project root with ``python -m benchmarks.import_time``.
+The exit status is nonzero if a guard fails.
+"""
+
+from statistics import median
+from subprocess import run
+from sys import executable
+
+REPEAT_COUNT = 10
+SLOWEST_COUNT = 10
+BUDGETS = {
+    'revolution': 0.3,
+    'revolution.main': 0.3,
+}
+"""The maximum median import times (in seconds)."""
+LAZY_MODULE_NAMES = (
+    'adafruit_gps',
+    'battlib',
+    'can',
+    'iclib',
+    'numpy',
+    'periphery',
+    'serial',
+    'websockets',
+)
+
+
+def _import(module_name: str) -> dict[str, tuple[float, float]]:
+    """Import the module in a fresh interpreter.
+
+    :return: The self and cumulative import times (in seconds) of every
+             imported module.
+    """
+    process = run(
+        (executable, '-X', 'importtime', '-c', f'import {module_name}'),
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = {}
+
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+
+        self_time, cumulative_time, name = line[12:].split('|')
+        times[name.strip()] = (
+            int(self_time) / 1e6,
+            int(cumulative_time) / 1e6,
+        )
+
+    return times
+
+
+def _benchmark(module_name: str, budget: float) -> bool:
+    cumulative_times = []
+
+    for _ in range(REPEAT_COUNT):
+        times = _import(module_name)
+
+        cumulative_times.append(times[module_name][1])
+
+    median_time = median(cumulative_times)
+    lazy_module_names = sorted(
+        name
+        for name in times
+        if name.split('.')[0] in LAZY_MODULE_NAMES
+    )
+    slowest_names = sorted(times, key=lambda name: times[name][0])
+    status = median_time <= budget and not lazy_module_names
+
+    print(
+        f'{module_name}: median={median_time * 1e3:.1f}ms'
+        f' min={min(cumulative_times) * 1e3:.1f}ms'
+        f' budget={budget * 1e3:.1f}ms'
+        f' {"OK" if status else "FAILED"}',
+    )
+
+    for name in reversed(slowest_names[-SLOWEST_COUNT:]):
+        self_time, cumulative_time = times[name]
+
+        print(
+            f'{self_time * 1e3:10.1f}ms self'
+            f' {cumulative_time * 1e3:10.1f}ms cumulative  {name}',
+        )
+
+    if lazy_module_names:
+        print(f'eagerly imported: {", ".join(lazy_module_names)}')
+
+    return status
+
+
+def main() -> None:
+    statuses = [
+        _benchmark(module_name, budget)
+        for module_name, budget in BUDGETS.items()
+    ]
+
+    if not all(statuses):
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
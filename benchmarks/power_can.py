@@ -0,0 +1,82 @@
+"""Benchmark the battery management system frames handled per second by
+``Power``.
+
+The frame mix of :mod:`benchmarks.bms_parse` is handled both one frame
+at a time, as by ``Power._handle_can``, and in batches of
+``general_batch_size`` frames, as by ``Power._handle_can_batch``. The
+contexts door is instrumented to report how long ``Power`` holds the
+power partition per acquisition.
+
+Run from the project root with ``python -m benchmarks.power_can``.
+"""
+
+from dataclasses import replace
+from logging import CRITICAL, disable
+from time import perf_counter
+from unittest.mock import MagicMock
+
+from revolution.battery_management_system import BatteryManagementSystem
+from revolution.environment import ContextsDoor, Environment
+from revolution.power import Power
+from revolution.tests import configurations
+
+from benchmarks.bms_parse import record
+
+REPEAT_COUNT = 5
+
+
+def main() -> None:
+    disable(CRITICAL)
+
+    frames = record()
+    environment = Environment(
+        ContextsDoor(replace(configurations.CONTEXTS), instrumented=True),
+        replace(
+            configurations.PERIPHERIES,
+            power_battery_management_system=BatteryManagementSystem(
+                MagicMock(),
+                0x500,
+            ),
+        ),
+        replace(configurations.SETTINGS, general_log_filepath=''),
+    )
+    power = Power(environment)
+
+    power._setup()
+
+    try:
+        for name, batch_size in (
+                ('single', 1),
+                ('batch', environment.settings.general_batch_size),
+        ):
+            environment.contexts.reset_acquisition_statistics()
+
+            start_time = perf_counter()
+
+            for _ in range(REPEAT_COUNT):
+                for i in range(0, len(frames), batch_size):
+                    power._handle_can_messages(frames[i:i + batch_size])
+
+            frame_rate = REPEAT_COUNT * len(frames) / (
+                perf_counter() - start_time
+            )
+            hold_times = next(
+                statistics.hold_times
+                for statistics in (
+                    environment.contexts.get_acquisition_statistics()
+                )
+                if '_handle_can_messages' in statistics.call_site
+            )
+
+            print(
+                f'{name:>8}: {frame_rate:9.0f} frames/s'
+                f' hold p50={hold_times.quantile(0.5) * 1e6:6.1f}us'
+                f' p99={hold_times.quantile(0.99) * 1e6:6.1f}us'
+            )
+    finally:
+        power._handle_stop()
+        power._teardown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark the per-tick cost of estimating the state of charge of
+every cell.
+
+Each tick steps the estimators of the cells of the battery with random
+cell voltages and HV current, with one
+:class:`battlib.EKFSOCEstimator` per cell as previously done and with
+:class:`revolution.soc.BatchedEKFSOCEstimator`.
+
+Run from the project root with ``python -m benchmarks.soc_step``.
+"""
+
+from json import load
+from random import Random
+from time import perf_counter
+
+from battlib import Battery, EKFSOCEstimator
+
+from revolution.battery_management_system import BATTERY_CELL_COUNT
+from revolution.soc import BatchedEKFSOCEstimator
+
+TICK_COUNT = 2000
+TIMEOUT = 0.05
+
+
+def _record() -> list[tuple[float, list[float]]]:
+    random = Random(0)
+
+    return [
+        (
+            random.uniform(-50, 50),
+            [random.uniform(3, 4.2) for _ in range(BATTERY_CELL_COUNT)],
+        )
+        for _ in range(TICK_COUNT)
+    ]
+
+
+def _estimate_previously(
+        battery: Battery,
+        ticks: list[tuple[float, list[float]]],
+) -> list[float]:
+    estimators = [EKFSOCEstimator(battery, voltage) for voltage in ticks[0][1]]
+
+    for current, voltages in ticks[1:]:
+        for estimator, voltage in zip(estimators, voltages):
+            estimator.step(dt=TIMEOUT, i_in=current, measured_v=voltage)
+
+    return [
+        estimator.soc.item()  # type: ignore[attr-defined]
+        for estimator in estimators
+    ]
+
+
+def _estimate(
+        battery: Battery,
+        ticks: list[tuple[float, list[float]]],
+) -> list[float]:
+    estimator = BatchedEKFSOCEstimator(battery, BATTERY_CELL_COUNT)
+
+    estimator.initialize(ticks[0][1])
+
+    for current, voltages in ticks[1:]:
+        estimator.step(dt=TIMEOUT, i_in=current, measured_vs=voltages)
+
+    return list(estimator.socs.tolist())
+
+
+def main() -> None:
+    with open('data/battery.json') as file:
+        battery = Battery(**load(file))
+
+    ticks = _record()
+    results = []
+
+    for name, estimate in (
+            ('previous', _estimate_previously),
+            ('batched', _estimate),
+    ):
+        start_time = perf_counter()
+        socs = estimate(battery, ticks)
+        tick_time = (perf_counter() - start_time) / len(ticks)
+
+        results.append((tick_time, socs))
+        print(f'{name:>10}: {tick_time * 1e6:8.2f}us/tick')
+
+    for previous_soc, soc in zip(results[0][1], results[1][1]):
+        assert abs(previous_soc - soc) < 1e-9
+
+    print(f'{"speedup":>10}: {results[0][0] / results[1][0]:8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark the telemetry air bytes of the binary codec.
+
+Simulated telemetry data is encoded both with the previous format, a
+``databrief`` dump followed by a separator and a hex MD5 checksum, and
+with :class:`revolution.telemetry_codec.TelemetryEncoder`. Most fields
+drift slowly and a few are noisy, as on the car. The frames are sent at
+one per ``TELEMETRY_TIMEOUT`` seconds, and the bytes per second are
+those transmitted on air (the hex encoding of ``AT+PSEND`` only exists
+on the serial link to the radio).
+
+Run from the project root with ``python -m benchmarks.telemetry_codec``.
+"""
+
+from dataclasses import fields, replace
+from hashlib import md5
+from random import Random
+from time import perf_counter
+from typing import Any
+
+from databrief import dump
+
+from revolution.telemetry import Telemetry
+from revolution.telemetry_codec import TelemetryEncoder, TelemetryLayout
+
+FRAME_COUNT = 3600
+TELEMETRY_TIMEOUT = 1.0
+KEYFRAME_INTERVAL = 10
+NOISY_NAMES = (
+    'motor_velocity',
+    'power_battery_HV_current',
+    'power_psm_battery_current',
+    'power_psm_motor_current',
+    'miscellaneous_latitude',
+    'miscellaneous_longitude',
+)
+
+
+def _simulate() -> list[Any]:
+    random = Random(0)
+    values: dict[str, Any] = {}
+
+    for field in fields(Telemetry.Data):
+        if field.type in (bool, 'bool'):
+            values[field.name] = False
+        elif field.type in (int, 'int'):
+            values[field.name] = 0
+        else:
+            values[field.name] = random.uniform(1, 10)
+
+    data = Telemetry.Data(**values)
+    simulation = []
+
+    for _ in range(FRAME_COUNT):
+        changes: dict[str, Any] = {}
+
+        for name in NOISY_NAMES:
+            changes[name] = getattr(data, name) + random.gauss(0, 0.1)
+
+        if random.random() < 0.2:
+            name = random.choice(
+                [field.name for field in fields(Telemetry.Data)],
+            )
+            value = getattr(data, name)
+
+            if isinstance(value, bool):
+                changes[name] = not value
+            elif isinstance(value, int):
+                changes[name] = value + 1
+            else:
+                changes[name] = value + random.gauss(0, 0.01)
+
+        data = replace(data, **changes)
+        simulation.append(data)
+
+    return simulation
+
+
+def _encode_previously(data: Any, timestamp: float) -> bytes:
+    data_token = dump(data, 2, 2)
+
+    return data_token + b'_' + md5(data_token).hexdigest().encode()
+
+
+def main() -> None:
+    simulation = _simulate()
+    encoder = TelemetryEncoder(
+        TelemetryLayout(Telemetry.Data),
+        KEYFRAME_INTERVAL,
+    )
+    duration = FRAME_COUNT * TELEMETRY_TIMEOUT
+    results = []
+
+    for name, encode in (
+            ('previous', _encode_previously),
+            ('codec', encoder.encode),
+    ):
+        start_time = perf_counter()
+        frames = [
+            encode(data, i * TELEMETRY_TIMEOUT)
+            for i, data in enumerate(simulation)
+        ]
+        encoding_time = (perf_counter() - start_time) / len(frames)
+        sizes = [len(frame) for frame in frames]
+        byte_rate = sum(sizes) / duration
+
+        results.append(byte_rate)
+        print(
+            f'{name:>10}: {byte_rate:7.1f}B/s'
+            f' min={min(sizes):4d}B max={max(sizes):4d}B'
+            f' encode={encoding_time * 1e6:6.1f}us',
+        )
+
+    print(f'{"reduction":>10}: {results[0] / results[1]:7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -20,18 +20,24 @@ from periphery import GPIO, I2C, PWM, SPI
 from serial import Serial
 
 from revolution import (
+    AggregateArray,
     Application,
     BATTERY_CELL_COUNT,
     BatteryFlag,
     BatteryManagementSystem,
     BATTERY_THERMISTOR_COUNT,
+    CANReader,
     Contexts,
     Debugger,
     Direction,
     Display,
     Driver,
+    Endpoint,
+    FlagArray,
+    Initializer,
     Miscellaneous,
     Motor,
+    OverflowPolicy,
     Peripheries,
     Power,
     PRBS,
@@ -41,6 +47,7 @@ from revolution import (
 )
 
 APPLICATION_TYPES: tuple[type[Application], ...] = (
+    CANReader,
     Debugger,
     Display,
     Driver,
@@ -55,6 +62,14 @@ CONTEXTS: Contexts = Contexts(
 
     general_unused_status_input=False,
 
+    # CAN Reader
+
+    can_reader_frame_count=0,
+    can_reader_frame_rate=0,
+    can_reader_frame_rates={},
+    can_reader_drop_count=0,
+    can_reader_drop_counts={},
+
     # Debugger
 
     # Display
@@ -139,10 +154,20 @@ CONTEXTS: Contexts = Contexts(
     power_array_relay_status_input=False,
     power_array_relay_status=False,
     power_battery_relay_status_input=False,
-    power_battery_cell_voltages=[0 for _ in range(BATTERY_CELL_COUNT)],
-    power_battery_thermistor_temperatures=[
-        0 for _ in range(BATTERY_THERMISTOR_COUNT)
-    ],
+    power_battery_cell_voltages=AggregateArray(
+        'd',
+        [0 for _ in range(BATTERY_CELL_COUNT)],
+    ),
+    power_battery_min_cell_voltage=0,
+    power_battery_max_cell_voltage=0,
+    power_battery_mean_cell_voltage=0,
+    power_battery_thermistor_temperatures=AggregateArray(
+        'd',
+        [0 for _ in range(BATTERY_THERMISTOR_COUNT)],
+    ),
+    power_battery_min_thermistor_temperature=0,
+    power_battery_max_thermistor_temperature=0,
+    power_battery_mean_thermistor_temperature=0,
 
     power_battery_HV_voltage=0,
     power_battery_HV_current=0,
@@ -154,17 +179,14 @@ CONTEXTS: Contexts = Contexts(
     power_battery_relay_status=False,
     power_battery_electric_safe_discharge_status=False,
     power_battery_discharge_status=False,
-    power_battery_cell_flags=[0 for _ in range(BATTERY_CELL_COUNT)],
-    power_battery_thermistor_flags=[
-        0 for _ in range(BATTERY_THERMISTOR_COUNT)
-    ],
+    power_battery_cell_flags=FlagArray(BATTERY_CELL_COUNT),
+    power_battery_thermistor_flags=FlagArray(BATTERY_THERMISTOR_COUNT),
     power_battery_current_flag=0,
+    power_battery_flags=BatteryFlag.CLEAR,
     power_battery_flags_hold=BatteryFlag.CLEAR,
 
-    power_battery_hold_cell_flags=[0 for _ in range(BATTERY_CELL_COUNT)],
-    power_battery_hold_thermistor_flags=[
-        0 for _ in range(BATTERY_THERMISTOR_COUNT)
-    ],
+    power_battery_hold_cell_flags=FlagArray(BATTERY_CELL_COUNT),
+    power_battery_hold_thermistor_flags=FlagArray(BATTERY_THERMISTOR_COUNT),
     power_battery_hold_current_flag=0,
     power_battery_hold_elapsed_count=0,
     power_battery_hold_OV_count=0,
@@ -183,7 +205,13 @@ CONTEXTS: Contexts = Contexts(
     power_battery_heartbeat_timestamp=inf,
     power_battery_heartbeat_working=False,
 
-    power_battery_state_of_charges=[0 for _ in range(BATTERY_CELL_COUNT)],
+    power_battery_state_of_charges=AggregateArray(
+        'd',
+        [0 for _ in range(BATTERY_CELL_COUNT)],
+    ),
+    power_battery_min_state_of_charge=0,
+    power_battery_max_state_of_charge=0,
+    power_battery_mean_state_of_charge=0,
 
     power_psm_motor_current=0,
     power_psm_motor_voltage=0,
@@ -193,57 +221,87 @@ CONTEXTS: Contexts = Contexts(
     power_psm_array_voltage=0,
 
     # Telemetry
+
+    telemetry_radio_submitted_count=0,
+    telemetry_radio_sent_count=0,
+    telemetry_radio_coalesced_count=0,
+    telemetry_radio_retry_count=0,
+    telemetry_radio_drop_count=0,
 )
 
+INITIALIZER: Initializer = Initializer()
+
 CAN_BUS_CHANNEL: str = 'can0'
 CAN_BUS_TXQUEUELEN: int = 1000
 CAN_BUS_BITRATE: int = 500000
 
-system(f'ip link set {CAN_BUS_CHANNEL} down')
-system(
-    (
-        f'ip link set {CAN_BUS_CHANNEL} up'
-        f' txqueuelen {CAN_BUS_TXQUEUELEN}'
-        f' type can bitrate {CAN_BUS_BITRATE}'
-    ),
-)
 
-CAN_BUS: BusABC = ThreadSafeBus(  # type: ignore[no-untyped-call]
-    channel=CAN_BUS_CHANNEL,
-    interface='socketcan',
-)
+def create_can_bus() -> BusABC:
+    system(f'ip link set {CAN_BUS_CHANNEL} down')
+    system(
+        (
+            f'ip link set {CAN_BUS_CHANNEL} up'
+            f' txqueuelen {CAN_BUS_TXQUEUELEN}'
+            f' type can bitrate {CAN_BUS_BITRATE}'
+        ),
+    )
+
+    return ThreadSafeBus(  # type: ignore[no-untyped-call]
+        channel=CAN_BUS_CHANNEL,
+        interface='socketcan',
+    )
 
-STEERING_WHEEL_SPI: SPI = SPI('/dev/spidev0.0', 0b00, 5e5)
+
+CAN_BUS: BusABC = INITIALIZER.initialize('CAN_BUS', create_can_bus)
+
+STEERING_WHEEL_SPI: SPI = INITIALIZER.initialize(
+    'STEERING_WHEEL_SPI',
+    SPI,
+    '/dev/spidev0.0',
+    0b00,
+    5e5,
+)
 STEERING_WHEEL_SPI_LOCK: Lock = Lock()
 
-STEERING_WHEEL: SteeringWheel = SteeringWheel(
-    cast(
-        SPI,
-        LockedSPI(
-            cast(
-                SPI,
-                ManualCSSPI(
-                    GPIO('/dev/gpiochip3', 5, 'out', inverted=True),
-                    STEERING_WHEEL_SPI,
+STEERING_WHEEL: SteeringWheel = INITIALIZER.initialize(
+    'STEERING_WHEEL',
+    lambda spi: SteeringWheel(
+        cast(
+            SPI,
+            LockedSPI(
+                cast(
+                    SPI,
+                    ManualCSSPI(
+                        GPIO('/dev/gpiochip3', 5, 'out', inverted=True),
+                        spi,
+                    ),
                 ),
+                STEERING_WHEEL_SPI_LOCK,
             ),
-            STEERING_WHEEL_SPI_LOCK,
         ),
+        GPIO('/dev/gpiochip3', 6, 'in'),
+        GPIO('/dev/gpiochip1', 10, 'out'),
     ),
-    GPIO('/dev/gpiochip3', 6, 'in'),
-    GPIO('/dev/gpiochip1', 10, 'out'),
+    STEERING_WHEEL_SPI,
 )
 
-PEDALS_SPI: SPI = cast(SPI, LockedSPI(SPI('/dev/spidev2.0', 0b11, 1e6)))
-PEDALS_ADC78H89: ADC78H89 = ADC78H89(
-    cast(
-        SPI,
-        ManualCSSPI(
-            GPIO('/dev/gpiochip3', 10, 'out', inverted=True),
-            PEDALS_SPI,
+PEDALS_SPI: SPI = INITIALIZER.initialize(
+    'PEDALS_SPI',
+    lambda: cast(SPI, LockedSPI(SPI('/dev/spidev2.0', 0b11, 1e6))),
+)
+PEDALS_ADC78H89: ADC78H89 = INITIALIZER.initialize(
+    'PEDALS_ADC78H89',
+    lambda spi: ADC78H89(
+        cast(
+            SPI,
+            ManualCSSPI(
+                GPIO('/dev/gpiochip3', 10, 'out', inverted=True),
+                spi,
+            ),
         ),
+        3.3,
     ),
-    3.3,
+    PEDALS_SPI,
 )
 
 UNUSED_SWITCH_PRBS: PRBS = 2, 0
@@ -254,7 +312,13 @@ HAZARD_LIGHTS_SWITCH_PRBS: PRBS = 2, 0
 DAYTIME_RUNNING_LIGHTS_SWITCH_PRBS: PRBS = 0, 4
 HORN_SWITCH_PRBS: PRBS = 0, 3
 BACKUP_CAMERA_CONTROL_SWITCH_PRBS: PRBS = 2, 0
-BRAKE_SWITCH_GPIO: GPIO = GPIO('/dev/gpiochip6', 20, 'in')
+BRAKE_SWITCH_GPIO: GPIO = INITIALIZER.initialize(
+    'BRAKE_SWITCH_GPIO',
+    GPIO,
+    '/dev/gpiochip6',
+    20,
+    'in',
+)
 
 CRUISE_CONTROL_ROTARY_ENCODER_A_PRBS: PRBS = 2, 0
 CRUISE_CONTROL_ROTARY_ENCODER_B_PRBS: PRBS = 2, 0
@@ -268,75 +332,189 @@ ACCELERATION_INPUT_INPUT_CHANNEL: InputChannel = InputChannel.AIN2
 ARRAY_RELAY_SWITCH_PRBS: PRBS = 0, 7
 BATTERY_RELAY_SWITCH_PRBS: PRBS = 0, 6
 
-LEFT_INDICATOR_LIGHT_PWM: PWM = PWM(3, 0)
-LEFT_INDICATOR_LIGHT_PWM.period = 0.001
-LEFT_INDICATOR_LIGHT_PWM.duty_cycle = 0.10
 
-RIGHT_INDICATOR_LIGHT_PWM: PWM = PWM(0, 0)
-RIGHT_INDICATOR_LIGHT_PWM.period = 0.001
-RIGHT_INDICATOR_LIGHT_PWM.duty_cycle = 0.10
+def create_light_pwm(chip: int, channel: int) -> PWM:
+    pwm = PWM(chip, channel)
+    pwm.period = 0.001
+    pwm.duty_cycle = 0.10
+
+    return pwm
 
-DAYTIME_RUNNING_LIGHTS_PWM: PWM = PWM(2, 0)
-DAYTIME_RUNNING_LIGHTS_PWM.period = 0.001
-DAYTIME_RUNNING_LIGHTS_PWM.duty_cycle = 0.10
 
-BRAKE_LIGHTS_PWM: PWM = PWM(1, 0)
-BRAKE_LIGHTS_PWM.period = 0.001
-BRAKE_LIGHTS_PWM.duty_cycle = 0.10
+LEFT_INDICATOR_LIGHT_PWM: PWM = INITIALIZER.initialize(
+    'LEFT_INDICATOR_LIGHT_PWM',
+    create_light_pwm,
+    3,
+    0,
+)
+RIGHT_INDICATOR_LIGHT_PWM: PWM = INITIALIZER.initialize(
+    'RIGHT_INDICATOR_LIGHT_PWM',
+    create_light_pwm,
+    0,
+    0,
+)
+DAYTIME_RUNNING_LIGHTS_PWM: PWM = INITIALIZER.initialize(
+    'DAYTIME_RUNNING_LIGHTS_PWM',
+    create_light_pwm,
+    2,
+    0,
+)
+BRAKE_LIGHTS_PWM: PWM = INITIALIZER.initialize(
+    'BRAKE_LIGHTS_PWM',
+    create_light_pwm,
+    1,
+    0,
+)
 
-BACKUP_CAMERA_CONTROL_SWITCH_GPIO: GPIO = GPIO('/dev/gpiochip6', 21, 'out')
+BACKUP_CAMERA_CONTROL_SWITCH_GPIO: GPIO = INITIALIZER.initialize(
+    'BACKUP_CAMERA_CONTROL_SWITCH_GPIO',
+    GPIO,
+    '/dev/gpiochip6',
+    21,
+    'out',
+)
 
-GPS_SERIAL: Serial = Serial("/dev/ttyLP3", baudrate=9600, timeout=10)
-GPS_PA1616S: GPS = GPS(GPS_SERIAL, debug=False)
+GPS_SERIAL: Serial = INITIALIZER.initialize(
+    'GPS_SERIAL',
+    Serial,
+    '/dev/ttyLP3',
+    baudrate=9600,
+    timeout=10,
+)
+GPS_PA1616S: GPS = INITIALIZER.initialize(
+    'GPS_PA1616S',
+    GPS,
+    GPS_SERIAL,
+    debug=False,
+)
 
-IMU_BNO055_I2C: I2C = I2C('/dev/apalis-i2c3')
+IMU_BNO055_I2C: I2C = INITIALIZER.initialize(
+    'IMU_BNO055_I2C',
+    I2C,
+    '/dev/apalis-i2c3',
+)
 IMU_BNO055_IMU_RESET_GPIO: GPIO = MagicMock(direction='out', inverted=True,)
 IMU_BNO055_SA0: bool = False
-IMU_BNO055: BNO055 = BNO055(
+IMU_BNO055: BNO055 = INITIALIZER.initialize(
+    'IMU_BNO055',
+    BNO055,
     IMU_BNO055_I2C,
     IMU_BNO055_IMU_RESET_GPIO,
-    IMU_BNO055_SA0
+    IMU_BNO055_SA0,
 )
 
 FRONT_WHEELS_I2C_LOCK: Lock = Lock()
-FRONT_WHEELS_I2C: I2C = cast(
-    I2C, LockedI2C(I2C('/dev/apalis-i2c1'), FRONT_WHEELS_I2C_LOCK)
+FRONT_WHEELS_I2C: I2C = INITIALIZER.initialize(
+    'FRONT_WHEELS_I2C',
+    lambda: cast(
+        I2C,
+        LockedI2C(I2C('/dev/apalis-i2c1'), FRONT_WHEELS_I2C_LOCK),
+    ),
 )
 
-FRONT_WHEELS_I2C_MUX: PCA9546A = PCA9546A(0x70, FRONT_WHEELS_I2C)
+FRONT_WHEELS_I2C_MUX: PCA9546A = INITIALIZER.initialize(
+    'FRONT_WHEELS_I2C_MUX',
+    PCA9546A,
+    0x70,
+    FRONT_WHEELS_I2C,
+)
 
 LEFT_WHEEL_ACCELEROMETER_SA0 = True
-LEFT_WHEEL_ACCELEROMETER: LIS2HH12 = LIS2HH12(
-    FRONT_WHEELS_I2C, LEFT_WHEEL_ACCELEROMETER_SA0
+LEFT_WHEEL_ACCELEROMETER: LIS2HH12 = INITIALIZER.initialize(
+    'LEFT_WHEEL_ACCELEROMETER',
+    LIS2HH12,
+    FRONT_WHEELS_I2C,
+    LEFT_WHEEL_ACCELEROMETER_SA0,
 )
 RIGHT_WHEEL_ACCELEROMETER_SA0 = False
-RIGHT_WHEEL_ACCELEROMETER: LIS2HH12 = LIS2HH12(
-    FRONT_WHEELS_I2C, RIGHT_WHEEL_ACCELEROMETER_SA0
+RIGHT_WHEEL_ACCELEROMETER: LIS2HH12 = INITIALIZER.initialize(
+    'RIGHT_WHEEL_ACCELEROMETER',
+    LIS2HH12,
+    FRONT_WHEELS_I2C,
+    RIGHT_WHEEL_ACCELEROMETER_SA0,
 )
 
-ARRAY_RELAY_LOW_SIDE_GPIO: GPIO = GPIO('/dev/gpiochip4', 1, 'out')
-ARRAY_RELAY_HIGH_SIDE_GPIO: GPIO = GPIO('/dev/gpiochip0', 13, 'out')
-ARRAY_RELAY_PRE_CHARGE_GPIO: GPIO = GPIO('/dev/gpiochip4', 2, 'out')
-POWER_POINT_TRACKING_SWITCH_1_GPIO: GPIO = GPIO('/dev/gpiochip3', 26, 'out')
-POWER_POINT_TRACKING_SWITCH_2_GPIO: GPIO = GPIO('/dev/gpiochip3', 28, 'out')
+ARRAY_RELAY_LOW_SIDE_GPIO: GPIO = INITIALIZER.initialize(
+    'ARRAY_RELAY_LOW_SIDE_GPIO',
+    GPIO,
+    '/dev/gpiochip4',
+    1,
+    'out',
+)
+ARRAY_RELAY_HIGH_SIDE_GPIO: GPIO = INITIALIZER.initialize(
+    'ARRAY_RELAY_HIGH_SIDE_GPIO',
+    GPIO,
+    '/dev/gpiochip0',
+    13,
+    'out',
+)
+ARRAY_RELAY_PRE_CHARGE_GPIO: GPIO = INITIALIZER.initialize(
+    'ARRAY_RELAY_PRE_CHARGE_GPIO',
+    GPIO,
+    '/dev/gpiochip4',
+    2,
+    'out',
+)
+POWER_POINT_TRACKING_SWITCH_1_GPIO: GPIO = INITIALIZER.initialize(
+    'POWER_POINT_TRACKING_SWITCH_1_GPIO',
+    GPIO,
+    '/dev/gpiochip3',
+    26,
+    'out',
+)
+POWER_POINT_TRACKING_SWITCH_2_GPIO: GPIO = INITIALIZER.initialize(
+    'POWER_POINT_TRACKING_SWITCH_2_GPIO',
+    GPIO,
+    '/dev/gpiochip3',
+    28,
+    'out',
+)
 
-VARIABLE_FIELD_MAGNET_DIRECTION_GPIO: GPIO = GPIO('/dev/gpiochip0', 8, 'out')
-VARIABLE_FIELD_MAGNET_STALL_GPIO: GPIO = GPIO('/dev/gpiochip0', 1, 'in')
-VARIABLE_FIELD_MAGNET_ENCODER_A_GPIO: GPIO = GPIO(
+VARIABLE_FIELD_MAGNET_DIRECTION_GPIO: GPIO = INITIALIZER.initialize(
+    'VARIABLE_FIELD_MAGNET_DIRECTION_GPIO',
+    GPIO,
+    '/dev/gpiochip0',
+    8,
+    'out',
+)
+VARIABLE_FIELD_MAGNET_STALL_GPIO: GPIO = INITIALIZER.initialize(
+    'VARIABLE_FIELD_MAGNET_STALL_GPIO',
+    GPIO,
+    '/dev/gpiochip0',
+    1,
+    'in',
+)
+VARIABLE_FIELD_MAGNET_ENCODER_A_GPIO: GPIO = INITIALIZER.initialize(
+    'VARIABLE_FIELD_MAGNET_ENCODER_A_GPIO',
+    GPIO,
     '/dev/gpiochip0',
     0,
     'in',
     edge='rising',
 )
-VARIABLE_FIELD_MAGNET_ENCODER_B_GPIO: GPIO = GPIO(
+VARIABLE_FIELD_MAGNET_ENCODER_B_GPIO: GPIO = INITIALIZER.initialize(
+    'VARIABLE_FIELD_MAGNET_ENCODER_B_GPIO',
+    GPIO,
     '/dev/gpiochip1',
     12,
     'in',
     edge='rising',
 )
-VARIABLE_FIELD_MAGNET_ENABLE_GPIO: GPIO = GPIO('/dev/gpiochip1', 13, 'out')
+VARIABLE_FIELD_MAGNET_ENABLE_GPIO: GPIO = INITIALIZER.initialize(
+    'VARIABLE_FIELD_MAGNET_ENABLE_GPIO',
+    GPIO,
+    '/dev/gpiochip1',
+    13,
+    'out',
+)
 
-RADIO_SERIAL: Serial = Serial('/dev/ttyLP2', 9600, timeout=1)
+RADIO_SERIAL: Serial = INITIALIZER.initialize(
+    'RADIO_SERIAL',
+    Serial,
+    '/dev/ttyLP2',
+    9600,
+    timeout=1,
+)
 
 if CAN_BUS_BITRATE not in WaveSculptor22.CAN_BUS_BITRATES:
     raise ValueError('invalid can bus bitrate')
@@ -344,7 +522,9 @@ if CAN_BUS_BITRATE not in WaveSculptor22.CAN_BUS_BITRATES:
 WAVESCULPTOR22_REVOLUTION_BASE_ADDRESS: int = 0x500
 WAVESCULPTOR22_BASE_ADDRESS: int = 0x600
 
-WAVESCULPTOR22: WaveSculptor22 = WaveSculptor22(
+WAVESCULPTOR22: WaveSculptor22 = INITIALIZER.initialize(
+    'WAVESCULPTOR22',
+    WaveSculptor22,
     CAN_BUS,
     WAVESCULPTOR22_REVOLUTION_BASE_ADDRESS,
     WAVESCULPTOR22_BASE_ADDRESS,
@@ -352,58 +532,69 @@ WAVESCULPTOR22: WaveSculptor22 = WaveSculptor22(
 
 BATTERY_MANAGEMENT_SYSTEM_REVOLUTION_BASE_ADDRESS: int = 0x300
 
-BATTERY_MANAGEMENT_SYSTEM: BatteryManagementSystem = BatteryManagementSystem(
+BATTERY_MANAGEMENT_SYSTEM: BatteryManagementSystem = INITIALIZER.initialize(
+    'BATTERY_MANAGEMENT_SYSTEM',
+    BatteryManagementSystem,
     CAN_BUS,
     BATTERY_MANAGEMENT_SYSTEM_REVOLUTION_BASE_ADDRESS,
 )
 
-PSM_SPI: SPI = SPI('/dev/spidev1.0', 1, 1e6)
-PSM_MOTOR_INA229: INA229 = INA229(
-    MagicMock(),
-    cast(
-        SPI,
-        ManualCSSPI(
-            GPIO('/dev/gpiochip5', 19, 'out', inverted=True),
-            PSM_SPI,
+PSM_SPI: SPI = INITIALIZER.initialize(
+    'PSM_SPI',
+    SPI,
+    '/dev/spidev1.0',
+    1,
+    1e6,
+)
+
+
+def create_psm_ina229(
+        spi: SPI,
+        chip: str,
+        line: int,
+        shunt_resistance: float,
+) -> INA229:
+    return INA229(
+        MagicMock(),
+        cast(
+            SPI,
+            ManualCSSPI(GPIO(chip, line, 'out', inverted=True), spi),
         ),
-    ),
-    60,
+        60,
+        shunt_resistance,
+    )
+
+
+PSM_MOTOR_INA229: INA229 = INITIALIZER.initialize(
+    'PSM_MOTOR_INA229',
+    create_psm_ina229,
+    PSM_SPI,
+    '/dev/gpiochip5',
+    19,
     0.0002,
 )
-PSM_BATTERY_INA229: INA229 = INA229(
-    MagicMock(),
-    cast(
-        SPI,
-        ManualCSSPI(
-            GPIO('/dev/gpiochip5', 21, 'out', inverted=True),
-            PSM_SPI,
-        ),
-    ),
-    60,
+PSM_BATTERY_INA229: INA229 = INITIALIZER.initialize(
+    'PSM_BATTERY_INA229',
+    create_psm_ina229,
+    PSM_SPI,
+    '/dev/gpiochip5',
+    21,
     0.002,
 )
-PSM_ARRAY_INA229: INA229 = INA229(
-    MagicMock(),
-    cast(
-        SPI,
-        ManualCSSPI(
-            GPIO('/dev/gpiochip5', 20, 'out', inverted=True),
-            PSM_SPI,
-        ),
-    ),
-    60,
+PSM_ARRAY_INA229: INA229 = INITIALIZER.initialize(
+    'PSM_ARRAY_INA229',
+    create_psm_ina229,
+    PSM_SPI,
+    '/dev/gpiochip5',
+    20,
     0.002,
 )
-PSM_INA229: INA229 = INA229(
-    MagicMock(),
-    cast(
-        SPI,
-        ManualCSSPI(
-            GPIO('/dev/gpiochip4', 26, 'out', inverted=True),
-            PSM_SPI,
-        ),
-    ),
-    60,
+PSM_INA229: INA229 = INITIALIZER.initialize(
+    'PSM_INA229',
+    create_psm_ina229,
+    PSM_SPI,
+    '/dev/gpiochip4',
+    26,
     0.002,
 )
 
@@ -412,6 +603,8 @@ PERIPHERIES: Peripheries = Peripheries(
 
     general_can_bus=CAN_BUS,
 
+    # CAN Reader
+
     # Debugger
 
     # Display
@@ -517,6 +710,34 @@ SETTINGS: Settings = Settings(
 
     general_wheel_diameter=0.557,
     general_log_filepath='/usr/share/revolution_logs/',
+    general_queue_capacities={endpoint: 1000 for endpoint in Endpoint},
+    general_queue_overflow_policies={
+        Endpoint.CAN_READER: OverflowPolicy.DROP_OLDEST,
+        Endpoint.DEBUGGER: OverflowPolicy.DROP_OLDEST,
+        Endpoint.DISPLAY: OverflowPolicy.DROP_OLDEST,
+        Endpoint.DRIVER: OverflowPolicy.DROP_OLDEST,
+        Endpoint.MISCELLANEOUS: OverflowPolicy.DROP_OLDEST,
+        Endpoint.MOTOR: OverflowPolicy.COALESCE,
+        Endpoint.POWER: OverflowPolicy.COALESCE,
+        Endpoint.TELEMETRY: OverflowPolicy.DROP_OLDEST,
+    },
+    general_process_queue_capacity=1000,
+    general_process_queue_overflow_policy=OverflowPolicy.COALESCE,
+    general_batch_size=64,
+    general_batch_timeout=0,
+    general_subscription_timeout=1,
+    general_scheduler_thread_count=2,
+    general_scheduler_sample_count=1000,
+    general_worker_restart_initial_delay=0.1,
+    general_worker_restart_maximum_delay=10,
+    general_worker_restart_jitter=0.5,
+    general_worker_restart_maximum_count=10,
+    general_worker_restart_window=60,
+
+    # CAN Reader
+
+    can_reader_timeout=0.1,
+    can_reader_statistics_timeout=1,
 
     # Debugger
 
@@ -536,12 +757,12 @@ SETTINGS: Settings = Settings(
 
     # Miscellaneous
 
-    miscellaneous_light_timeout=0.05,
     miscellaneous_light_flash_timeout=0.5,
     miscellaneous_imu_timeout=0.1,
     miscellaneous_imu_mode_timeout=0.05,
     miscellaneous_gps_timeout=1,
     miscellaneous_front_wheels_timeout=0.02,
+    miscellaneous_timing_log_timeout=1,
 
     # Motor
 
@@ -565,12 +786,17 @@ SETTINGS: Settings = Settings(
     power_array_relay_timeout=2.5,
     power_point_tracking_timeout=1.0,
     power_soc_timeout=0.05,
+    power_soc_checkpoint_timeout=10,
     power_psm_timeout=0.1,
     power_steering_wheel_led_timeout=0.5,
     power_log_timeout=0.1,
 
     power_battery=BATTERY,
     power_battery_can_timeout=5.0,
+    power_soc_checkpoint_filepath=(
+        '/usr/share/revolution_logs/soc_checkpoint.bin'
+    ),
+    power_soc_checkpoint_maximum_age=600,
     power_disable_charging_battery_soc_threshold=0.98,
     power_psm_motor_ina229_voltage_correction_factor=12.9,
     power_psm_battery_ina229_voltage_correction_factor=12.9,
@@ -580,12 +806,17 @@ SETTINGS: Settings = Settings(
 
     telemetry_timeout=1,
     telemetry_begin_token=b'',
-    telemetry_separator_token=b'_',
     telemetry_end_token=b'',
+    telemetry_keyframe_interval=10,
     telemetry_radio_frequency=915000000,
     telemetry_radio_spreading_factor=7,
     telemetry_radio_bandwidth=0,
     telemetry_radio_code_rate=0,
     telemetry_radio_preamble_length=200,
     telemetry_radio_tx_power=14,
+    telemetry_radio_maximum_payload_size=255,
+    telemetry_radio_response_timeout=1,
+    telemetry_radio_transmission_timeout=2,
+    telemetry_radio_maximum_retry_count=3,
+    telemetry_radio_retry_delay=0.1,
 )
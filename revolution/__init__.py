@@ -1,12 +1,16 @@
 __all__ = (
+    'AggregateArray',
     'Application',
+    'BatchedEKFSOCEstimator',
     'BATTERY_CELL_COUNT',
     'BatteryFlag',
     'BatteryManagementSystem',
     'BatteryPackFlagsInformation',
     'BATTERY_THERMISTOR_COUNT',
+    'CANReader',
     'CellVoltagesInformation',
     'Contexts',
+    'ContextsDoor',
     'Debugger',
     'Direction',
     'Display',
@@ -14,77 +18,281 @@ __all__ = (
     'Driver',
     'Endpoint',
     'Environment',
+    'FlagArray',
+    'FrameType',
     'Header',
     'Information',
+    'Initialization',
+    'InitializationStatistics',
+    'Initializer',
     'LVInformation',
     'main',
     'Message',
+    'MessageQueue',
     'Miscellaneous',
     'Motor',
     'OverBatteryFlagsHoldInformation',
     'OverBatteryFlagsInformation',
     'OvercurrentHoldInformation',
+    'OverflowPolicy',
     'OvertemperatureHoldInformation',
     'OvervoltageHoldInformation',
     'parse_args',
     'PartialInformation',
+    'Partition',
+    'PeriodicTask',
     'Peripheries',
     'Power',
     'PRBS',
+    'Quantization',
+    'QueueStatistics',
+    'RadioStatistics',
+    'RadioTransmitter',
+    'RestartPolicy',
+    'Scheduler',
     'Settings',
+    'SharedPartition',
     'StatusesAndHVInformation',
     'SteeringWheel',
+    'TaskStatistics',
     'Telemetry',
+    'telemetry_field',
+    'TelemetryDecoder',
+    'TelemetryEncoder',
+    'TelemetryLayout',
+    'TelemetrySchedule',
     'ThermistorTemperaturesInformation',
+    'TimingSummary',
     'UnderBatteryFlagsHoldInformation',
     'UnderBatteryFlagsInformation',
     'UndercurrentHoldInformation',
     'UndertemperatureHoldInformation',
     'UndervoltageHoldInformation',
     'Worker',
+    'WorkerStatistics',
 )
 
-from revolution.application import Application
-from revolution.battery_management_system import (
-    BATTERY_CELL_COUNT,
-    BatteryFlag,
-    BatteryManagementSystem,
-    BatteryPackFlagsInformation,
-    BATTERY_THERMISTOR_COUNT,
-    CellVoltagesInformation,
-    Information,
-    LVInformation,
-    OverBatteryFlagsHoldInformation,
-    OverBatteryFlagsInformation,
-    OvercurrentHoldInformation,
-    OvertemperatureHoldInformation,
-    OvervoltageHoldInformation,
-    PartialInformation,
-    StatusesAndHVInformation,
-    ThermistorTemperaturesInformation,
-    UnderBatteryFlagsHoldInformation,
-    UnderBatteryFlagsInformation,
-    UndercurrentHoldInformation,
-    UndertemperatureHoldInformation,
-    UndervoltageHoldInformation,
-)
-from revolution.debugger import Debugger
-from revolution.display import Display
-from revolution.driver import Driver
-from revolution.environment import (
-    Contexts,
-    Endpoint,
-    Environment,
-    Header,
-    Message,
-    Peripheries,
-    Settings,
-)
+from importlib import import_module
+from typing import Any, TYPE_CHECKING
+
+# ``main`` is imported eagerly since it shares its name with the
+# ``revolution.main`` module, which would otherwise shadow it.
 from revolution.main import main, parse_args
-from revolution.miscellaneous import Miscellaneous
-from revolution.motor import Motor
-from revolution.power import Power
-from revolution.steering_wheel import DisplayItem, SteeringWheel
-from revolution.telemetry import Telemetry
-from revolution.utilities import Direction, PRBS
-from revolution.worker import Worker
+
+_EXPORTS = {
+    'revolution.application': (
+        'Application',
+    ),
+    'revolution.battery_management_system': (
+        'BATTERY_CELL_COUNT',
+        'BatteryFlag',
+        'BatteryManagementSystem',
+        'BatteryPackFlagsInformation',
+        'BATTERY_THERMISTOR_COUNT',
+        'CellVoltagesInformation',
+        'Information',
+        'LVInformation',
+        'OverBatteryFlagsHoldInformation',
+        'OverBatteryFlagsInformation',
+        'OvercurrentHoldInformation',
+        'OvertemperatureHoldInformation',
+        'OvervoltageHoldInformation',
+        'PartialInformation',
+        'StatusesAndHVInformation',
+        'ThermistorTemperaturesInformation',
+        'UnderBatteryFlagsHoldInformation',
+        'UnderBatteryFlagsInformation',
+        'UndercurrentHoldInformation',
+        'UndertemperatureHoldInformation',
+        'UndervoltageHoldInformation',
+    ),
+    'revolution.can_reader': (
+        'CANReader',
+    ),
+    'revolution.debugger': (
+        'Debugger',
+    ),
+    'revolution.display': (
+        'Display',
+    ),
+    'revolution.driver': (
+        'Driver',
+    ),
+    'revolution.environment': (
+        'Contexts',
+        'ContextsDoor',
+        'Endpoint',
+        'Environment',
+        'Header',
+        'Message',
+        'MessageQueue',
+        'OverflowPolicy',
+        'Partition',
+        'Peripheries',
+        'QueueStatistics',
+        'Settings',
+        'SharedPartition',
+    ),
+    'revolution.initializer': (
+        'Initialization',
+        'InitializationStatistics',
+        'Initializer',
+    ),
+    'revolution.miscellaneous': (
+        'Miscellaneous',
+    ),
+    'revolution.motor': (
+        'Motor',
+    ),
+    'revolution.power': (
+        'Power',
+    ),
+    'revolution.radio': (
+        'RadioStatistics',
+        'RadioTransmitter',
+    ),
+    'revolution.scheduler': (
+        'PeriodicTask',
+        'Scheduler',
+        'TaskStatistics',
+        'TimingSummary',
+    ),
+    'revolution.soc': (
+        'BatchedEKFSOCEstimator',
+    ),
+    'revolution.steering_wheel': (
+        'DisplayItem',
+        'SteeringWheel',
+    ),
+    'revolution.telemetry': (
+        'Telemetry',
+    ),
+    'revolution.telemetry_codec': (
+        'FrameType',
+        'Quantization',
+        'telemetry_field',
+        'TelemetryDecoder',
+        'TelemetryEncoder',
+        'TelemetryLayout',
+        'TelemetrySchedule',
+    ),
+    'revolution.utilities': (
+        'AggregateArray',
+        'Direction',
+        'FlagArray',
+        'PRBS',
+    ),
+    'revolution.worker': (
+        'RestartPolicy',
+        'Worker',
+        'WorkerStatistics',
+    ),
+}
+_MODULE_NAMES = {
+    name: module_name
+    for module_name, names in _EXPORTS.items()
+    for name in names
+}
+
+if TYPE_CHECKING:
+    from revolution.application import Application
+    from revolution.battery_management_system import (
+        BATTERY_CELL_COUNT,
+        BatteryFlag,
+        BatteryManagementSystem,
+        BatteryPackFlagsInformation,
+        BATTERY_THERMISTOR_COUNT,
+        CellVoltagesInformation,
+        Information,
+        LVInformation,
+        OverBatteryFlagsHoldInformation,
+        OverBatteryFlagsInformation,
+        OvercurrentHoldInformation,
+        OvertemperatureHoldInformation,
+        OvervoltageHoldInformation,
+        PartialInformation,
+        StatusesAndHVInformation,
+        ThermistorTemperaturesInformation,
+        UnderBatteryFlagsHoldInformation,
+        UnderBatteryFlagsInformation,
+        UndercurrentHoldInformation,
+        UndertemperatureHoldInformation,
+        UndervoltageHoldInformation,
+    )
+    from revolution.can_reader import CANReader
+    from revolution.debugger import Debugger
+    from revolution.display import Display
+    from revolution.driver import Driver
+    from revolution.environment import (
+        Contexts,
+        ContextsDoor,
+        Endpoint,
+        Environment,
+        Header,
+        Message,
+        MessageQueue,
+        OverflowPolicy,
+        Partition,
+        Peripheries,
+        QueueStatistics,
+        Settings,
+        SharedPartition,
+    )
+    from revolution.initializer import (
+        Initialization,
+        InitializationStatistics,
+        Initializer,
+    )
+    from revolution.miscellaneous import Miscellaneous
+    from revolution.motor import Motor
+    from revolution.power import Power
+    from revolution.radio import RadioStatistics, RadioTransmitter
+    from revolution.scheduler import (
+        PeriodicTask,
+        Scheduler,
+        TaskStatistics,
+        TimingSummary,
+    )
+    from revolution.soc import BatchedEKFSOCEstimator
+    from revolution.steering_wheel import DisplayItem, SteeringWheel
+    from revolution.telemetry import Telemetry
+    from revolution.telemetry_codec import (
+        FrameType,
+        Quantization,
+        telemetry_field,
+        TelemetryDecoder,
+        TelemetryEncoder,
+        TelemetryLayout,
+        TelemetrySchedule,
+    )
+    from revolution.utilities import (
+        AggregateArray,
+        Direction,
+        FlagArray,
+        PRBS,
+    )
+    from revolution.worker import RestartPolicy, Worker, WorkerStatistics
+
+
+def __getattr__(name: str) -> Any:
+    """Import the exported names on first access.
+
+    The applications, hardware drivers and numerical libraries are only
+    imported once they are needed, which shortens the startup.
+
+    :return: The exported object.
+    :raise AttributeError: If the name is not exported.
+    """
+    if name not in _MODULE_NAMES:
+        raise AttributeError(
+            f'module {repr(__name__)} has no attribute {repr(name)}',
+        )
+
+    value = getattr(import_module(_MODULE_NAMES[name]), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
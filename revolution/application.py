@@ -1,13 +1,22 @@
 from abc import ABC
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
+from itertools import groupby
 from logging import getLogger
+from operator import attrgetter
 from threading import Event
-from typing import Any, ClassVar
+from typing import Any, ClassVar, TYPE_CHECKING
 
-from can import Message
+from revolution.environment import (
+    ContextsSubscription,
+    Endpoint,
+    Environment,
+    Header,
+    Message,
+)
 
-from revolution.environment import Endpoint, Environment, Header
+if TYPE_CHECKING:
+    from can import Message as CANMessage
 
 _logger = getLogger(__name__)
 
@@ -26,7 +35,15 @@ class Application(ABC):
         default_factory=dict,
         init=False,
     )
+    _batch_handlers: dict[Header, Callable[[list[Message]], Any]] = field(
+        default_factory=dict,
+        init=False,
+    )
     _stoppage: Event = field(default_factory=Event, init=False)
+    _subscriptions: list[ContextsSubscription] = field(
+        default_factory=list,
+        init=False,
+    )
 
     def mainloop(self) -> None:
         self._setup()
@@ -36,27 +53,77 @@ class Application(ABC):
     def _setup(self) -> None:
         self._handlers[Header.STOP] = self._handle_stop
         self._handlers[Header.CAN] = self._handle_can
+        self._batch_handlers[Header.CAN] = self._handle_can_batch
 
         self._stoppage.clear()
+        self.environment.subscribe_can(
+            self.endpoint,
+            self._get_can_arbitration_ids(),
+        )
 
     def _run(self) -> None:
         while not self._stoppage.is_set():
-            message = self.environment.receive(self.endpoint)
-            handler = self._handlers.get(message.header)
+            messages = self.environment.receive_batch(
+                self.endpoint,
+                self.environment.settings.general_batch_size,
+                batch_timeout=self.environment.settings.general_batch_timeout,
+            )
+
+            for header, group in groupby(messages, attrgetter('header')):
+                batch_handler = self._batch_handlers.get(header)
+
+                if batch_handler is not None:
+                    try:
+                        batch_handler(list(group))
+                    except:  # noqa: E722
+                        _logger.exception(
+                            'Exception raised during batch handler call',
+                        )
+
+                    continue
+
+                for message in group:
+                    self._handle(message)
 
-            if handler is None:
-                _logger.error(f'Unable to handle message {repr(message)}')
-            else:
-                try:
-                    handler(*message.args, **message.kwargs)
-                except:  # noqa: E722
-                    _logger.exception('Exception raised during handler call')
+    def _handle(self, message: Message) -> None:
+        handler = self._handlers.get(message.header)
+
+        if handler is None:
+            _logger.error(f'Unable to handle message {repr(message)}')
+        else:
+            try:
+                handler(*message.args, **message.kwargs)
+            except:  # noqa: E722
+                _logger.exception('Exception raised during handler call')
 
     def _teardown(self) -> None:
         pass
 
+    def _get_can_arbitration_ids(self) -> Iterable[int]:
+        return ()
+
+    def _subscribe(self, *names: str) -> ContextsSubscription:
+        """Subscribe to changes of the fields of the contexts, with the
+        waits woken once the application is stopped.
+
+        :return: The subscription.
+        """
+        subscription = self.environment.contexts.subscribe(*names)
+
+        self._subscriptions.append(subscription)
+
+        return subscription
+
     def _handle_stop(self) -> None:
+        self.environment.unsubscribe_can(self.endpoint)
         self._stoppage.set()
 
-    def _handle_can(self, message: Message) -> None:
+        for subscription in self._subscriptions:
+            subscription.wake()
+
+    def _handle_can(self, message: 'CANMessage') -> None:
         pass
+
+    def _handle_can_batch(self, messages: list[Message]) -> None:
+        for message in messages:
+            self._handle(message)
@@ -2,15 +2,17 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import IntFlag
 from logging import getLogger
-from struct import pack, unpack
-from typing import ClassVar
+from struct import pack, Struct
+from typing import ClassVar, TYPE_CHECKING
 
-from can import BusABC, Message
+if TYPE_CHECKING:
+    from can import BusABC, Message
 
 BATTERY_CELL_COUNT: int = 36
 BATTERY_CELL_PER_PACK_COUNT: int = 6
 BATTERY_THERMISTOR_COUNT: int = 18
 BATTERY_THERMISTOR_PER_PACK_COUNT: int = 3
+_MESSAGE_IDENTIFIER_MASK: int = (1 << 5) - 1
 _logger = getLogger(__name__)
 
 
@@ -64,36 +66,21 @@ class BatteryPackFlagsInformation(Information, ABC):
     flags: int
 
     @property
-    def cell_flags(self) -> dict[int, BatteryFlag]:
-        flags = {}
-
-        for i in range(BATTERY_CELL_COUNT):
-            if self.flags & (1 << i):
-                flag = self.CELL_FLAG
-            else:
-                flag = BatteryFlag(0)
-
-            flags[i] = flag
-
-        return flags
+    def cell_flag_mask(self) -> int:
+        """The bitmask of the cells with the cell flag."""
+        return self.flags & ((1 << BATTERY_CELL_COUNT) - 1)
 
     @property
-    def thermistor_flags(self) -> dict[int, BatteryFlag]:
-        flags = {}
-
-        for i in range(BATTERY_THERMISTOR_COUNT):
-            if self.flags & (1 << (i + 36)):
-                flag = self.THERMISTOR_FLAG
-            else:
-                flag = BatteryFlag(0)
-
-            flags[i] = flag
-
-        return flags
+    def thermistor_flag_mask(self) -> int:
+        """The bitmask of the thermistors with the thermistor flag."""
+        return (
+            (self.flags >> BATTERY_CELL_COUNT)
+            & ((1 << BATTERY_THERMISTOR_COUNT) - 1)
+        )
 
     @property
     def current_flag(self) -> BatteryFlag:
-        if self.flags & (1 << 54):
+        if self.flags & (1 << (BATTERY_CELL_COUNT + BATTERY_THERMISTOR_COUNT)):
             flag = self.CURRENT_FLAG
         else:
             flag = BatteryFlag(0)
@@ -255,10 +242,26 @@ class ThermistorTemperaturesInformation(PartialInformation):
         return (4 * i, 4 * i + 1, 4 * i + 2, 4 * i + 3)
 
 
+def _create_information_table(
+        types: tuple[type[Information], ...],
+) -> tuple[tuple[type[Information], Struct] | None, ...]:
+    table: list[tuple[type[Information], Struct] | None] = [
+        None,
+    ] * (_MESSAGE_IDENTIFIER_MASK + 1)
+
+    for type_ in types:
+        struct = Struct(type_.FORMAT)
+
+        for message_identifier in type_.MESSAGE_IDENTIFIERS:
+            table[message_identifier] = type_, struct
+
+    return tuple(table)
+
+
 @dataclass
 class BatteryManagementSystem:
     BASE_ADDRESS: ClassVar[int] = 0x400
-    can_bus: BusABC
+    can_bus: 'BusABC'
     driver_controls_base_address: int
 
     def _send(
@@ -270,6 +273,8 @@ class BatteryManagementSystem:
         if len(data) > 8:
             raise ValueError('data is less than 8 bytes')
 
+        from can import Message
+
         arbitration_id = self.driver_controls_base_address + message_identifier
         message = Message(
             arbitration_id=arbitration_id,
@@ -317,22 +322,23 @@ class BatteryManagementSystem:
         ThermistorTemperaturesInformation,
     )
 
-    def parse(self, message: Message) -> Information | None:
-        device_identifier = message.arbitration_id >> 5
+    INFORMATION_TABLE: ClassVar[
+        tuple[tuple[type[Information], Struct] | None, ...]
+    ] = _create_information_table(INFORMATION_TYPES)
+    """The information type and its prebuilt ``struct`` of each message
+    identifier, if any."""
+
+    def parse(self, message: 'Message') -> Information | None:
+        message_identifier = message.arbitration_id & _MESSAGE_IDENTIFIER_MASK
 
-        if self.BASE_ADDRESS != device_identifier << 5:
+        if message.arbitration_id - message_identifier != self.BASE_ADDRESS:
             return None
 
-        message_identifier = message.arbitration_id & ((1 << 5) - 1)
-        information = None
+        entry = self.INFORMATION_TABLE[message_identifier]
 
-        for type_ in self.INFORMATION_TYPES:
-            if message_identifier in type_.MESSAGE_IDENTIFIERS:
-                information = type_(
-                    message_identifier,
-                    *unpack(type_.FORMAT, message.data),
-                )
+        if entry is None:
+            return None
 
-                break
+        type_, struct = entry
 
-        return information
+        return type_(message_identifier, *struct.unpack(message.data))
@@ -0,0 +1,82 @@
+from collections import Counter
+from dataclasses import dataclass
+from logging import getLogger
+from time import time
+from typing import ClassVar
+
+from revolution.application import Application
+from revolution.environment import Endpoint, Partition
+
+_logger = getLogger(__name__)
+
+
+@dataclass
+class CANReader(Application):
+    endpoint: ClassVar[Endpoint] = Endpoint.CAN_READER
+
+    def _setup(self) -> None:
+        super()._setup()
+
+        self._can_worker = self.environment.create_worker(
+            self._can,
+            self._stoppage,
+        )
+
+        self._can_worker.start()
+
+    def _teardown(self) -> None:
+        self._can_worker.join()
+
+    def _can(self) -> None:
+        frame_counts: Counter[int] = Counter()
+        drop_counts: Counter[str] = Counter()
+        frame_count = 0
+        drop_count = 0
+        previous_time = time()
+
+        while not self._stoppage.is_set():
+            can_message = self.environment.peripheries.general_can_bus.recv(
+                self.environment.settings.can_reader_timeout,
+            )
+
+            if can_message is not None:
+                dropped_endpoints = self.environment.send_can(
+                    can_message,
+                    block=False,
+                )
+                frame_counts[can_message.arbitration_id] += 1
+
+                for endpoint in dropped_endpoints:
+                    drop_counts[endpoint.name] += 1
+
+            time_ = time()
+            time_difference = time_ - previous_time
+
+            if (
+                    time_difference
+                    < self.environment.settings.can_reader_statistics_timeout
+            ):
+                continue
+
+            frame_count += frame_counts.total()
+            drop_count += drop_counts.total()
+
+            with self.environment.contexts(Partition.CAN_READER) as contexts:
+                contexts.can_reader_frame_count = frame_count
+                contexts.can_reader_frame_rate = (
+                    frame_counts.total() / time_difference
+                )
+                contexts.can_reader_frame_rates = {
+                    arbitration_id: count / time_difference
+                    for arbitration_id, count in sorted(frame_counts.items())
+                }
+                contexts.can_reader_drop_count = drop_count
+
+                for name, count in drop_counts.items():
+                    contexts.can_reader_drop_counts[name] = (
+                        contexts.can_reader_drop_counts.get(name, 0) + count
+                    )
+
+            frame_counts.clear()
+            drop_counts.clear()
+            previous_time = time_
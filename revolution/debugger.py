@@ -6,11 +6,9 @@ from dataclasses import dataclass, fields
 from logging import getLogger
 from typing import Any, ClassVar
 
-import websockets
-
 from revolution.application import Application
 from revolution.environment import Endpoint
-from revolution.worker import Worker
+from revolution.utilities import AggregateArray, FlagArray
 
 _logger = getLogger(__name__)
 
@@ -49,7 +47,7 @@ def _coerce(value: Any) -> Any:
         return None if math.isinf(value) or math.isnan(value) else value
     if isinstance(value, dict):
         return {str(k): _coerce(v) for k, v in value.items()}
-    if isinstance(value, (list, tuple)):
+    if isinstance(value, (AggregateArray, FlagArray, list, tuple)):
         return [_coerce(v) for v in value]
     if dataclasses.is_dataclass(value) and not isinstance(value, type):
         return _serialize_contexts(value)
@@ -77,7 +75,11 @@ class Debugger(Application):
     def _setup(self) -> None:
         super()._setup()
 
-        self._debugger_worker = Worker(target=self._run_server, daemon=True)
+        self._debugger_worker = self.environment.create_worker(
+            self._run_server,
+            self._stoppage,
+            daemon=True,
+        )
         self._debugger_worker.start()
 
     def _teardown(self) -> None:
@@ -92,6 +94,8 @@ class Debugger(Application):
         asyncio.run(self._serve())
 
     async def _serve(self) -> None:
+        import websockets
+
         debugger_host = self.environment.settings.debugger_host
         debugger_port = self.environment.settings.debugger_port
 
@@ -108,18 +112,30 @@ class Debugger(Application):
 
     async def _handler(self, websocket: Any) -> None:
         """Broadcast the full Contexts snapshot to one connected client."""
+        from websockets.exceptions import ConnectionClosed
+
         _logger.info('Debugger client connected: %s', websocket.remote_address)
 
         try:
             while not self._stoppage.is_set():
-                with self.environment.contexts() as ctx:
-                    snapshot = _serialize_contexts(ctx)
+                snapshot = _serialize_contexts(
+                    self.environment.contexts.snapshot(),
+                )
+                snapshot['task_statistics'] = _coerce(
+                    self.environment.get_task_statistics(),
+                )
+                snapshot['worker_statistics'] = _coerce(
+                    self.environment.get_worker_statistics(),
+                )
+                snapshot['initialization_statistics'] = _coerce(
+                    self.environment.get_initialization_statistics(),
+                )
 
                 payload = json.dumps(snapshot)
                 await websocket.send(payload)
                 await asyncio.sleep(self.environment.settings.debugger_timeout)
 
-        except websockets.exceptions.ConnectionClosed:
+        except ConnectionClosed:
             _logger.info(
                 'Debugger client disconnected: %s', websocket.remote_address
             )
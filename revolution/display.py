@@ -7,7 +7,6 @@ from revolution.battery_management_system import BatteryFlag
 from revolution.environment import Endpoint
 from revolution.steering_wheel import DisplayItem
 from revolution.utilities import Direction
-from revolution.worker import Worker
 
 _logger = getLogger(__name__)
 
@@ -15,16 +14,43 @@ _logger = getLogger(__name__)
 @dataclass
 class Display(Application):
     endpoint: ClassVar[Endpoint] = Endpoint.DISPLAY
+    CONTEXTS_FIELD_NAMES: ClassVar[tuple[str, ...]] = (
+        'motor_velocity',
+        'motor_direction_input',
+        'motor_cruise_control_status_input',
+        'motor_cruise_control_velocity',
+        'motor_regeneration_status_input',
+        'motor_heartbeat_working',
+        'motor_controller_error_flags',
+        'motor_variable_field_magnet_position',
+        'power_battery_mean_state_of_charge',
+        'power_battery_discharge_status',
+        'power_battery_min_cell_voltage',
+        'power_battery_max_cell_voltage',
+        'power_battery_min_thermistor_temperature',
+        'power_battery_max_thermistor_temperature',
+        'power_battery_HV_current',
+        'power_battery_flags_hold',
+        'power_array_relay_status',
+        'power_battery_relay_status',
+    )
 
     def _setup(self) -> None:
         super()._setup()
 
-        self._display_worker = Worker(target=self._display)
+        self._display_subscription = self._subscribe(
+            *self.CONTEXTS_FIELD_NAMES,
+        )
+        self._display_worker = self.environment.create_worker(
+            self._display,
+            self._stoppage,
+        )
 
         self._display_worker.start()
 
     def _teardown(self) -> None:
         self._display_worker.join()
+        self._display_subscription.close()
 
     def _display(self) -> None:
 
@@ -120,60 +146,61 @@ class Display(Application):
         while not self._stoppage.wait(timeout):
             config_display()
 
-            with self.environment.contexts() as contexts:
-                # Motor
-                motor_velocity = contexts.motor_velocity
-                motor_direction_input = contexts.motor_direction_input
-                motor_cruise_control_status_input = (
-                    contexts.motor_cruise_control_status_input
-                )
-                motor_cruise_control_velocity = (
-                    contexts.motor_cruise_control_velocity
-                )
-                motor_regeneration_status_input = (
-                    contexts.motor_regeneration_status_input
-                )
-                motor_heartbeat_working = contexts.motor_heartbeat_working
-                motor_controller_error_flags = (
-                    contexts.motor_controller_error_flags
-                )
-                motor_variable_field_magnet_position = (
-                    contexts.motor_variable_field_magnet_position
-                )
+            contexts = self.environment.contexts.snapshot()
 
-                # Battery
-                power_battery_state_of_charge = (
-                    contexts.power_battery_mean_state_of_charge
-                )
-                power_battery_discharge_status = (
-                    contexts.power_battery_discharge_status
-                )
-                power_battery_min_cell_voltage = (
-                    contexts.power_battery_min_cell_voltage
-                )
-                power_battery_max_cell_voltage = (
-                    contexts.power_battery_max_cell_voltage
-                )
-                power_battery_min_thermistor_temperature = (
-                    contexts.power_battery_min_thermistor_temperature
-                )
-                power_battery_max_thermistor_temperature = (
-                    contexts.power_battery_max_thermistor_temperature
-                )
-                power_battery_HV_current = (
-                    contexts.power_battery_HV_current
-                )
+            # Motor
+            motor_velocity = contexts.motor_velocity
+            motor_direction_input = contexts.motor_direction_input
+            motor_cruise_control_status_input = (
+                contexts.motor_cruise_control_status_input
+            )
+            motor_cruise_control_velocity = (
+                contexts.motor_cruise_control_velocity
+            )
+            motor_regeneration_status_input = (
+                contexts.motor_regeneration_status_input
+            )
+            motor_heartbeat_working = contexts.motor_heartbeat_working
+            motor_controller_error_flags = (
+                contexts.motor_controller_error_flags
+            )
+            motor_variable_field_magnet_position = (
+                contexts.motor_variable_field_magnet_position
+            )
 
-                # Battery Flags
-                power_battery_flags_hold = (
-                    contexts.power_battery_flags_hold
-                )
+            # Battery
+            power_battery_state_of_charge = (
+                contexts.power_battery_mean_state_of_charge
+            )
+            power_battery_discharge_status = (
+                contexts.power_battery_discharge_status
+            )
+            power_battery_min_cell_voltage = (
+                contexts.power_battery_min_cell_voltage
+            )
+            power_battery_max_cell_voltage = (
+                contexts.power_battery_max_cell_voltage
+            )
+            power_battery_min_thermistor_temperature = (
+                contexts.power_battery_min_thermistor_temperature
+            )
+            power_battery_max_thermistor_temperature = (
+                contexts.power_battery_max_thermistor_temperature
+            )
+            power_battery_HV_current = (
+                contexts.power_battery_HV_current
+            )
 
-                # Relays
-                power_array_relay_status = contexts.power_array_relay_status
-                power_battery_relay_status = (
-                    contexts.power_battery_relay_status
-                )
+            # Battery Flags
+            power_battery_flags_hold = (
+                contexts.power_battery_flags_hold
+            )
+
+            # Relays
+            power_array_relay_status = contexts.power_array_relay_status
+            power_battery_relay_status = (
+                contexts.power_battery_relay_status
+            )
 
             # Motor
 
@@ -308,3 +335,7 @@ class Display(Application):
 
             battery_relay_label = 'B' if power_battery_relay_status else ''
             periphery.draw_word(DisplayItem.BATTERY_RELAY, battery_relay_label)
+
+            self._display_subscription.wait(
+                self.environment.settings.general_subscription_timeout,
+            )
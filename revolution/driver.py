@@ -1,13 +1,13 @@
 from collections import defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass
 from logging import getLogger
 from time import time
 from typing import ClassVar
 
 from revolution.application import Application
-from revolution.environment import Endpoint
+from revolution.environment import Endpoint, Partition
 from revolution.utilities import PRBS
-from revolution.worker import Worker
 
 _logger = getLogger(__name__)
 
@@ -70,27 +70,26 @@ class Driver(Application):
     def _setup(self) -> None:
         super()._setup()
 
-        self._steering_wheel_button_worker = Worker(
-            target=self._steering_wheel_button
+        self._steering_wheel_button_task = self.environment.schedule(
+            self._steering_wheel_button,
+            self.environment.settings.driver_timeout,
+        )
+        self._pedal_brake_task = self.environment.schedule(
+            self._pedal_brake,
+            self.environment.settings.driver_timeout,
         )
-        self._pedal_brake_worker = Worker(target=self._pedal_brake)
-
-        self._steering_wheel_button_worker.start()
-        self._pedal_brake_worker.start()
 
     def _teardown(self) -> None:
-        self._steering_wheel_button_worker.join()
-        self._pedal_brake_worker.join()
+        self._steering_wheel_button_task.cancel()
+        self._pedal_brake_task.cancel()
 
-    def _steering_wheel_button(self) -> None:
+    def _steering_wheel_button(self) -> Iterator[None]:
         previous_lookup: defaultdict[PRBS, bool] = defaultdict(bool)
 
-        while (
-                not self._stoppage.wait(
-                    self.environment.settings.driver_timeout,
-                )
-        ):
-            with self.environment.contexts() as contexts:
+        while True:
+            yield
+
+            with self.environment.contexts(Partition.DRIVER) as contexts:
                 steering_wheel_heartbeat_timestamp = (
                     contexts.driver_steering_wheel_heartbeat_timestamp
                 )
@@ -100,7 +99,11 @@ class Driver(Application):
                 < self.environment.settings.driver_steering_wheel_spi_timeout
             )
 
-            with self.environment.contexts() as contexts:
+            with self.environment.contexts(
+                    Partition.DRIVER,
+                    Partition.MISCELLANEOUS,
+                    Partition.MOTOR,
+            ) as contexts:
                 contexts.driver_steering_wheel_heartbeat_working = (
                     steering_wheel_heartbeat_working
                 )
@@ -121,7 +124,12 @@ class Driver(Application):
                         raw_bytes[_byte] & (1 << bit)
                     )
 
-            with self.environment.contexts() as contexts:
+            with self.environment.contexts(
+                    Partition.DRIVER,
+                    Partition.MISCELLANEOUS,
+                    Partition.MOTOR,
+                    Partition.POWER,
+            ) as contexts:
                 contexts.driver_steering_wheel_heartbeat_timestamp = time()
                 for raw_prbs, value in self.MOMENTARY_SWITCHES.items():
                     prbs = getattr(self.environment.peripheries, raw_prbs)
@@ -181,12 +189,10 @@ class Driver(Application):
 
             previous_lookup.update(lookup)
 
-    def _pedal_brake(self) -> None:
-        while (
-                not self._stoppage.wait(
-                    self.environment.settings.driver_timeout,
-                )
-        ):
+    def _pedal_brake(self) -> Iterator[None]:
+        while True:
+            yield
+
             brake_status_input = (
                 self
                 .environment
@@ -203,7 +209,10 @@ class Driver(Application):
                 .sample_all()
             )
 
-            with self.environment.contexts() as contexts:
+            with self.environment.contexts(
+                    Partition.MISCELLANEOUS,
+                    Partition.MOTOR,
+            ) as contexts:
                 contexts.miscellaneous_brake_status_input = brake_status_input
                 if brake_status_input:
                     contexts.motor_cruise_control_status_input = False
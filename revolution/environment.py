@@ -1,37 +1,75 @@
-from dataclasses import dataclass, field
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from contextlib import contextmanager
+from copy import deepcopy
+from dataclasses import dataclass, field, fields
 from enum import auto, Enum
-from functools import reduce
+from functools import cache
+from json import dump
 from logging import getLogger
-from operator import or_
-from queue import Queue
-from statistics import mean
-from time import struct_time
-from typing import Any
-
-from adafruit_gps import GPS  # type: ignore[import-untyped]
-from battlib import Battery
-from can import BusABC
-from door.threading2 import AcquirableDoor
-from iclib.adc78h89 import ADC78H89, InputChannel
-from iclib.bno055 import BNO055
-from iclib.ina229 import INA229
-from iclib.lis2hh12 import LIS2HH12
-from iclib.pca9546adr import PCA9546A
-from iclib.wavesculptor22 import WaveSculptor22
-from periphery import GPIO, PWM
-from serial import Serial
+from multiprocessing import get_context
+from multiprocessing.queues import Queue
+from multiprocessing.shared_memory import SharedMemory
+from pickle import dumps, HIGHEST_PROTOCOL, loads
+from queue import Empty, Full
+from struct import Struct
+from sys import _getframe
+from threading import (
+    Condition,
+    current_thread,
+    Event,
+    get_ident,
+    Lock,
+    RLock,
+    Thread,
+)
+from time import monotonic, perf_counter, sleep, struct_time
+from typing import (
+    Any,
+    cast,
+    ClassVar,
+    get_args,
+    get_origin,
+    get_type_hints,
+    TYPE_CHECKING,
+)
+
+from door.doors import UnhandledDoor
 
 from revolution.battery_management_system import (
     BatteryFlag,
     BatteryManagementSystem,
 )
+from revolution.initializer import Initialization, InitializationStatistics
+from revolution.scheduler import PeriodicTask, Scheduler, TaskStatistics
 from revolution.steering_wheel import SteeringWheel
-from revolution.utilities import Direction, PRBS
+from revolution.utilities import (
+    AggregateArray,
+    Direction,
+    FlagArray,
+    Histogram,
+    PRBS,
+)
+from revolution.worker import RestartPolicy, Worker, WorkerStatistics
+
+if TYPE_CHECKING:
+    from adafruit_gps import GPS  # type: ignore[import-untyped]
+    from battlib import Battery
+    from can import BusABC, Message as CANMessage
+    from iclib.adc78h89 import ADC78H89, InputChannel
+    from iclib.bno055 import BNO055
+    from iclib.ina229 import INA229
+    from iclib.lis2hh12 import LIS2HH12
+    from iclib.pca9546adr import PCA9546A
+    from iclib.wavesculptor22 import WaveSculptor22
+    from periphery import GPIO, PWM
+    from serial import Serial
 
 _logger = getLogger(__name__)
 
 
 class Endpoint(Enum):
+    CAN_READER = auto()
     DEBUGGER = auto()
     DISPLAY = auto()
     DRIVER = auto()
@@ -51,6 +89,255 @@ class Message:
     header: Header
     args: tuple[Any, ...] = field(default_factory=tuple)
     kwargs: dict[str, Any] = field(default_factory=dict)
+    key: Hashable | None = None
+
+
+class _Delivery(Enum):
+    MESSAGE = auto()
+    CAN = auto()
+    SUBSCRIPTION = auto()
+    UNSUBSCRIPTION = auto()
+    FLUSH = auto()
+
+
+class OverflowPolicy(Enum):
+    BLOCK = auto()
+    """Block the sender until there is room."""
+    DROP_OLDEST = auto()
+    """Discard the oldest queued message to make room."""
+    DROP_NEWEST = auto()
+    """Discard the message being sent."""
+    COALESCE = auto()
+    """Replace the queued message with the same key, if any, or else
+    discard the oldest queued message to make room."""
+
+
+@dataclass(frozen=True)
+class QueueStatistics:
+    capacity: int
+    overflow_policy: OverflowPolicy
+    size: int
+    high_water_mark: int
+    drop_count: int
+    coalesce_count: int
+
+
+@dataclass
+class MessageQueue:
+    """A message queue with an optional capacity and overflow policy.
+
+    A capacity of ``0`` means the queue is unbounded. Stop messages are
+    never dropped and are queued even if the queue is full. A queued
+    stop message is skipped by the policies that drop the oldest
+    message.
+
+    >>> queue = MessageQueue(2, OverflowPolicy.COALESCE)
+    >>> for key, value in ((1, 'a'), (2, 'b'), (1, 'c'), (3, 'd')):
+    ...     _ = queue.put(Message(Header.CAN, (value,), key=key))
+    >>> queue.get().args, queue.get().args
+    (('b',), ('d',))
+    >>> queue.statistics.drop_count, queue.statistics.coalesce_count
+    (1, 1)
+    """
+
+    capacity: int = 0
+    overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK
+    _cells: deque[list[Message]] = field(default_factory=deque, init=False)
+    _keyed_cells: dict[Hashable, list[Message]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _lock: Lock = field(default_factory=Lock, init=False)
+    _not_empty: Condition = field(init=False)
+    _not_full: Condition = field(init=False)
+    _high_water_mark: int = field(default=0, init=False)
+    _drop_count: int = field(default=0, init=False)
+    _coalesce_count: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        self._not_empty = Condition(self._lock)
+        self._not_full = Condition(self._lock)
+
+    @property
+    def statistics(self) -> QueueStatistics:
+        with self._lock:
+            return QueueStatistics(
+                self.capacity,
+                self.overflow_policy,
+                len(self._cells),
+                self._high_water_mark,
+                self._drop_count,
+                self._coalesce_count,
+            )
+
+    def qsize(self) -> int:
+        return len(self._cells)
+
+    def put(
+            self,
+            message: Message,
+            block: bool = True,
+            timeout: float | None = None,
+    ) -> bool:
+        """Put the message into the queue.
+
+        :return: ``True`` if a message was dropped, otherwise ``False``.
+        :raise Full: If the queue is full and the policy is to block.
+        """
+        coalescing = (
+            self.overflow_policy == OverflowPolicy.COALESCE
+            and message.key is not None
+        )
+        dropped = False
+
+        with self._lock:
+            if coalescing:
+                cell = self._keyed_cells.get(message.key)
+
+                if cell is not None:
+                    cell[0] = message
+                    self._coalesce_count += 1
+
+                    return False
+
+            if self._is_full() and message.header != Header.STOP:
+                if self.overflow_policy == OverflowPolicy.BLOCK:
+                    if (
+                            not block
+                            or not self._not_full.wait_for(
+                                lambda: not self._is_full(),
+                                timeout,
+                            )
+                    ):
+                        raise Full
+                elif self.overflow_policy == OverflowPolicy.DROP_NEWEST:
+                    self._drop_count += 1
+
+                    return True
+                elif self._drop_oldest():
+                    self._drop_count += 1
+
+                    dropped = True
+
+            cell = [message]
+
+            self._cells.append(cell)
+
+            if coalescing:
+                self._keyed_cells[message.key] = cell
+
+            self._high_water_mark = max(
+                self._high_water_mark,
+                len(self._cells),
+            )
+
+            self._not_empty.notify()
+
+        return dropped
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Message:
+        with self._lock:
+            if (
+                    not self._cells
+                    and (
+                        not block
+                        or not self._not_empty.wait_for(
+                            lambda: self._cells,
+                            timeout,
+                        )
+                    )
+            ):
+                raise Empty
+
+            message = self._pop()
+
+            self._not_full.notify()
+
+        return message
+
+    def get_batch(
+            self,
+            count: int,
+            block: bool = True,
+            timeout: float | None = None,
+            batch_timeout: float = 0,
+    ) -> list[Message]:
+        """Get up to ``count`` messages from the queue.
+
+        The first message is waited for as in :meth:`get`. After that,
+        messages keep being collected until ``count`` messages are
+        gathered or ``batch_timeout`` seconds have elapsed.
+
+        :return: The messages, oldest first.
+        :raise Empty: If no message arrived in time.
+        """
+        messages: list[Message] = []
+
+        with self._lock:
+            if (
+                    not self._cells
+                    and (
+                        not block
+                        or not self._not_empty.wait_for(
+                            lambda: self._cells,
+                            timeout,
+                        )
+                    )
+            ):
+                raise Empty
+
+            deadline = monotonic() + batch_timeout
+
+            while len(messages) < count:
+                if not self._cells:
+                    self._not_full.notify_all()
+
+                    remaining_timeout = deadline - monotonic()
+
+                    if (
+                            remaining_timeout <= 0
+                            or not self._not_empty.wait_for(
+                                lambda: self._cells,
+                                remaining_timeout,
+                            )
+                    ):
+                        break
+
+                messages.append(self._pop())
+
+            self._not_full.notify_all()
+
+        return messages
+
+    def _is_full(self) -> bool:
+        return 0 < self.capacity <= len(self._cells)
+
+    def _pop(self) -> Message:
+        cell = self._cells.popleft()
+
+        self._forget(cell)
+
+        return cell[0]
+
+    def _drop_oldest(self) -> bool:
+        for i, cell in enumerate(self._cells):
+            if cell[0].header != Header.STOP:
+                del self._cells[i]
+
+                self._forget(cell)
+
+                return True
+
+        return False
+
+    def _forget(self, cell: list[Message]) -> None:
+        message = cell[0]
+
+        if (
+                message.key is not None
+                and self._keyed_cells.get(message.key) is cell
+        ):
+            del self._keyed_cells[message.key]
 
 
 @dataclass
@@ -59,6 +346,14 @@ class Contexts:
 
     general_unused_status_input: bool
 
+    # CAN Reader
+
+    can_reader_frame_count: int
+    can_reader_frame_rate: float
+    can_reader_frame_rates: dict[int, float]
+    can_reader_drop_count: int
+    can_reader_drop_counts: dict[str, int]
+
     # Debugger
 
     # Display
@@ -143,8 +438,14 @@ class Contexts:
     power_array_relay_status_input: bool
     power_array_relay_status: bool
     power_battery_relay_status_input: bool
-    power_battery_cell_voltages: list[float]
-    power_battery_thermistor_temperatures: list[float]
+    power_battery_cell_voltages: AggregateArray[float]
+    power_battery_min_cell_voltage: float
+    power_battery_max_cell_voltage: float
+    power_battery_mean_cell_voltage: float
+    power_battery_thermistor_temperatures: AggregateArray[float]
+    power_battery_min_thermistor_temperature: float
+    power_battery_max_thermistor_temperature: float
+    power_battery_mean_thermistor_temperature: float
 
     power_battery_HV_voltage: float
     power_battery_HV_current: float
@@ -156,13 +457,14 @@ class Contexts:
     power_battery_relay_status: bool
     power_battery_electric_safe_discharge_status: bool
     power_battery_discharge_status: bool
-    power_battery_cell_flags: list[int]
-    power_battery_thermistor_flags: list[int]
+    power_battery_cell_flags: FlagArray[BatteryFlag]
+    power_battery_thermistor_flags: FlagArray[BatteryFlag]
     power_battery_current_flag: int
+    power_battery_flags: BatteryFlag
     power_battery_flags_hold: BatteryFlag
 
-    power_battery_hold_cell_flags: list[int]
-    power_battery_hold_thermistor_flags: list[int]
+    power_battery_hold_cell_flags: FlagArray[BatteryFlag]
+    power_battery_hold_thermistor_flags: FlagArray[BatteryFlag]
     power_battery_hold_current_flag: int
     power_battery_hold_elapsed_count: int
     power_battery_hold_OV_count: int
@@ -181,7 +483,10 @@ class Contexts:
     power_battery_heartbeat_timestamp: float
     power_battery_heartbeat_working: bool
 
-    power_battery_state_of_charges: list[float]
+    power_battery_state_of_charges: AggregateArray[float]
+    power_battery_min_state_of_charge: float
+    power_battery_max_state_of_charge: float
+    power_battery_mean_state_of_charge: float
 
     power_psm_battery_current: float
     power_psm_battery_voltage: float
@@ -190,61 +495,1189 @@ class Contexts:
     power_psm_motor_current: float
     power_psm_motor_voltage: float
 
-    @property
-    def power_battery_min_cell_voltage(self) -> float:
-        return min(self.power_battery_cell_voltages)
+    # Telemetry
 
-    @property
-    def power_battery_max_cell_voltage(self) -> float:
-        return max(self.power_battery_cell_voltages)
+    telemetry_radio_submitted_count: int
+    telemetry_radio_sent_count: int
+    telemetry_radio_coalesced_count: int
+    telemetry_radio_retry_count: int
+    telemetry_radio_drop_count: int
 
-    @property
-    def power_battery_mean_cell_voltage(self) -> float:
-        return mean(self.power_battery_cell_voltages)
 
-    @property
-    def power_battery_min_thermistor_temperature(self) -> float:
-        return min(self.power_battery_thermistor_temperatures)
+class Partition(Enum):
+    """A partition of the contexts that is locked on its own.
 
-    @property
-    def power_battery_max_thermistor_temperature(self) -> float:
-        return max(self.power_battery_thermistor_temperatures)
+    Partitions follow the sections of :class:`Contexts` and each one
+    owns the fields whose names start with its value. When several
+    partitions are acquired at once, they are always acquired in the
+    order they are defined here.
+    """
 
-    @property
-    def power_battery_mean_thermistor_temperature(self) -> float:
-        return mean(self.power_battery_thermistor_temperatures)
+    GENERAL = 'general_'
+    CAN_READER = 'can_reader_'
+    DRIVER = 'driver_'
+    MISCELLANEOUS = 'miscellaneous_'
+    MOTOR = 'motor_'
+    POWER = 'power_'
+    TELEMETRY = 'telemetry_'
+
+    @classmethod
+    @cache
+    def from_name(cls, name: str) -> 'Partition':
+        for partition in cls:
+            if name.startswith(partition.value):
+                return partition
+
+        raise ValueError(f'no partition owns {repr(name)}')
+
+
+@dataclass
+class AcquisitionStatistics:
+    """The contexts door acquisitions of one call site and thread.
+
+    All times are in seconds. The wait time is the time spent acquiring
+    the partitions, the hold time is the time they were held, and the
+    interval time is the time between consecutive acquisitions.
+    """
+
+    call_site: str
+    thread_name: str
+    partitions: tuple[Partition, ...]
+    first_timestamp: float
+    last_timestamp: float = field(init=False)
+    wait_times: Histogram = field(default_factory=Histogram, init=False)
+    hold_times: Histogram = field(default_factory=Histogram, init=False)
+    interval_times: Histogram = field(default_factory=Histogram, init=False)
+
+    def __post_init__(self) -> None:
+        self.last_timestamp = self.first_timestamp
+
+    def __str__(self) -> str:
+        return (
+            f'{self.call_site} ({self.thread_name}):'
+            f' {self.count} acquisitions at {self.acquisition_rate:.1f}/s,'
+            f' wait p50={self.wait_times.quantile(0.5) * 1e6:.0f}us'
+            f' p99={self.wait_times.quantile(0.99) * 1e6:.0f}us'
+            f' max={self.wait_times.maximum * 1e6:.0f}us,'
+            f' hold p50={self.hold_times.quantile(0.5) * 1e6:.0f}us'
+            f' p99={self.hold_times.quantile(0.99) * 1e6:.0f}us'
+            f' max={self.hold_times.maximum * 1e6:.0f}us'
+        )
 
     @property
-    def power_battery_min_state_of_charge(self) -> float:
-        return min(self.power_battery_state_of_charges)
+    def count(self) -> int:
+        return self.hold_times.count
 
     @property
-    def power_battery_max_state_of_charge(self) -> float:
-        return max(self.power_battery_state_of_charges)
+    def acquisition_rate(self) -> float:
+        """The acquisitions per second."""
+        time_difference = self.last_timestamp - self.first_timestamp
+
+        return (self.count - 1) / time_difference if time_difference else 0
+
+    def summarize(self) -> dict[str, Any]:
+        summary: dict[str, Any] = {
+            'call_site': self.call_site,
+            'thread_name': self.thread_name,
+            'partitions': [partition.name for partition in self.partitions],
+            'count': self.count,
+            'acquisition_rate': self.acquisition_rate,
+        }
+
+        for name, histogram in (
+                ('wait_time', self.wait_times),
+                ('hold_time', self.hold_times),
+                ('interval_time', self.interval_times),
+        ):
+            summary[name] = {
+                'mean': histogram.mean,
+                'p50': histogram.quantile(0.5),
+                'p99': histogram.quantile(0.99),
+                'max': histogram.maximum,
+                'total': histogram.total,
+                'bucket_counts': histogram.counts,
+            }
+
+        return summary
+
+
+class _ContextsProxy:
+    __slots__ = '_resource', '_partitions', '_status', '_changed_names'
+
+    def __init__(self, resource: Contexts, partitions: frozenset[Partition]):
+        object.__setattr__(self, '_resource', resource)
+        object.__setattr__(self, '_partitions', partitions)
+        object.__setattr__(self, '_status', True)
+        object.__setattr__(self, '_changed_names', set())
+
+    def __repr__(self) -> str:
+        return repr(self._resource)
+
+    def __getattr__(self, name: str) -> Any:
+        self._check(name)
+
+        value = getattr(self._resource, name)
+
+        if isinstance(value, (AggregateArray, FlagArray, dict, list)):
+            self._changed_names.add(name)
+
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._check(name)
+
+        if getattr(self._resource, name) != value:
+            self._changed_names.add(name)
+
+        setattr(self._resource, name, value)
+
+    def close(self) -> None:
+        object.__setattr__(self, '_status', False)
+
+    def _check(self, name: str) -> None:
+        if not self._status:
+            raise ValueError('no permission')
+
+        partition = Partition.from_name(name)
+
+        if partition not in self._partitions:
+            raise ValueError(f'partition {partition.name} not acquired')
+
+
+@dataclass
+class ContextsDoor(UnhandledDoor[Contexts]):
+    """A door to the contexts with a lock per partition.
+
+    Calling the door with some partitions acquires only their locks, in
+    the order of :class:`Partition`, and gives access to only their
+    fields. Calling it without any partition acquires all of them.
+    Nested calls may reacquire held partitions but may only add
+    partitions that come after all the held ones, so that the lock
+    order is the same everywhere.
+
+    Every outermost acquisition of a partition makes its sequence
+    number odd while it is held and even again once it is released,
+    like a seqlock. :meth:`snapshot` copies each partition without
+    acquiring the door and retries if a writer was active during the
+    copy, so readers never block writers. If a partition is held, its
+    last published state is used instead. Each partition of a snapshot
+    is therefore consistent on its own. A snapshot is shared between
+    readers until the next write and must not be mutated.
+
+    >>> from dataclasses import make_dataclass
+    >>> door = ContextsDoor(
+    ...     make_dataclass('', [('motor_velocity', float)])(0),
+    ... )
+    >>> snapshot = door.snapshot()
+    >>> with door(Partition.MOTOR) as contexts:
+    ...     contexts.motor_velocity = 1
+    >>> snapshot.motor_velocity, door.snapshot().motor_velocity
+    (0, 1)
+    >>> with door(Partition.POWER) as contexts:
+    ...     contexts.motor_velocity
+    Traceback (most recent call last):
+        ...
+    ValueError: partition MOTOR not acquired
+    >>> with door(Partition.MOTOR), door(Partition.DRIVER):
+    ...     pass
+    Traceback (most recent call last):
+        ...
+    ValueError: partition DRIVER acquired after partition MOTOR
+
+    Writes that change a field are published to the subscriptions of
+    that field once the partitions are released, see :meth:`subscribe`.
+    Since in-place updates cannot be seen, accessing a list, dict or
+    array field through the door counts as changing it.
+
+    If the door is instrumented, every acquisition is timed and
+    recorded per call site and thread, see
+    :meth:`get_acquisition_statistics`.
+
+    Once shared, see :meth:`share`, the door also works across the
+    processes forked afterwards.
+    """
+
+    SNAPSHOT_RETRY_COUNT: ClassVar[int] = 3
+    SHARED_MEMORY_VARIABLE_SIZE: ClassVar[int] = 1 << 16
+    """The minimum capacity of the variable fields of a partition in
+    shared memory, see :class:`SharedPartition`."""
+    instrumented: bool = False
+    """Whether to record :class:`AcquisitionStatistics`."""
+    synchronization_timeout: float = 0.01
+    """How often changes by other processes are looked for while shared
+    (in seconds)."""
+    _locks: dict[Partition, Any] = field(default_factory=dict, init=False)
+    _sequences: dict[Partition, int] = field(default_factory=dict, init=False)
+    _depths: dict[Partition, int] = field(default_factory=dict, init=False)
+    _owners: dict[Partition, int | None] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _names: dict[Partition, tuple[str, ...]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _published_states: dict[Partition, tuple[int, dict[str, Any]]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _published_snapshot: tuple[tuple[int, ...], Contexts] | None = field(
+        default=None,
+        init=False,
+    )
+    _acquisition_statistics: dict[
+        tuple[str, str],
+        AcquisitionStatistics,
+    ] = field(default_factory=dict, init=False)
+    _acquisition_statistics_lock: Lock = field(
+        default_factory=Lock,
+        init=False,
+    )
+    _versions: dict[str, int] = field(default_factory=dict, init=False)
+    _subscriptions: dict[str, list['ContextsSubscription']] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _changes_lock: Lock = field(default_factory=Lock, init=False)
+    _shared_memory: SharedMemory | None = field(default=None, init=False)
+    _shared_partitions: dict[Partition, 'SharedPartition'] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _generations: dict[Partition, int] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _variable_generations: dict[Partition, int] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _pending_names: dict[Partition, set[str]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _synchronized_states: dict[Partition, tuple[int, dict[str, Any]]] = (
+        field(default_factory=dict, init=False)
+    )
+    _synchronizer: Thread | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+        for partition in Partition:
+            self._locks[partition] = RLock()
+            self._sequences[partition] = 0
+            self._depths[partition] = 0
+            self._owners[partition] = None
+            self._names[partition] = ()
+            self._published_states[partition] = -1, {}
+            self._pending_names[partition] = set()
+
+        for name in vars(self._resource_or_handle):
+            partition = Partition.from_name(name)
+            self._names[partition] += (name,)
+
+        for partition in Partition:
+            self._publish_state(partition)
+
+    @contextmanager
+    def __call__(self, *partitions: Partition) -> Iterator[Contexts]:
+        if partitions:
+            partitions = tuple(
+                partition for partition in Partition
+                if partition in partitions
+            )
+        else:
+            partitions = tuple(Partition)
+
+        ident = get_ident()
+        last_held_partition = None
+
+        for partition in Partition:
+            if self._owners[partition] == ident:
+                last_held_partition = partition
+
+        if last_held_partition is not None:
+            order = tuple(Partition)
+
+            for partition in partitions:
+                if (
+                        self._owners[partition] != ident
+                        and (
+                            order.index(partition)
+                            < order.index(last_held_partition)
+                        )
+                ):
+                    raise ValueError(
+                        (
+                            f'partition {partition.name} acquired after'
+                            f' partition {last_held_partition.name}'
+                        ),
+                    )
+
+        instrumented = self.instrumented
+        call_site = ''
+        begin_time = acquisition_time = release_time = 0.0
+
+        if instrumented:
+            frame = _getframe(2)
+            module_name = frame.f_globals.get('__name__')
+            call_site = (
+                f'{module_name}.{frame.f_code.co_qualname}:{frame.f_lineno}'
+            )
+            begin_time = perf_counter()
+
+        acquired_partitions = []
+        proxy = None
+
+        try:
+            for partition in partitions:
+                self._locks[partition].acquire()
+                acquired_partitions.append(partition)
+
+                if not self._depths[partition]:
+                    self._owners[partition] = ident
+                    self._sequences[partition] += 1
+
+                    if self._shared_memory is not None:
+                        self._pull(partition)
+
+                self._depths[partition] += 1
+
+            if instrumented:
+                acquisition_time = perf_counter()
+
+            proxy = _ContextsProxy(
+                cast(Contexts, self._resource_or_handle),
+                frozenset(partitions),
+            )
+
+            try:
+                yield cast(Contexts, proxy)
+            finally:
+                proxy.close()
+        finally:
+            if instrumented:
+                release_time = perf_counter()
+
+            try:
+                if self._shared_memory is not None and proxy is not None:
+                    for name in proxy._changed_names:
+                        partition = Partition.from_name(name)
+
+                        self._pending_names[partition].add(name)
+
+                    for partition in acquired_partitions:
+                        if (
+                                self._depths[partition] == 1
+                                and self._pending_names[partition]
+                        ):
+                            self._push(partition)
+            finally:
+                for partition in reversed(acquired_partitions):
+                    self._depths[partition] -= 1
+
+                    if not self._depths[partition]:
+                        self._sequences[partition] += 1
+                        self._owners[partition] = None
+
+                    self._locks[partition].release()
+
+            if proxy is not None and proxy._changed_names:
+                self._notify(proxy._changed_names)
+
+            if instrumented and len(acquired_partitions) == len(partitions):
+                self._record_acquisition(
+                    call_site,
+                    partitions,
+                    acquisition_time - begin_time,
+                    release_time - acquisition_time,
+                    begin_time,
+                )
+
+    def subscribe(self, *names: str) -> 'ContextsSubscription':
+        """Subscribe to changes of the fields.
+
+        :return: The subscription.
+        :raise ValueError: If a name is not of a field.
+        """
+        for name in names:
+            if name not in self._names[Partition.from_name(name)]:
+                raise ValueError(f'{repr(name)} is not a field')
+
+        subscription = ContextsSubscription(self, frozenset(names))
+
+        with self._changes_lock:
+            for name in names:
+                subscription._versions[name] = self._versions.get(name, 0)
+
+                self._subscriptions.setdefault(name, []).append(subscription)
+
+            if self._shared_memory is not None and (
+                    self._synchronizer is None
+                    or not self._synchronizer.is_alive()
+            ):
+                self._synchronizer = Thread(
+                    target=self._synchronize,
+                    name=f'{type(self).__name__}._synchronize',
+                    daemon=True,
+                )
+
+                self._synchronizer.start()
+
+        return subscription
+
+    def unsubscribe(self, subscription: 'ContextsSubscription') -> None:
+        with self._changes_lock:
+            for name in subscription.names:
+                self._subscriptions[name].remove(subscription)
+
+    def get_acquisition_statistics(self) -> list[AcquisitionStatistics]:
+        """Get the acquisition statistics recorded while instrumented.
+
+        :return: The statistics per call site and thread, the longest
+                 total hold time first.
+        """
+        with self._acquisition_statistics_lock:
+            acquisition_statistics = deepcopy(
+                list(self._acquisition_statistics.values()),
+            )
+
+        acquisition_statistics.sort(
+            key=lambda statistics: statistics.hold_times.total,
+            reverse=True,
+        )
+
+        return acquisition_statistics
+
+    def reset_acquisition_statistics(self) -> None:
+        with self._acquisition_statistics_lock:
+            self._acquisition_statistics.clear()
+
+    def dump_acquisition_statistics(self, filepath: str) -> None:
+        """Dump the acquisition statistics to a JSON file.
+
+        :return: ``None``.
+        """
+        with open(filepath, 'w') as file:
+            dump(
+                [
+                    statistics.summarize()
+                    for statistics in self.get_acquisition_statistics()
+                ],
+                file,
+                indent=2,
+            )
+
+    def _notify(self, names: set[str]) -> None:
+        with self._changes_lock:
+            for name in names:
+                self._versions[name] = self._versions.get(name, 0) + 1
+
+                for subscription in self._subscriptions.get(name, ()):
+                    subscription._event.set()
+
+    def _get_changed_names(self, versions: dict[str, int]) -> set[str]:
+        changed_names = set()
+
+        with self._changes_lock:
+            for name, version in versions.items():
+                latest_version = self._versions.get(name, 0)
+
+                if version != latest_version:
+                    versions[name] = latest_version
+
+                    changed_names.add(name)
+
+        return changed_names
+
+    def _record_acquisition(
+            self,
+            call_site: str,
+            partitions: tuple[Partition, ...],
+            wait_time: float,
+            hold_time: float,
+            timestamp: float,
+    ) -> None:
+        key = call_site, current_thread().name
+
+        with self._acquisition_statistics_lock:
+            statistics = self._acquisition_statistics.get(key)
+
+            if statistics is None:
+                statistics = AcquisitionStatistics(*key, partitions, timestamp)
+                self._acquisition_statistics[key] = statistics
+            else:
+                statistics.interval_times.add(
+                    timestamp - statistics.last_timestamp,
+                )
+
+            statistics.last_timestamp = timestamp
+
+            statistics.wait_times.add(wait_time)
+            statistics.hold_times.add(hold_time)
 
     @property
-    def power_battery_mean_state_of_charge(self) -> float:
-        return mean(self.power_battery_state_of_charges)
+    def sequence(self) -> int:
+        """A number that changes whenever any partition is acquired or
+        released."""
+        return sum(self._sequences.values())
+
+    def snapshot(self) -> Contexts:
+        snapshot = self._published_snapshot
+
+        for partition in Partition:
+            sequence, _ = self._published_states[partition]
+
+            if self._get_sequence(partition) != sequence:
+                self._publish_state(partition)
+
+        sequences = tuple(
+            sequence for sequence, _ in self._published_states.values()
+        )
+
+        if snapshot is None or snapshot[0] != sequences:
+            resource = cast(Contexts, self._resource_or_handle)
+            contexts: Contexts = object.__new__(type(resource))
+
+            for _, state in self._published_states.values():
+                contexts.__dict__.update(state)
+
+            snapshot = sequences, contexts
+            self._published_snapshot = snapshot
+
+        return snapshot[1]
+
+    def _get_sequence(self, partition: Partition) -> int:
+        shared_memory = self._shared_memory
+
+        if shared_memory is None:
+            return self._sequences[partition]
+
+        shared_partition = self._shared_partitions[partition]
+        generation, _, _ = shared_partition.HEADER.unpack_from(
+            shared_memory.buf,
+            shared_partition.offset,
+        )
+
+        return cast(int, generation)
+
+    def _publish_state(self, partition: Partition) -> None:
+        if self._shared_memory is not None:
+            shared_state = self._read_shared_state(partition)
+
+            if shared_state is not None:
+                self._published_states[partition] = shared_state
+
+            return
+
+        for _ in range(self.SNAPSHOT_RETRY_COUNT):
+            sequence = self._sequences[partition]
+
+            if sequence % 2:
+                break
+
+            state = self._copy_state(partition)
+
+            if self._sequences[partition] == sequence:
+                self._published_states[partition] = sequence, state
+
+                break
+
+    def _copy_state(self, partition: Partition) -> dict[str, Any]:
+        resource = cast(Contexts, self._resource_or_handle)
+        state = {}
+
+        for name in self._names[partition]:
+            value = resource.__dict__[name]
+
+            if isinstance(value, (AggregateArray, FlagArray, dict, list)):
+                value = value.copy()
+
+            state[name] = value
+
+        return state
+
+    def share(self) -> None:
+        """Move the contexts into shared memory, so that the processes
+        forked afterwards share them.
+
+        The partitions are laid out one after another in one block of
+        shared memory, see :class:`SharedPartition`. A partition is read
+        from the block when acquired, if another process wrote it since,
+        and written to the block when released, if changed. Snapshots
+        read the block directly.
+
+        The locks become process-shared and the subscriptions are also
+        woken by changes in other processes, which are looked for every
+        :attr:`synchronization_timeout` seconds.
+
+        This must be called before any process is forked and while no
+        partition is held.
+
+        :return: ``None``.
+        """
+        resource = cast(Contexts, self._resource_or_handle)
+        type_hints = get_type_hints(type(resource))
+        context = get_context('fork')
+        offset = 0
+
+        for partition in Partition:
+            shared_partition = SharedPartition.create(
+                offset,
+                {
+                    name: resource.__dict__[name]
+                    for name in self._names[partition]
+                },
+                type_hints,
+                self.SHARED_MEMORY_VARIABLE_SIZE,
+            )
+            offset += shared_partition.size
+            self._shared_partitions[partition] = shared_partition
+
+        self._shared_memory = SharedMemory(create=True, size=offset)
+
+        for partition in Partition:
+            self._locks[partition] = context.RLock()
+            self._generations[partition] = 0
+            self._variable_generations[partition] = 0
+            self._pending_names[partition].update(self._names[partition])
+
+            self._push(partition)
+
+            self._published_states[partition] = -1, {}
+
+    def unshare(self) -> None:
+        """Move the contexts back out of the shared memory and free it.
+
+        This must only be called by the process that shared the contexts
+        after the processes forked since have exited.
+
+        :return: ``None``.
+        """
+        with self():
+            shared_memory = self._shared_memory
+            self._shared_memory = None
+
+        if self._synchronizer is not None:
+            self._synchronizer.join()
+
+        if shared_memory is not None:
+            shared_memory.close()
+            shared_memory.unlink()
+
+        for partition in Partition:
+            self._published_states[partition] = -1, {}
+
+    def _read_shared_state(
+            self,
+            partition: Partition,
+    ) -> tuple[int, dict[str, Any]] | None:
+        shared_memory = self._shared_memory
+
+        if shared_memory is None:
+            return None
+
+        buffer = shared_memory.buf
+        shared_partition = self._shared_partitions[partition]
+
+        for _ in range(self.SNAPSHOT_RETRY_COUNT):
+            generation, _, length = shared_partition.HEADER.unpack_from(
+                buffer,
+                shared_partition.offset,
+            )
+
+            if generation % 2:
+                break
+
+            state = shared_partition.unpack_fixed(buffer)
+            data = shared_partition.copy_variable(buffer, length)
+
+            if self._get_sequence(partition) == generation:
+                try:
+                    state.update(loads(data))
+                except Exception:  # noqa: BLE001
+                    continue
+
+                return generation, state
+
+        return None
+
+    def _pull(self, partition: Partition) -> None:
+        assert self._shared_memory is not None
+
+        buffer = self._shared_memory.buf
+        shared_partition = self._shared_partitions[partition]
+        generation, variable_generation, length = (
+            shared_partition.HEADER.unpack_from(
+                buffer,
+                shared_partition.offset,
+            )
+        )
+
+        if generation == self._generations[partition]:
+            return
+
+        resource = cast(Contexts, self._resource_or_handle)
+        state = shared_partition.unpack_fixed(buffer)
+
+        if variable_generation != self._variable_generations[partition]:
+            state.update(
+                loads(shared_partition.copy_variable(buffer, length)),
+            )
+
+            self._variable_generations[partition] = variable_generation
+
+        changed_names = {
+            name for name, value in state.items()
+            if resource.__dict__[name] != value
+        }
+
+        resource.__dict__.update(state)
+
+        self._generations[partition] = generation
+        self._synchronized_states[partition] = (
+            generation,
+            self._copy_state(partition),
+        )
+
+        if changed_names:
+            self._notify(changed_names)
+
+    def _push(self, partition: Partition) -> None:
+        assert self._shared_memory is not None
+
+        buffer = self._shared_memory.buf
+        shared_partition = self._shared_partitions[partition]
+        offset = shared_partition.offset
+        resource = cast(Contexts, self._resource_or_handle)
+        values = resource.__dict__
+        data = None
+
+        if not self._pending_names[partition].isdisjoint(
+                shared_partition.variable_names,
+        ):
+            data = shared_partition.dump_variable(values)
+
+        generation, variable_generation, length = (
+            shared_partition.HEADER.unpack_from(buffer, offset)
+        )
+
+        shared_partition.HEADER.pack_into(
+            buffer,
+            offset,
+            generation + 1,
+            variable_generation,
+            length,
+        )
+
+        try:
+            shared_partition.pack_fixed(buffer, values)
+
+            if data is not None:
+                shared_partition.pack_variable(buffer, data)
+
+                variable_generation = generation + 2
+                length = len(data)
+        finally:
+            shared_partition.HEADER.pack_into(
+                buffer,
+                offset,
+                generation + 2,
+                variable_generation,
+                length,
+            )
+
+        self._generations[partition] = generation + 2
+        self._variable_generations[partition] = variable_generation
+        self._synchronized_states[partition] = (
+            generation + 2,
+            self._copy_state(partition),
+        )
+
+        self._pending_names[partition].clear()
+
+    def _synchronize(self) -> None:
+        while self._shared_memory is not None:
+            sleep(self.synchronization_timeout)
+
+            changed_names = set()
+
+            for partition in Partition:
+                generation, state = self._synchronized_states[partition]
+
+                if self._get_sequence(partition) == generation:
+                    continue
+
+                shared_state = self._read_shared_state(partition)
+
+                if shared_state is None:
+                    continue
+
+                for name, value in shared_state[1].items():
+                    if state[name] != value:
+                        changed_names.add(name)
+
+                self._synchronized_states[partition] = shared_state
+
+            if changed_names:
+                self._notify(changed_names)
+
+
+@dataclass(frozen=True)
+class SharedPartition:
+    """The layout of a partition of the contexts in shared memory.
+
+    The partition starts with a header of its generation, the generation
+    of its variable fields and their length. Its fixed fields, the
+    booleans, integers, floats and lists or aggregate arrays thereof,
+    whose lengths are taken as fixed, follow at
+    fixed offsets and are packed and unpacked by one struct. A flag
+    array of up to 64 elements is also fixed, as the bitmask of each bit
+    of its flags. Its other, variable fields, such as the dicts, are
+    pickled after them within their capacity.
+
+    >>> from dataclasses import make_dataclass
+    >>> shared_partition = SharedPartition.create(
+    ...     0,
+    ...     {
+    ...         'motor_velocity': 0,
+    ...         'motor_currents': [0, 0],
+    ...         'motor_flags': FlagArray(3),
+    ...         'motor_log': {},
+    ...     },
+    ...     {
+    ...         'motor_velocity': float,
+    ...         'motor_currents': list[float],
+    ...         'motor_flags': FlagArray[BatteryFlag],
+    ...     },
+    ... )
+    >>> shared_partition.fixed_struct.format
+    '=d2d6Q'
+    >>> shared_partition.variable_names
+    ('motor_log',)
+    >>> buffer = bytearray(shared_partition.size)
+    >>> shared_partition.pack_fixed(
+    ...     buffer,
+    ...     {
+    ...         'motor_velocity': 1,
+    ...         'motor_currents': [2, 3],
+    ...         'motor_flags': FlagArray(3, [0, 5, 1]),
+    ...     },
+    ... )
+    >>> shared_partition.unpack_fixed(buffer)  # doctest: +NORMALIZE_WHITESPACE
+    {'motor_velocity': 1.0, 'motor_currents': [2.0, 3.0],
+     'motor_flags': FlagArray(3, [0, 5, 1])}
+    """
+
+    HEADER: ClassVar[Struct] = Struct('=QQQ')
+    FORMATS: ClassVar[dict[type, str]] = {bool: '?', int: 'q', float: 'd'}
+    offset: int
+    fixed_names: tuple[str, ...]
+    fixed_lengths: tuple[int | None, ...]
+    """The lengths of the fixed fields, or ``None`` for scalars."""
+    fixed_types: tuple[type[Enum] | None, ...]
+    """The enumerations the scalar fixed fields are converted to, if
+    any."""
+    fixed_typecodes: tuple[str | None, ...]
+    """The typecodes of the aggregate array fixed fields."""
+    fixed_flags: tuple[tuple[int, ...] | None, ...]
+    """The flags of the flag array fixed fields, one bitmask each."""
+    fixed_struct: Struct
+    variable_names: tuple[str, ...]
+    variable_capacity: int
+
+    @classmethod
+    def create(
+            cls,
+            offset: int,
+            values: dict[str, Any],
+            type_hints: dict[str, Any],
+            variable_size: int = 1 << 16,
+    ) -> 'SharedPartition':
+        """Lay out the fields.
+
+        :param values: The initial values of the fields, which fix the
+                       lengths of the lists.
+        :param type_hints: The types of the fields, which decide which
+                           fields are fixed.
+        :param variable_size: The minimum capacity of the variable
+                              fields, if any.
+        :return: The layout.
+        """
+        fixed_names = []
+        fixed_lengths: list[int | None] = []
+        fixed_types: list[type[Enum] | None] = []
+        fixed_typecodes: list[str | None] = []
+        fixed_flags: list[tuple[int, ...] | None] = []
+        format_ = '='
+        variable_names = []
+
+        for name, value in values.items():
+            type_hint = type_hints.get(name)
+            length = None
+            typecode = None
+
+            if (
+                    get_origin(type_hint) is FlagArray
+                    and isinstance(value, FlagArray)
+                    and len(value) <= 64
+            ):
+                flag_type, = get_args(type_hint)
+                union = 0
+
+                for flag in flag_type:
+                    union |= flag
+
+                flags = tuple(
+                    1 << i
+                    for i in range(union.bit_length())
+                    if union >> i & 1
+                )
+
+                fixed_names.append(name)
+                fixed_lengths.append(len(value))
+                fixed_types.append(None)
+                fixed_typecodes.append(None)
+                fixed_flags.append(flags)
+
+                format_ += f'{len(flags)}Q'
+
+                continue
+
+            if (
+                    (
+                        get_origin(type_hint) is list
+                        and isinstance(value, list)
+                    )
+                    or (
+                        get_origin(type_hint) is AggregateArray
+                        and isinstance(value, AggregateArray)
+                    )
+            ):
+                type_hint, = get_args(type_hint)
+                length = len(value)
+
+                if isinstance(value, AggregateArray):
+                    typecode = value.typecode
+
+            format_character = None
+            enum_type = None
+
+            if isinstance(type_hint, type):
+                if issubclass(type_hint, Enum):
+                    enum_type = type_hint
+
+                if length is None or enum_type is None:
+                    for type_, character in cls.FORMATS.items():
+                        if issubclass(type_hint, type_):
+                            format_character = character
+
+                            break
+
+            if format_character is None:
+                variable_names.append(name)
+
+                continue
+
+            fixed_names.append(name)
+            fixed_lengths.append(length)
+            fixed_types.append(enum_type)
+            fixed_typecodes.append(typecode)
+            fixed_flags.append(None)
+
+            format_ += format_character if length is None else (
+                f'{length}{format_character}'
+            )
+
+        variable_capacity = 0
+
+        if variable_names:
+            data = dumps(
+                {name: values[name] for name in variable_names},
+                HIGHEST_PROTOCOL,
+            )
+            variable_capacity = max(variable_size, 4 * len(data))
+
+        return cls(
+            offset,
+            tuple(fixed_names),
+            tuple(fixed_lengths),
+            tuple(fixed_types),
+            tuple(fixed_typecodes),
+            tuple(fixed_flags),
+            Struct(format_),
+            tuple(variable_names),
+            variable_capacity,
+        )
 
     @property
-    def power_battery_flags(self) -> BatteryFlag:
+    def size(self) -> int:
         return (
-            reduce(  # type: ignore[return-value]
-                or_,
-                self.power_battery_cell_flags,
-            )
-            | reduce(or_, self.power_battery_thermistor_flags)
-            | self.power_battery_current_flag
+            self.HEADER.size
+            + self.fixed_struct.size
+            + self.variable_capacity
         )
 
-    # Telemetry
+    def pack_fixed(self, buffer: Any, values: dict[str, Any]) -> None:
+        """Pack the fixed fields into the buffer.
+
+        :return: ``None``.
+        :raise ValueError: If the length of a list changed.
+        """
+        items = []
+
+        for name, length, flags in zip(
+                self.fixed_names,
+                self.fixed_lengths,
+                self.fixed_flags,
+        ):
+            value = values[name]
+
+            if length is None:
+                items.append(value)
+            elif len(value) != length:
+                raise ValueError(f'{name} is not of length {length}')
+            elif flags is None:
+                items.extend(value)
+            else:
+                items.extend(value.get_mask(flag) for flag in flags)
+
+        self.fixed_struct.pack_into(
+            buffer,
+            self.offset + self.HEADER.size,
+            *items,
+        )
+
+    def unpack_fixed(self, buffer: Any) -> dict[str, Any]:
+        items = self.fixed_struct.unpack_from(
+            buffer,
+            self.offset + self.HEADER.size,
+        )
+        values = {}
+        i = 0
+
+        for name, length, type_, typecode, flags in zip(
+                self.fixed_names,
+                self.fixed_lengths,
+                self.fixed_types,
+                self.fixed_typecodes,
+                self.fixed_flags,
+        ):
+            if length is None:
+                value = items[i]
+                i += 1
+
+                if type_ is not None:
+                    value = type_(value)
+            elif flags is not None:
+                value = FlagArray(length)
+
+                for flag in flags:
+                    value.assign(flag, items[i])
+
+                    i += 1
+            elif typecode is None:
+                value = list(items[i:i + length])
+                i += length
+            else:
+                value = AggregateArray(typecode, items[i:i + length])
+                i += length
+
+            values[name] = value
+
+        return values
+
+    def dump_variable(self, values: dict[str, Any]) -> bytes:
+        """Pickle the variable fields.
+
+        :return: The data.
+        :raise ValueError: If the data exceeds the capacity.
+        """
+        data = dumps(
+            {name: values[name] for name in self.variable_names},
+            HIGHEST_PROTOCOL,
+        )
+
+        if len(data) > self.variable_capacity:
+            raise ValueError('variable fields exceed their capacity')
+
+        return data
+
+    def pack_variable(self, buffer: Any, data: bytes) -> None:
+        offset = self.offset + self.HEADER.size + self.fixed_struct.size
+        buffer[offset:offset + len(data)] = data
+
+    def copy_variable(self, buffer: Any, length: int) -> bytes:
+        if not self.variable_names:
+            return dumps({})
+
+        offset = self.offset + self.HEADER.size + self.fixed_struct.size
+
+        return bytes(buffer[offset:offset + length])
+
+
+@dataclass
+class ContextsSubscription:
+    """A subscription to changes of some fields of the contexts.
+
+    >>> from dataclasses import make_dataclass
+    >>> door = ContextsDoor(
+    ...     make_dataclass('', [('motor_velocity', float)])(0),
+    ... )
+    >>> subscription = door.subscribe('motor_velocity')
+    >>> subscription.wait(0)
+    set()
+    >>> with door(Partition.MOTOR) as contexts:
+    ...     contexts.motor_velocity = 1
+    >>> subscription.wait(0)
+    {'motor_velocity'}
+    >>> subscription.close()
+    """
+
+    door: ContextsDoor
+    names: frozenset[str]
+    _event: Event = field(default_factory=Event, init=False)
+    _versions: dict[str, int] = field(default_factory=dict, init=False)
+
+    def wait(self, timeout: float | None = None) -> set[str]:
+        """Wait until any of the fields changes.
+
+        The wait may end early without any change.
+
+        :return: The names of the fields changed since the last wait.
+        """
+        self._event.wait(timeout)
+        self._event.clear()
+
+        return self.door._get_changed_names(self._versions)
+
+    def wake(self) -> None:
+        """End the current or next wait early, such as on a stoppage.
+
+        :return: ``None``.
+        """
+        self._event.set()
+
+    def close(self) -> None:
+        self.door.unsubscribe(self)
 
 
 @dataclass(frozen=True)
 class Peripheries:
+    """The peripheries used by the applications.
+
+    The peripheries may be given as placeholders from an
+    :class:`revolution.initializer.Initializer`, which is then started.
+    Accessing such a periphery waits until it is initialized, so that
+    each application only waits for the peripheries it uses.
+    """
+
     # General
 
-    general_can_bus: BusABC
+    general_can_bus: 'BusABC'
+
+    # CAN Reader
 
     # Debugger
 
@@ -254,7 +1687,7 @@ class Peripheries:
 
     driver_steering_wheel: SteeringWheel
 
-    driver_pedals_adc78h89: ADC78H89
+    driver_pedals_adc78h89: 'ADC78H89'
 
     driver_general_unused_switch_prbs: PRBS
 
@@ -264,7 +1697,7 @@ class Peripheries:
     driver_miscellaneous_daytime_running_lights_switch_prbs: PRBS
     driver_miscellaneous_horn_switch_prbs: PRBS
     driver_miscellaneous_backup_camera_control_switch_prbs: PRBS
-    driver_miscellaneous_brake_switch_gpio: GPIO
+    driver_miscellaneous_brake_switch_gpio: 'GPIO'
 
     driver_motor_cruise_control_velocity_rotary_encoder_a_prbs: PRBS
     driver_motor_cruise_control_velocity_rotary_encoder_b_prbs: PRBS
@@ -273,49 +1706,149 @@ class Peripheries:
     driver_motor_variable_field_magnet_up_switch_prbs: PRBS
     driver_motor_variable_field_magnet_down_switch_prbs: PRBS
     driver_motor_cruise_control_switch_prbs: PRBS
-    driver_motor_acceleration_input_input_channel: InputChannel
+    driver_motor_acceleration_input_input_channel: 'InputChannel'
 
     driver_power_array_relay_switch_prbs: PRBS
     driver_power_battery_relay_switch_prbs: PRBS
 
     # Miscellaneous
 
-    miscellaneous_left_indicator_light_pwm: PWM
-    miscellaneous_right_indicator_light_pwm: PWM
-    miscellaneous_daytime_running_lights_pwm: PWM
-    miscellaneous_brake_lights_pwm: PWM
-    miscellaneous_backup_camera_control_switch_gpio: GPIO
-    miscellaneous_imu_bno055: BNO055
-    miscellaneous_gps: GPS
-    miscellaneous_front_wheels_i2c_mux: PCA9546A
-    miscellaneous_left_wheel_accelerometer: LIS2HH12
-    miscellaneous_right_wheel_accelerometer: LIS2HH12
+    miscellaneous_left_indicator_light_pwm: 'PWM'
+    miscellaneous_right_indicator_light_pwm: 'PWM'
+    miscellaneous_daytime_running_lights_pwm: 'PWM'
+    miscellaneous_brake_lights_pwm: 'PWM'
+    miscellaneous_backup_camera_control_switch_gpio: 'GPIO'
+    miscellaneous_imu_bno055: 'BNO055'
+    miscellaneous_gps: 'GPS'
+    miscellaneous_front_wheels_i2c_mux: 'PCA9546A'
+    miscellaneous_left_wheel_accelerometer: 'LIS2HH12'
+    miscellaneous_right_wheel_accelerometer: 'LIS2HH12'
 
     # Motor
 
-    motor_wavesculptor22: WaveSculptor22
+    motor_wavesculptor22: 'WaveSculptor22'
 
-    motor_variable_field_magnet_direction_gpio: GPIO
-    motor_variable_field_magnet_stall_gpio: GPIO
-    motor_variable_field_magnet_encoder_a_gpio: GPIO
-    motor_variable_field_magnet_encoder_b_gpio: GPIO
-    motor_variable_field_magnet_enable_gpio: GPIO
+    motor_variable_field_magnet_direction_gpio: 'GPIO'
+    motor_variable_field_magnet_stall_gpio: 'GPIO'
+    motor_variable_field_magnet_encoder_a_gpio: 'GPIO'
+    motor_variable_field_magnet_encoder_b_gpio: 'GPIO'
+    motor_variable_field_magnet_enable_gpio: 'GPIO'
 
     # Power
 
-    power_array_relay_low_side_gpio: GPIO
-    power_array_relay_high_side_gpio: GPIO
-    power_array_relay_pre_charge_gpio: GPIO
-    power_point_tracking_switch_1_gpio: GPIO
-    power_point_tracking_switch_2_gpio: GPIO
+    power_array_relay_low_side_gpio: 'GPIO'
+    power_array_relay_high_side_gpio: 'GPIO'
+    power_array_relay_pre_charge_gpio: 'GPIO'
+    power_point_tracking_switch_1_gpio: 'GPIO'
+    power_point_tracking_switch_2_gpio: 'GPIO'
     power_battery_management_system: BatteryManagementSystem
-    power_psm_motor_ina229: INA229
-    power_psm_battery_ina229: INA229
-    power_psm_array_ina229: INA229
+    power_psm_motor_ina229: 'INA229'
+    power_psm_battery_ina229: 'INA229'
+    power_psm_array_ina229: 'INA229'
 
     # Telemetry
 
-    telemetry_radio_serial: Serial
+    telemetry_radio_serial: 'Serial'
+
+    __initializations: dict[str, Initialization[Any]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    __failures: set[tuple[str, str]] = field(default_factory=set, init=False)
+
+    def __post_init__(self) -> None:
+        for field_ in fields(self):
+            value = self.__dict__.get(field_.name)
+
+            if isinstance(value, Initialization):
+                object.__delattr__(self, field_.name)
+
+                self.__initializations[field_.name] = value
+
+        for initialization in self.__initializations.values():
+            initialization.initializer.start()
+
+    if not TYPE_CHECKING:
+        def __getattr__(self, name: str) -> Any:
+            if (
+                    name in (
+                        '_Peripheries__initializations',
+                        '_Peripheries__failures',
+                    )
+                    or name not in self.__initializations
+            ):
+                raise AttributeError(
+                    f'{repr(type(self).__name__)} object has no attribute'
+                    f' {repr(name)}',
+                )
+
+            try:
+                value = self.__initializations[name].result()
+            except RuntimeError as exception:
+                key = name, current_thread().name
+
+                if key not in self.__failures:
+                    self.__failures.add(key)
+
+                    _logger.error(
+                        (
+                            f'Periphery {repr(name)} used by {repr(key[1])}'
+                            ' failed to initialize'
+                        ),
+                    )
+
+                raise RuntimeError(
+                    f'periphery {repr(name)} failed to initialize',
+                ) from exception.__cause__
+
+            object.__setattr__(self, name, value)
+
+            return value
+
+    def wait_initializations(self, timeout: float | None = None) -> bool:
+        """Wait for the initializations of all peripheries to end.
+
+        Each initialized periphery replaces its placeholder. A periphery
+        that failed to initialize is logged and keeps its placeholder,
+        which raises when accessed, so that only the applications using
+        it are affected.
+
+        :return: ``True`` if all initializations ended, otherwise
+                 ``False``.
+        """
+        end_time = None if timeout is None else monotonic() + timeout
+
+        for name, initialization in list(self.__initializations.items()):
+            if not initialization.wait(
+                    None if end_time is None else end_time - monotonic(),
+            ):
+                return False
+
+            if name in self.__dict__:
+                continue
+
+            try:
+                value = initialization.result(0)
+            except RuntimeError:
+                _logger.error(f'Periphery {repr(name)} failed to initialize')
+            else:
+                object.__setattr__(self, name, value)
+
+        return True
+
+    def get_initialization_statistics(
+            self,
+    ) -> dict[str, InitializationStatistics]:
+        initializers = {
+            id(initialization.initializer): initialization.initializer
+            for initialization in self.__initializations.values()
+        }
+        statistics = {}
+
+        for initializer in initializers.values():
+            statistics.update(initializer.get_statistics())
+
+        return statistics
 
 
 @dataclass(frozen=True)
@@ -324,6 +1857,39 @@ class Settings:
 
     general_wheel_diameter: float
     general_log_filepath: str
+    general_queue_capacities: dict[Endpoint, int]
+    """The message queue capacities (``0`` or missing means unbounded)."""
+    general_queue_overflow_policies: dict[Endpoint, OverflowPolicy]
+    """The message queue overflow policies (missing means block)."""
+    general_process_queue_capacity: int
+    """The capacity of the queues to each other process when shared."""
+    general_process_queue_overflow_policy: OverflowPolicy
+    """The overflow policy of the queues to each other process."""
+    general_batch_size: int
+    """The maximum number of messages an application handles per wakeup."""
+    general_batch_timeout: float
+    """How long an application keeps collecting a batch (in seconds)."""
+    general_subscription_timeout: float
+    """The longest a worker waits for a contexts change (in seconds)."""
+    general_scheduler_thread_count: int
+    """The number of threads that run the periodic tasks."""
+    general_scheduler_sample_count: int
+    """The number of latest runs the task timing statistics cover."""
+    general_worker_restart_initial_delay: float
+    """The delay of the first restart of a failed worker (in seconds)."""
+    general_worker_restart_maximum_delay: float
+    """The longest delay between restarts of a worker (in seconds)."""
+    general_worker_restart_jitter: float
+    """The largest fraction a restart delay is shortened by at random."""
+    general_worker_restart_maximum_count: int
+    """The most restarts of a worker within the restart window."""
+    general_worker_restart_window: float
+    """The window the restarts of a worker are limited over (in seconds)."""
+
+    # CAN Reader
+
+    can_reader_timeout: float
+    can_reader_statistics_timeout: float
 
     # Debugger
     debugger_host: str
@@ -344,12 +1910,12 @@ class Settings:
 
     # Miscellaneous
 
-    miscellaneous_light_timeout: float
     miscellaneous_light_flash_timeout: float
     miscellaneous_imu_timeout: float
     miscellaneous_imu_mode_timeout: float
     miscellaneous_gps_timeout: float
     miscellaneous_front_wheels_timeout: float
+    miscellaneous_timing_log_timeout: float
 
     # Motor
 
@@ -373,12 +1939,15 @@ class Settings:
     power_array_relay_timeout: float
     power_point_tracking_timeout: float
     power_soc_timeout: float
+    power_soc_checkpoint_timeout: float
     power_psm_timeout: float
     power_steering_wheel_led_timeout: float
     power_log_timeout: float
 
-    power_battery: Battery
+    power_battery: 'Battery'
     power_battery_can_timeout: float
+    power_soc_checkpoint_filepath: str
+    power_soc_checkpoint_maximum_age: float
     power_disable_charging_battery_soc_threshold: float
     power_psm_motor_ina229_voltage_correction_factor: float
     power_psm_battery_ina229_voltage_correction_factor: float
@@ -388,29 +1957,93 @@ class Settings:
 
     telemetry_timeout: float
     telemetry_begin_token: bytes
-    telemetry_separator_token: bytes
     telemetry_end_token: bytes
+    telemetry_keyframe_interval: int
     telemetry_radio_frequency: int
     telemetry_radio_spreading_factor: int
     telemetry_radio_bandwidth: int
     telemetry_radio_code_rate: int
     telemetry_radio_preamble_length: int
     telemetry_radio_tx_power: int
+    telemetry_radio_maximum_payload_size: int
+    """The largest payload the radio sends in one packet (in bytes)."""
+    telemetry_radio_response_timeout: float
+    """How long the radio is waited for to answer (in seconds)."""
+    telemetry_radio_transmission_timeout: float
+    """How long the end of a transmission is waited for (in seconds)."""
+    telemetry_radio_maximum_retry_count: int
+    telemetry_radio_retry_delay: float
 
 
 @dataclass(frozen=True)
 class Environment:
-    contexts: AcquirableDoor[Contexts]
+    contexts: ContextsDoor
     peripheries: Peripheries
     settings: Settings
-    __queues: dict[Endpoint, Queue[Message]] = field(
+    __queues: dict[Endpoint, MessageQueue] = field(
+        default_factory=dict,
+        init=False,
+    )
+    __can_subscriptions: dict[int, tuple[Endpoint, ...]] = field(
         default_factory=dict,
         init=False,
     )
+    __can_subscriptions_lock: Lock = field(default_factory=Lock, init=False)
+    __scheduler: Scheduler = field(init=False)
+    __restart_policy: RestartPolicy = field(init=False)
+    __workers: list[Worker] = field(default_factory=list, init=False)
+    __workers_lock: Lock = field(default_factory=Lock, init=False)
+    __inboxes: list['Queue[tuple[_Delivery, Endpoint | None, Any]]'] = (
+        field(default_factory=list, init=False)
+    )
+    __outboxes: list[MessageQueue] = field(default_factory=list, init=False)
+    __process_indices: dict[Endpoint, int] = field(
+        default_factory=dict,
+        init=False,
+    )
+    __process_index: int = field(default=0, init=False)
 
     def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            '_Environment__restart_policy',
+            RestartPolicy(
+                self.settings.general_worker_restart_initial_delay,
+                self.settings.general_worker_restart_maximum_delay,
+                jitter=self.settings.general_worker_restart_jitter,
+                maximum_restart_count=(
+                    self.settings.general_worker_restart_maximum_count
+                ),
+                restart_window=self.settings.general_worker_restart_window,
+            ),
+        )
+        object.__setattr__(
+            self,
+            '_Environment__scheduler',
+            Scheduler(
+                self.settings.general_scheduler_thread_count,
+                self.settings.general_scheduler_sample_count,
+                self.__restart_policy,
+            ),
+        )
+
         for endpoint in Endpoint:
-            self.__queues[endpoint] = Queue()
+            self.__queues[endpoint] = MessageQueue(
+                self.settings.general_queue_capacities.get(endpoint, 0),
+                self.settings.general_queue_overflow_policies.get(
+                    endpoint,
+                    OverflowPolicy.BLOCK,
+                ),
+            )
+
+    def get_queue_statistics(self, endpoint: Endpoint) -> QueueStatistics:
+        return self.__queues[endpoint].statistics
+
+    def get_process_queue_statistics(
+            self,
+            process_index: int,
+    ) -> QueueStatistics:
+        return self.__outboxes[process_index].statistics
 
     def receive(
             self,
@@ -420,6 +2053,21 @@ class Environment:
     ) -> Message:
         return self.__queues[endpoint].get(block, timeout)
 
+    def receive_batch(
+            self,
+            endpoint: Endpoint,
+            count: int,
+            block: bool = True,
+            timeout: float | None = None,
+            batch_timeout: float = 0,
+    ) -> list[Message]:
+        return self.__queues[endpoint].get_batch(
+            count,
+            block,
+            timeout,
+            batch_timeout,
+        )
+
     def send(
             self,
             endpoint: Endpoint,
@@ -427,7 +2075,23 @@ class Environment:
             block: bool = True,
             timeout: float | None = None,
     ) -> None:
-        self.__queues[endpoint].put(message, block, timeout)
+        process_index = self.__process_indices.get(endpoint, 0)
+
+        if process_index == self.__process_index:
+            self.__queues[endpoint].put(message, block, timeout)
+        else:
+            self.__outboxes[process_index].put(
+                Message(
+                    message.header,
+                    (_Delivery.MESSAGE, endpoint, message),
+                    key=(
+                        None if message.key is None
+                        else (endpoint, message.key)
+                    ),
+                ),
+                block,
+                timeout,
+            )
 
     def send_all(
             self,
@@ -435,8 +2099,370 @@ class Environment:
             block: bool = True,
             timeout: float | None = None,
     ) -> None:
-        for queue in self.__queues.values():
-            queue.put(message, block, timeout)
+        for endpoint in Endpoint:
+            self.send(endpoint, message, block, timeout)
+
+    def subscribe_can(
+            self,
+            endpoint: Endpoint,
+            arbitration_ids: Iterable[int],
+    ) -> None:
+        """Subscribe the endpoint to the CAN messages of the arbitration
+        IDs.
+
+        If the environment is shared, the subscription is also announced
+        to the other processes, so that they only forward the CAN
+        messages subscribed to.
+
+        :return: ``None``.
+        """
+        arbitration_ids = tuple(arbitration_ids)
+
+        self._subscribe_can(endpoint, arbitration_ids)
+        self._announce(_Delivery.SUBSCRIPTION, endpoint, arbitration_ids)
+
+    def unsubscribe_can(self, endpoint: Endpoint) -> None:
+        self._unsubscribe_can(endpoint)
+        self._announce(_Delivery.UNSUBSCRIPTION, endpoint, None)
+
+    def _subscribe_can(
+            self,
+            endpoint: Endpoint,
+            arbitration_ids: Iterable[int],
+    ) -> None:
+        with self.__can_subscriptions_lock:
+            for arbitration_id in arbitration_ids:
+                endpoints = self.__can_subscriptions.get(arbitration_id, ())
+
+                if endpoint not in endpoints:
+                    self.__can_subscriptions[arbitration_id] = (
+                        endpoints + (endpoint,)
+                    )
+
+    def _unsubscribe_can(self, endpoint: Endpoint) -> None:
+        with self.__can_subscriptions_lock:
+            for arbitration_id, endpoints in tuple(
+                    self.__can_subscriptions.items(),
+            ):
+                if endpoint in endpoints:
+                    endpoints = tuple(
+                        other for other in endpoints if other != endpoint
+                    )
+
+                    if endpoints:
+                        self.__can_subscriptions[arbitration_id] = endpoints
+                    else:
+                        del self.__can_subscriptions[arbitration_id]
+
+    def _announce(
+            self,
+            delivery: _Delivery,
+            endpoint: Endpoint,
+            arbitration_ids: tuple[int, ...] | None,
+    ) -> None:
+        process_index = self.__process_indices.get(endpoint, 0)
+
+        for other_process_index, inbox in enumerate(self.__inboxes):
+            if other_process_index != process_index:
+                inbox.put((delivery, endpoint, arbitration_ids))
+
+    def get_can_subscribers(self, arbitration_id: int) -> tuple[Endpoint, ...]:
+        return self.__can_subscriptions.get(arbitration_id, ())
+
+    def send_can(
+            self,
+            can_message: 'CANMessage',
+            block: bool = True,
+            timeout: float | None = None,
+    ) -> list[Endpoint]:
+        """Send the CAN message to the endpoints subscribed to its
+        arbitration ID.
+
+        If the environment is shared, the message is forwarded once to
+        each other process with a subscribed endpoint, through the queue
+        to that process, which sends it to its own subscribers.
+
+        :return: The endpoints that dropped the message, including those
+                 of the processes whose queue dropped it.
+        """
+        endpoints = self.__can_subscriptions.get(can_message.arbitration_id)
+
+        if not endpoints:
+            return []
+
+        message = Message(
+            Header.CAN,
+            (can_message,),
+            key=can_message.arbitration_id,
+        )
+
+        if not self.__outboxes:
+            return self._dispatch_can(message, endpoints, block, timeout)
+
+        local_endpoints = []
+        process_endpoints: dict[int, list[Endpoint]] = {}
+
+        for endpoint in endpoints:
+            process_index = self.__process_indices.get(endpoint, 0)
+
+            if process_index == self.__process_index:
+                local_endpoints.append(endpoint)
+            else:
+                process_endpoints.setdefault(process_index, []).append(
+                    endpoint,
+                )
+
+        dropped_endpoints = self._dispatch_can(
+            message,
+            local_endpoints,
+            block,
+            timeout,
+        )
+
+        for process_index, endpoints_ in process_endpoints.items():
+            try:
+                dropped = self.__outboxes[process_index].put(
+                    Message(
+                        Header.CAN,
+                        (_Delivery.CAN, None, can_message),
+                        key=can_message.arbitration_id,
+                    ),
+                    block,
+                    timeout,
+                )
+            except Full:
+                dropped = True
+
+            if dropped:
+                dropped_endpoints.extend(endpoints_)
+
+        return dropped_endpoints
+
+    def _dispatch_can(
+            self,
+            message: Message,
+            endpoints: Iterable[Endpoint],
+            block: bool = True,
+            timeout: float | None = None,
+    ) -> list[Endpoint]:
+        dropped_endpoints = []
+
+        for endpoint in endpoints:
+            try:
+                dropped = self.__queues[endpoint].put(message, block, timeout)
+            except Full:
+                dropped = True
+
+            if dropped:
+                dropped_endpoints.append(endpoint)
+
+        return dropped_endpoints
+
+    def schedule(
+            self,
+            target: Callable[[], object],
+            period: float,
+            name: str | None = None,
+            dedicated: bool = False,
+            restart_policy: RestartPolicy | None = None,
+    ) -> PeriodicTask:
+        return self.__scheduler.schedule(
+            target,
+            period,
+            name,
+            dedicated=dedicated,
+            restart_policy=restart_policy,
+        )
+
+    def get_task_statistics(self) -> dict[str, TaskStatistics]:
+        return self.__scheduler.get_task_statistics()
+
+    def create_worker(
+            self,
+            target: Callable[[], object],
+            stoppage: Event | None = None,
+            name: str | None = None,
+            daemon: bool | None = None,
+    ) -> Worker:
+        """Create a worker restarted according to the settings.
+
+        :param stoppage: The event that stops the restarts once set.
+        :return: The worker, which is yet to be started.
+        """
+        worker = Worker(
+            target=target,
+            name=name,
+            daemon=daemon,
+            restart_policy=self.__restart_policy,
+            stoppage=stoppage,
+        )
+
+        with self.__workers_lock:
+            self.__workers.append(worker)
+
+        return worker
+
+    def get_worker_statistics(self) -> dict[str, WorkerStatistics]:
+        with self.__workers_lock:
+            workers = self.__workers.copy()
+
+        return {worker.name: worker.statistics for worker in workers}
+
+    def get_initialization_statistics(
+            self,
+    ) -> dict[str, InitializationStatistics]:
+        return self.peripheries.get_initialization_statistics()
+
+    def share(self, *endpoint_groups: Iterable[Endpoint]) -> None:
+        """Prepare the environment to be shared by forked processes.
+
+        The messages to each group of endpoints are received by its own
+        process, numbered from ``1`` in order, while the messages to the
+        other endpoints are received by process ``0``, the current one.
+        Messages to endpoints of other processes are passed through
+        inter-process queues and the contexts are moved into shared
+        memory, see :meth:`ContextsDoor.share`.
+
+        The messages to each other process are first queued in a
+        message queue with the capacity and overflow policy of the
+        settings, which a thread moves into the bounded inter-process
+        queue, so that a slow process only makes its messages dropped or
+        coalesced.
+
+        This must be called before any process is forked. Each process
+        must then call :meth:`attach` before sending messages.
+
+        :return: ``None``.
+        """
+        context = get_context('fork')
+        capacity = self.settings.general_process_queue_capacity
+
+        self.contexts.share()
+
+        for i, endpoints in enumerate(((), *endpoint_groups)):
+            for endpoint in endpoints:
+                self.__process_indices[endpoint] = i
+
+            self.__inboxes.append(context.Queue(capacity))
+            self.__outboxes.append(
+                MessageQueue(
+                    capacity,
+                    self.settings.general_process_queue_overflow_policy,
+                ),
+            )
+
+    def attach(self, process_index: int) -> None:
+        """Attach the current process to the shared environment.
+
+        :param process_index: The number of the process.
+        :return: ``None``.
+        """
+        object.__setattr__(self, '_Environment__process_index', process_index)
+
+        threads = [
+            Thread(
+                target=self._forward,
+                args=(self.__inboxes[process_index],),
+                name=f'{type(self).__name__}._forward',
+                daemon=True,
+            ),
+        ]
+
+        for other_process_index, (inbox, outbox) in enumerate(
+                zip(self.__inboxes, self.__outboxes),
+        ):
+            if other_process_index != process_index:
+                threads.append(
+                    Thread(
+                        target=self._deliver,
+                        args=(outbox, inbox),
+                        name=f'{type(self).__name__}._deliver',
+                        daemon=True,
+                    ),
+                )
+
+        for thread in threads:
+            thread.start()
+
+    def detach(self, timeout: float | None = None) -> bool:
+        """Wait until the messages sent to the other processes are
+        passed to their inter-process queues, so that they are not lost
+        when the current process exits.
+
+        :param timeout: The longest wait (in seconds).
+        :return: ``True`` if the messages are passed, otherwise
+                 ``False``.
+        """
+        events = []
+
+        for process_index, outbox in enumerate(self.__outboxes):
+            if process_index != self.__process_index:
+                event = Event()
+
+                outbox.put(
+                    Message(Header.STOP, (_Delivery.FLUSH, None, event)),
+                )
+                events.append(event)
+
+        end_time = None if timeout is None else monotonic() + timeout
+
+        for event in events:
+            if end_time is not None:
+                timeout = max(end_time - monotonic(), 0)
+
+            if not event.wait(timeout):
+                return False
+
+        return True
+
+    def _deliver(
+            self,
+            outbox: MessageQueue,
+            inbox: 'Queue[tuple[_Delivery, Endpoint | None, Any]]',
+    ) -> None:
+        while True:
+            delivery, endpoint, payload = outbox.get().args
+
+            if delivery == _Delivery.FLUSH:
+                payload.set()
+            else:
+                inbox.put((delivery, endpoint, payload))
+
+    def _forward(
+            self,
+            inbox: 'Queue[tuple[_Delivery, Endpoint | None, Any]]',
+    ) -> None:
+        while True:
+            delivery, endpoint, payload = inbox.get()
+
+            if delivery == _Delivery.MESSAGE:
+                assert endpoint is not None
+
+                self.__queues[endpoint].put(payload)
+            elif delivery == _Delivery.CAN:
+                arbitration_id = payload.arbitration_id
+
+                self._dispatch_can(
+                    Message(Header.CAN, (payload,), key=arbitration_id),
+                    (
+                        endpoint
+                        for endpoint in self.get_can_subscribers(
+                            arbitration_id,
+                        )
+                        if (
+                            self.__process_indices.get(endpoint, 0)
+                            == self.__process_index
+                        )
+                    ),
+                )
+            elif delivery == _Delivery.SUBSCRIPTION:
+                assert endpoint is not None
+
+                self._subscribe_can(endpoint, payload)
+            elif delivery == _Delivery.UNSUBSCRIPTION:
+                assert endpoint is not None
+
+                self._unsubscribe_can(endpoint)
 
     def stop(self, block: bool = True, timeout: float | None = None) -> None:
         self.send_all(Message(Header.STOP))
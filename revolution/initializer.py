@@ -0,0 +1,286 @@
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from logging import getLogger
+from sys import exc_info
+from threading import Condition, Event, Thread
+from time import monotonic
+from typing import Any, cast, Generic, TypeVar
+
+_logger = getLogger(__name__)
+_T = TypeVar('_T')
+
+
+@dataclass(frozen=True)
+class InitializationStatistics:
+    name: str
+    dependencies: tuple[str, ...]
+    start_time: float | None
+    """When the initialization started (in seconds since the initializer
+    started)."""
+    initialization_time: float | None
+    """How long the initialization took (in seconds)."""
+    exception: str | None
+    """The representation of the error raised by the initialization."""
+
+
+@dataclass(eq=False)
+class Initialization(Generic[_T]):
+    """A placeholder for an object created by an :class:`Initializer`.
+
+    The placeholders passed as arguments to the factory are the
+    dependencies of the initialization, and are replaced by the objects
+    they stand for before the factory is called.
+    """
+
+    initializer: 'Initializer'
+    name: str
+    factory: Callable[..., _T]
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    dependencies: tuple['Initialization[Any]', ...] = field(init=False)
+    _dependents: list['Initialization[Any]'] = field(
+        default_factory=list,
+        init=False,
+    )
+    _remaining_count: int = field(init=False)
+    _completion: Event = field(default_factory=Event, init=False)
+    _value: _T | None = field(default=None, init=False)
+    _exception: BaseException | None = field(default=None, init=False)
+    _start_time: float | None = field(default=None, init=False)
+    _end_time: float | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        self.dependencies = tuple(
+            value
+            for value in (*self.args, *self.kwargs.values())
+            if isinstance(value, Initialization)
+        )
+        self._remaining_count = len(self.dependencies)
+
+        for dependency in self.dependencies:
+            dependency._dependents.append(self)
+
+    @property
+    def statistics(self) -> InitializationStatistics:
+        start_time = None
+        initialization_time = None
+
+        if self._start_time is not None:
+            assert self.initializer._start_time is not None
+
+            start_time = self._start_time - self.initializer._start_time
+
+            if self._end_time is not None:
+                initialization_time = self._end_time - self._start_time
+
+        return InitializationStatistics(
+            self.name,
+            tuple(dependency.name for dependency in self.dependencies),
+            start_time,
+            initialization_time,
+            None if self._exception is None else repr(self._exception),
+        )
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for the initialization to end.
+
+        :return: ``True`` if the initialization ended, otherwise
+                 ``False``.
+        """
+        return self._completion.wait(timeout)
+
+    def result(self, timeout: float | None = None) -> _T:
+        """Wait for the initialization to end and return the object.
+
+        :return: The object.
+        :raise TimeoutError: If the initialization did not end in time.
+        :raise RuntimeError: If the initialization failed.
+        """
+        if not self.wait(timeout):
+            raise TimeoutError(f'{repr(self.name)} is not initialized')
+
+        if self._exception is not None:
+            raise RuntimeError(
+                f'{repr(self.name)} failed to initialize',
+            ) from self._exception
+
+        return cast(_T, self._value)
+
+    def _run(self) -> None:
+        self._start_time = monotonic()
+
+        try:
+            args = [self._resolve(value) for value in self.args]
+            kwargs = {
+                key: self._resolve(value)
+                for key, value in self.kwargs.items()
+            }
+            self._value = self.factory(*args, **kwargs)
+        except:  # noqa: E722
+            self._exception = exc_info()[1]
+
+            _logger.exception(f'Failed to initialize {repr(self.name)}')
+        else:
+            _logger.info(
+                (
+                    f'Initialized {repr(self.name)} in'
+                    f' {monotonic() - self._start_time:.3f} seconds'
+                ),
+            )
+
+        self._end_time = monotonic()
+
+        self._completion.set()
+
+    @staticmethod
+    def _resolve(value: Any) -> Any:
+        if isinstance(value, Initialization):
+            value = value.result(0)
+
+        return value
+
+
+@dataclass
+class Initializer:
+    """An initializer that creates objects concurrently on a small pool
+    of threads.
+
+    Each object is created as soon as the objects it depends on are,
+    which is useful for peripheries whose setup mostly waits on
+    hardware.
+
+    >>> from time import sleep
+    >>> initializer = Initializer()
+    >>> def create(name, *args):
+    ...     sleep(0.01)
+    ...     return name, args
+    >>> a = initializer.initialize('a', create, 'a')
+    >>> b = initializer.initialize('b', create, 'b')
+    >>> c = initializer.initialize('c', create, 'c', a, b)
+    >>> initializer.start()
+    >>> initializer.join()
+    True
+    >>> c.result()
+    ('c', (('a', ()), ('b', ())))
+    >>> initializer.get_statistics()['c'].dependencies
+    ('a', 'b')
+    """
+
+    thread_count: int = 8
+    _initializations: list[Initialization[Any]] = field(
+        default_factory=list,
+        init=False,
+    )
+    _queue: deque[Initialization[Any]] = field(
+        default_factory=deque,
+        init=False,
+    )
+    _pending_count: int = field(default=0, init=False)
+    _condition: Condition = field(default_factory=Condition, init=False)
+    _threads: list[Thread] = field(default_factory=list, init=False)
+    _start_time: float | None = field(default=None, init=False)
+
+    def initialize(
+            self,
+            name: str,
+            factory: Callable[..., _T],
+            /,
+            *args: Any,
+            **kwargs: Any,
+    ) -> _T:
+        """Add an object to create once the initializer starts.
+
+        The returned placeholder is typed as the object so that it can
+        be passed where the object is expected, such as to other
+        initializations or to :class:`revolution.environment.Peripheries`.
+
+        :param name: The name of the object.
+        :param factory: The callable that creates the object.
+        :return: The placeholder of the object.
+        :raise ValueError: If the initializer already started.
+        """
+        with self._condition:
+            if self._start_time is not None:
+                raise ValueError('initializer already started')
+
+            initialization = Initialization(self, name, factory, args, kwargs)
+
+            self._initializations.append(initialization)
+
+        return cast(_T, initialization)
+
+    def start(self) -> None:
+        """Start the initializations, unless already started.
+
+        :return: ``None``.
+        """
+        with self._condition:
+            if self._start_time is not None:
+                return
+
+            self._start_time = monotonic()
+            self._pending_count = len(self._initializations)
+
+            self._queue.extend(
+                initialization
+                for initialization in self._initializations
+                if not initialization.dependencies
+            )
+
+            for i in range(
+                    min(self.thread_count, len(self._initializations)),
+            ):
+                thread = Thread(
+                    target=self._run,
+                    name=f'{type(self).__name__}-{i}',
+                    daemon=True,
+                )
+
+                thread.start()
+                self._threads.append(thread)
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Wait for all initializations to end.
+
+        :return: ``True`` if all initializations ended, otherwise
+                 ``False``.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending_count,
+                timeout,
+            )
+
+    def get_statistics(self) -> dict[str, InitializationStatistics]:
+        with self._condition:
+            initializations = self._initializations.copy()
+
+        return {
+            initialization.name: initialization.statistics
+            for initialization in initializations
+        }
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and self._pending_count:
+                    self._condition.wait()
+
+                if not self._queue:
+                    return
+
+                initialization = self._queue.popleft()
+
+            initialization._run()
+
+            with self._condition:
+                self._pending_count -= 1
+
+                for dependent in initialization._dependents:
+                    dependent._remaining_count -= 1
+
+                    if not dependent._remaining_count:
+                        self._queue.append(dependent)
+
+                self._condition.notify_all()
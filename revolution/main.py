@@ -1,14 +1,15 @@
 from argparse import ArgumentParser, BooleanOptionalAction, Namespace
 from code import interact
 from datetime import datetime
+from collections.abc import Iterable
 from logging import basicConfig, DEBUG, getLogger, INFO
+from multiprocessing import get_context
 from sys import stderr, stdin
 from threading import Thread
 from typing import Any
 
-from door.threading2 import AcquirableDoor
-
-from revolution.environment import Environment
+from revolution.application import Application
+from revolution.environment import ContextsDoor, Environment
 
 _logger = getLogger(__name__)
 
@@ -39,10 +40,60 @@ def parse_args() -> Namespace:
         action=BooleanOptionalAction,
         help='interactive mode (disabled by default)',
     )
+    parser.add_argument(
+        '-p',
+        '--profile',
+        action=BooleanOptionalAction,
+        help='contexts lock profiling mode (disabled by default)',
+    )
+    parser.add_argument(
+        '-m',
+        '--multiprocessing',
+        help='run the named applications each in its own process (disabled '
+             'by default)',
+        nargs='+',
+        metavar='APPLICATION',
+    )
 
     return parser.parse_args()
 
 
+def _create_threads(
+        environment: Environment,
+        application_types: Iterable[type[Application]],
+) -> list[Thread]:
+    threads = []
+
+    for application_type in application_types:
+        thread = Thread(
+            target=application_type.main,
+            name=application_type.__name__,
+            args=(environment,),
+        )
+
+        threads.append(thread)
+
+    return threads
+
+
+def _run_process(
+        environment: Environment,
+        process_index: int,
+        application_type: type[Application],
+) -> None:
+    environment.attach(process_index)
+
+    threads = _create_threads(environment, (application_type,))
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    environment.detach()
+
+
 def main(configurations: Any) -> None:
     args = parse_args()
     log_level = DEBUG if args.debug else INFO
@@ -51,16 +102,51 @@ def main(configurations: Any) -> None:
     _logger.info('Launching revolution...')
 
     environment = Environment(
-        AcquirableDoor(configurations.CONTEXTS),
+        ContextsDoor(configurations.CONTEXTS, bool(args.profile)),
         configurations.PERIPHERIES,
         configurations.SETTINGS,
     )
-    threads = []
+    application_types = {
+        application_type.__name__: application_type
+        for application_type in configurations.APPLICATION_TYPES
+    }
+    process_application_types = []
 
-    for application_type in configurations.APPLICATION_TYPES:
-        thread = Thread(target=application_type.main, args=(environment,))
+    for name in args.multiprocessing or ():
+        if name not in application_types:
+            raise ValueError(f'unknown application {repr(name)}')
 
-        threads.append(thread)
+        process_application_types.append(application_types.pop(name))
+
+    processes = []
+
+    if process_application_types:
+        context = get_context('fork')
+
+        environment.peripheries.wait_initializations()
+
+        environment.share(
+            *(
+                (application_type.endpoint,)
+                for application_type in process_application_types
+            ),
+        )
+
+        for i, application_type in enumerate(process_application_types):
+            process = context.Process(
+                target=_run_process,
+                name=application_type.__name__,
+                args=(environment, i + 1, application_type),
+            )
+
+            processes.append(process)
+
+        for process in processes:
+            process.start()
+
+        environment.attach(0)
+
+    threads = _create_threads(environment, application_types.values())
 
     for thread in threads:
         thread.start()
@@ -80,3 +166,12 @@ def main(configurations: Any) -> None:
 
     for thread in threads:
         thread.join()
+
+    if processes:
+        environment.detach()
+
+    for process in processes:
+        process.join()
+
+    if processes:
+        environment.contexts.unshare()
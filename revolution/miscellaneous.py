@@ -3,15 +3,15 @@ from datetime import datetime
 from logging import getLogger
 from os import makedirs
 from time import sleep, strftime, struct_time
-from typing import ClassVar
+from typing import Any, ClassVar
 
 from periphery import PWM, I2CError
 
 from iclib.bno055 import OperationMode, Register, Unit
 from iclib.lis2hh12 import LIS2HH12
 from revolution.application import Application
-from revolution.environment import Contexts, Endpoint
-from revolution.worker import Worker
+from revolution.environment import Contexts, Endpoint, Partition
+from revolution.utilities import AggregateArray, FlagArray
 
 _logger = getLogger(__name__)
 
@@ -23,12 +23,46 @@ class Miscellaneous(Application):
     def _setup(self) -> None:
         super()._setup()
 
-        self._light_worker = Worker(target=self._light)
-        self._indicator_light_worker = Worker(target=self._indicator_light)
-        self._imu_worker = Worker(target=self._imu)
-        self._gps_worker = Worker(target=self._gps)
-        self._front_wheels_worker = Worker(target=self._front_wheels)
-        self._runtime_log_worker = Worker(target=self._runtime_log)
+        self._light_subscription = self._subscribe(
+            'miscellaneous_daytime_running_lights_status_input',
+            'miscellaneous_horn_status_input',
+            'miscellaneous_backup_camera_control_status_input',
+            'miscellaneous_brake_status_input',
+            'motor_regeneration_status_input',
+        )
+        self._indicator_light_subscription = self._subscribe(
+            'miscellaneous_left_indicator_light_status_input',
+            'miscellaneous_right_indicator_light_status_input',
+            'miscellaneous_hazard_lights_status_input',
+        )
+        self._light_worker = self.environment.create_worker(
+            self._light,
+            self._stoppage,
+        )
+        self._indicator_light_worker = self.environment.create_worker(
+            self._indicator_light,
+            self._stoppage,
+        )
+        self._imu_worker = self.environment.create_worker(
+            self._imu,
+            self._stoppage,
+        )
+        self._gps_worker = self.environment.create_worker(
+            self._gps,
+            self._stoppage,
+        )
+        self._front_wheels_worker = self.environment.create_worker(
+            self._front_wheels,
+            self._stoppage,
+        )
+        self._runtime_log_worker = self.environment.create_worker(
+            self._runtime_log,
+            self._stoppage,
+        )
+        self._timing_log_worker = self.environment.create_worker(
+            self._timing_log,
+            self._stoppage,
+        )
 
         self._light_worker.start()
         self._indicator_light_worker.start()
@@ -36,6 +70,7 @@ class Miscellaneous(Application):
         self._gps_worker.start()
         # self._front_wheels_worker.start()
         self._runtime_log_worker.start()
+        self._timing_log_worker.start()
 
     def _teardown(self) -> None:
         self._light_worker.join()
@@ -44,6 +79,9 @@ class Miscellaneous(Application):
         self._gps_worker.join()
         # self._front_wheels_worker.join()
         self._runtime_log_worker.join()
+        self._timing_log_worker.join()
+        self._light_subscription.close()
+        self._indicator_light_subscription.close()
 
     def update_pwm(self, pwm: PWM, previous_input: bool, input: bool) -> None:
         if not previous_input and input:
@@ -57,12 +95,11 @@ class Miscellaneous(Application):
         previous_backup_camera_control_status_input = False
         previous_brake_lights_status_input = False
 
-        while (
-                not self._stoppage.wait(
-                    self.environment.settings.miscellaneous_light_timeout,
-                )
-        ):
-            with self.environment.contexts() as contexts:
+        while not self._stoppage.is_set():
+            with self.environment.contexts(
+                    Partition.MISCELLANEOUS,
+                    Partition.MOTOR,
+            ) as contexts:
                 daytime_running_lights_status_input = (
                     contexts.miscellaneous_daytime_running_lights_status_input
                 )
@@ -127,6 +164,10 @@ class Miscellaneous(Application):
                 backup_camera_control_status_input
             )
 
+            self._light_subscription.wait(
+                self.environment.settings.general_subscription_timeout,
+            )
+
     def _indicator_light(self) -> None:
         previous_left_indicator_light_status_input = False
         previous_right_indicator_light_status_input = False
@@ -134,15 +175,10 @@ class Miscellaneous(Application):
         previous_flash_status = False
         flash_status = False
 
-        while (
-                not self._stoppage.wait(
-                    self
-                    .environment
-                    .settings
-                    .miscellaneous_light_flash_timeout,
-                )
-        ):
-            with self.environment.contexts() as contexts:
+        while not self._stoppage.is_set():
+            with self.environment.contexts(
+                    Partition.MISCELLANEOUS,
+            ) as contexts:
                 left_indicator_light_status_input = (
                     contexts.miscellaneous_left_indicator_light_status_input
                 )
@@ -153,7 +189,12 @@ class Miscellaneous(Application):
                     contexts.miscellaneous_hazard_lights_status_input
                 )
 
-            flash_status = not flash_status
+            indicator_light_status_input = (
+                left_indicator_light_status_input
+                or right_indicator_light_status_input
+                or hazard_lights_status_input
+            )
+            flash_status = indicator_light_status_input and not flash_status
 
             self.update_pwm(
                 (
@@ -228,6 +269,18 @@ class Miscellaneous(Application):
             previous_hazard_lights_status_input = hazard_lights_status_input
             previous_flash_status = flash_status
 
+            if indicator_light_status_input:
+                self._stoppage.wait(
+                    self
+                    .environment
+                    .settings
+                    .miscellaneous_light_flash_timeout,
+                )
+            else:
+                self._indicator_light_subscription.wait(
+                    self.environment.settings.general_subscription_timeout,
+                )
+
     def _imu(self) -> None:
         def imu_config() -> None:
             self.environment.peripheries.miscellaneous_imu_bno055.reset2()
@@ -273,7 +326,9 @@ class Miscellaneous(Application):
                     angular_velocity = asdict(bno055.angular_velocity)
                     linear_acceleration = asdict(bno055.linear_acceleration)
 
-                    with self.environment.contexts() as contexts:
+                    with self.environment.contexts(
+                            Partition.MISCELLANEOUS,
+                    ) as contexts:
                         contexts.miscellaneous_orientation.update(orientation)
                         contexts.miscellaneous_angular_velocity.update(
                             angular_velocity,
@@ -292,7 +347,9 @@ class Miscellaneous(Application):
                 except I2CError:
                     imu_working = False
 
-            with self.environment.contexts() as contexts:
+            with self.environment.contexts(
+                    Partition.MISCELLANEOUS,
+            ) as contexts:
                 contexts.miscellaneous_imu_working = imu_working
 
     def _gps(self) -> None:
@@ -314,7 +371,9 @@ class Miscellaneous(Application):
         ):
             periphery.update()
 
-            with self.environment.contexts() as contexts:
+            with self.environment.contexts(
+                    Partition.MISCELLANEOUS,
+            ) as contexts:
                 if periphery.has_fix:
                     if periphery.latitude is not None:
                         contexts.miscellaneous_latitude = periphery.latitude
@@ -407,7 +466,9 @@ class Miscellaneous(Application):
             now = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
             log_file = open(f'{filepath}{now}_front_wheel_log.csv', 'w')
             print('time, ', end='', file=log_file)
-            with self.environment.contexts() as contexts:
+            with self.environment.contexts(
+                    Partition.MISCELLANEOUS,
+            ) as contexts:
                 for field in fields(FrontWheelLogData):
                     if isinstance(getattr(contexts, field.name), dict):
                         for k in getattr(contexts, field.name).keys():
@@ -444,7 +505,9 @@ class Miscellaneous(Application):
                         .miscellaneous_left_wheel_accelerometer
                         .read_acceleration()
                     )
-                    with self.environment.contexts() as contexts:
+                    with self.environment.contexts(
+                            Partition.MISCELLANEOUS,
+                    ) as contexts:
                         contexts.miscellaneous_left_wheel_accelerations = [
                             left_accel.x,
                             left_accel.y,
@@ -470,7 +533,9 @@ class Miscellaneous(Application):
                         .miscellaneous_right_wheel_accelerometer
                         .read_acceleration()
                     )
-                    with self.environment.contexts() as contexts:
+                    with self.environment.contexts(
+                            Partition.MISCELLANEOUS,
+                    ) as contexts:
                         contexts.miscellaneous_right_wheel_accelerations = [
                             right_accel.x,
                             right_accel.y,
@@ -486,7 +551,9 @@ class Miscellaneous(Application):
                 except I2CError:
                     right_wheel_accel_working = False
 
-            with self.environment.contexts() as contexts:
+            with self.environment.contexts(
+                    Partition.MISCELLANEOUS,
+            ) as contexts:
                 contexts.miscellaneous_left_wheel_accelerometer_working = (
                     left_wheel_accel_working
                 )
@@ -498,7 +565,9 @@ class Miscellaneous(Application):
                 continue
 
             print(f'{datetime.now().time()}, ', end='', file=log_file)
-            with self.environment.contexts() as contexts:
+            with self.environment.contexts(
+                    Partition.MISCELLANEOUS,
+            ) as contexts:
                 for field in fields(FrontWheelLogData):
                     if isinstance(getattr(contexts, field.name), dict):
                         for value in getattr(contexts, field.name).values():
@@ -532,17 +601,30 @@ class Miscellaneous(Application):
         now = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
         log_file = open(f'{filepath}{now}_runtime_log.csv', 'w')
 
+        # The dictionaries empty at first, whose keys are only known
+        # later, are logged as one column of ``key:value`` pairs.
+        keys: dict[str, tuple[Any, ...] | None] = {}
+
         print('time, ', end='', file=log_file)
-        with self.environment.contexts() as contexts:
-            for field in fields(Contexts):
-                if isinstance(getattr(contexts, field.name), dict):
-                    for key in getattr(contexts, field.name).keys():
-                        print(f'{field.name}.{key}, ', end='', file=log_file)
-                elif isinstance(getattr(contexts, field.name), list):
-                    for i in range(len(getattr(contexts, field.name))):
-                        print(f'{field.name}.{i}, ', end='', file=log_file)
-                else:
+        contexts = self.environment.contexts.snapshot()
+
+        for field in fields(Contexts):
+            if isinstance(getattr(contexts, field.name), dict):
+                keys[field.name] = tuple(getattr(contexts, field.name)) or None
+
+                if keys[field.name] is None:
                     print(f'{field.name}, ', end='', file=log_file)
+
+                for key in keys[field.name] or ():
+                    print(f'{field.name}.{key}, ', end='', file=log_file)
+            elif isinstance(
+                    getattr(contexts, field.name),
+                    (AggregateArray, FlagArray, list),
+            ):
+                for i in range(len(getattr(contexts, field.name))):
+                    print(f'{field.name}.{i}, ', end='', file=log_file)
+            else:
+                print(f'{field.name}, ', end='', file=log_file)
         print(file=log_file)
         log_file.flush()
 
@@ -557,33 +639,124 @@ class Miscellaneous(Application):
                 )
         ):
             print(f'{datetime.now().time()}, ', end='', file=log_file)
-            with self.environment.contexts() as contexts:
-                for field in fields(Contexts):
-                    if isinstance(getattr(contexts, field.name), dict):
-                        for value in getattr(contexts, field.name).values():
-                            if isinstance(value, float):
-                                value = f'{value:.3f}'
-                            elif isinstance(value, bool):
-                                value = 'T' if value else 'F'
-                            print(f'{value}, ', end='', file=log_file)
-                    elif isinstance(getattr(contexts, field.name), list):
-                        for i in range(len(getattr(contexts, field.name))):
-                            value = getattr(contexts, field.name)[i]
-                            if isinstance(value, float):
-                                value = f'{value:.3f}'
-                            elif isinstance(value, bool):
-                                value = 'T' if value else 'F'
-                            print(f'{value}, ', end='', file=log_file)
-                    else:
-                        value = getattr(contexts, field.name)
+            contexts = self.environment.contexts.snapshot()
+
+            for field in fields(Contexts):
+                if (
+                        isinstance(getattr(contexts, field.name), dict)
+                        and keys[field.name] is None
+                ):
+                    entries = []
+
+                    for key, value in getattr(contexts, field.name).items():
+                        if isinstance(value, float):
+                            value = f'{value:.3f}'
+
+                        entries.append(f'{key}:{value}')
+
+                    print(f'{";".join(entries)}, ', end='', file=log_file)
+                elif isinstance(getattr(contexts, field.name), dict):
+                    for key in keys[field.name] or ():
+                        value = getattr(contexts, field.name).get(key)
+
+                        if isinstance(value, float):
+                            value = f'{value:.3f}'
+                        elif isinstance(value, bool):
+                            value = 'T' if value else 'F'
+                        print(f'{value}, ', end='', file=log_file)
+                elif isinstance(
+                        getattr(contexts, field.name),
+                        (AggregateArray, FlagArray, list),
+                ):
+                    for i in range(len(getattr(contexts, field.name))):
+                        value = getattr(contexts, field.name)[i]
                         if isinstance(value, float):
                             value = f'{value:.3f}'
                         elif isinstance(value, bool):
                             value = 'T' if value else 'F'
-                        elif isinstance(value, struct_time):
-                            value = strftime('%Y-%m-%d_%H-%M-%S', value)
                         print(f'{value}, ', end='', file=log_file)
+                else:
+                    value = getattr(contexts, field.name)
+                    if isinstance(value, float):
+                        value = f'{value:.3f}'
+                    elif isinstance(value, bool):
+                        value = 'T' if value else 'F'
+                    elif isinstance(value, struct_time):
+                        value = strftime('%Y-%m-%d_%H-%M-%S', value)
+                    print(f'{value}, ', end='', file=log_file)
             print(file=log_file)
             log_file.flush()
 
         log_file.close()
+
+    def _timing_log(self) -> None:
+        filepath = (
+            self.environment.settings.general_log_filepath
+        )
+
+        print_log = filepath != ''
+
+        if not print_log:
+            return
+
+        filepath += 'runtime_log/'
+        makedirs(filepath, exist_ok=True)
+        now = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+        log_file = open(f'{filepath}{now}_timing_log.csv', 'w')
+
+        print(
+            (
+                'time, name, period, run_count, overrun_count, skip_count, '
+                'period_p50, period_p99, period_maximum, '
+                'execution_time_p50, execution_time_p99, '
+                'execution_time_maximum, '
+                'latency_p50, latency_p99, latency_maximum'
+            ),
+            file=log_file,
+        )
+        log_file.flush()
+
+        while (
+                not self._stoppage.wait(
+                    (
+                        self
+                        .environment
+                        .settings
+                        .miscellaneous_timing_log_timeout
+                    ),
+                )
+        ):
+            time = datetime.now().time()
+            task_statistics = self.environment.get_task_statistics()
+
+            for name, statistics in task_statistics.items():
+                print(
+                    (
+                        f'{time}, {name}, {statistics.period}, '
+                        f'{statistics.run_count}, '
+                        f'{statistics.overrun_count}, '
+                        f'{statistics.skip_count}'
+                    ),
+                    end='',
+                    file=log_file,
+                )
+
+                for summary in (
+                        statistics.periods,
+                        statistics.execution_times,
+                        statistics.latencies,
+                ):
+                    print(
+                        (
+                            f', {summary.p50:.6f}, {summary.p99:.6f}, '
+                            f'{summary.maximum:.6f}'
+                        ),
+                        end='',
+                        file=log_file,
+                    )
+
+                print(file=log_file)
+
+            log_file.flush()
+
+        log_file.close()
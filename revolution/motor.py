@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum
 from logging import getLogger
@@ -5,7 +6,7 @@ from math import pi
 from time import sleep, time
 from typing import ClassVar
 
-from can import Message
+from can import Message as CANMessage
 from iclib.wavesculptor22 import (
     StatusInformation, BusMeasurement, VelocityMeasurement,
     PhaseCurrentMeasurement, MotorVoltageVectorMeasurement,
@@ -13,12 +14,13 @@ from iclib.wavesculptor22 import (
     VoltageRailMeasurement15V, VoltageRailMeasurement3_3VAnd1_9V,
     HeatSinkAndMotorTemperatureMeasurement, DSPBoardTemperatureMeasurement,
     OdometerAndBusAmpHoursMeasurement, SlipSpeedMeasurement,
+    MotorControlBroadcastMessage,
 )
 
 from revolution.application import Application
-from revolution.environment import Endpoint
+from revolution.environment import Contexts, Endpoint, Message, Partition
 from revolution.utilities import Direction
-from revolution.worker import Worker
+from revolution.worker import RestartPolicy
 
 _logger = getLogger(__name__)
 
@@ -30,19 +32,42 @@ class Motor(Application):
     def _setup(self) -> None:
         super()._setup()
 
-        self._control_worker = Worker(target=self._control)
-        self._variable_field_magnet_worker = Worker(
-            target=self._variable_field_magnet,
+        control_timeout = self.environment.settings.motor_control_timeout
+        # The control loop must not pause for long, so it is delayed by at
+        # most one period after errors, however often they are raised.
+        self._control_task = self.environment.schedule(
+            self._control,
+            control_timeout,
+            dedicated=True,
+            restart_policy=RestartPolicy(
+                control_timeout / 4,
+                control_timeout,
+                restart_window=0,
+            ),
+        )
+        self._variable_field_magnet_worker = self.environment.create_worker(
+            self._variable_field_magnet,
+            self._stoppage,
         )
 
-        self._control_worker.start()
         self._variable_field_magnet_worker.start()
 
     def _teardown(self) -> None:
-        self._control_worker.join()
+        self._control_task.cancel()
         self._variable_field_magnet_worker.join()
 
-    def _control(self) -> None:
+    def _get_can_arbitration_ids(self) -> range:
+        base_address = (
+            self
+            .environment
+            .peripheries
+            .motor_wavesculptor22
+            .motor_controller_base_address
+        )
+
+        return range(base_address, base_address + (1 << 5))
+
+    def _control(self) -> Iterator[None]:
 
         def kph2rpm(kph: float) -> float:
             return (
@@ -62,20 +87,22 @@ class Motor(Application):
         acceleration_input_max_decrease = (
             self.environment.settings.motor_acceleration_input_max_decrease
         )
-        while (
-                not self._stoppage.wait(
-                    self.environment.settings.motor_control_timeout,
-                )
-        ):
-            with self.environment.contexts() as contexts:
-                motor_heartbeat_timestamp = contexts.motor_heartbeat_timestamp
+        while True:
+            yield
+
+            motor_heartbeat_timestamp = (
+                self.environment.contexts.snapshot().motor_heartbeat_timestamp
+            )
 
             motor_heartbeat_working = (
                 (time() - motor_heartbeat_timestamp)
                 < self.environment.settings.motor_can_timeout
             )
 
-            with self.environment.contexts() as contexts:
+            with self.environment.contexts(
+                    Partition.MOTOR,
+                    Partition.POWER,
+            ) as contexts:
                 contexts.motor_heartbeat_working = motor_heartbeat_working
                 contexts.motor_status_input = (
                     contexts.power_battery_relay_status
@@ -110,12 +137,16 @@ class Motor(Application):
                         not previous_cruise_control_status_input
                         and cruise_control_status_input
                     ):
-                        with self.environment.contexts() as contexts:
+                        with self.environment.contexts(
+                                Partition.MOTOR,
+                        ) as contexts:
                             contexts.motor_cruise_control_velocity = (
                                 contexts.motor_velocity
                             )
 
-                    with self.environment.contexts() as contexts:
+                    with self.environment.contexts(
+                            Partition.MOTOR,
+                    ) as contexts:
                         cruise_control_velocity = (
                             contexts.motor_cruise_control_velocity
                         )
@@ -194,7 +225,9 @@ class Motor(Application):
                         )
                         motor_controller_sent_velocity = 20000
 
-                    with self.environment.contexts() as contexts:
+                    with self.environment.contexts(
+                            Partition.MOTOR,
+                    ) as contexts:
                         contexts.motor_controller_sent_current = (
                             motor_controller_sent_current
                         )
@@ -202,7 +235,7 @@ class Motor(Application):
                             motor_controller_sent_velocity
                         )
             else:
-                with self.environment.contexts() as contexts:
+                with self.environment.contexts(Partition.MOTOR) as contexts:
                     contexts.motor_cruise_control_status_input = False
 
             previous_motor_status_input = motor_status_input
@@ -310,7 +343,10 @@ class Motor(Application):
                 ),
             )
         ):
-            with self.environment.contexts() as contexts:
+            with self.environment.contexts(
+                    Partition.MOTOR,
+                    Partition.POWER,
+            ) as contexts:
                 battery_relay_status = contexts.power_battery_relay_status
                 min_value = min(
                     contexts.motor_variable_field_magnet_up_input,
@@ -366,14 +402,50 @@ class Motor(Application):
 
                         previous_direction = direction
 
-                with self.environment.contexts() as contexts:
+                with self.environment.contexts(Partition.MOTOR) as contexts:
                     contexts.motor_variable_field_magnet_position = (
                         position
                     )
 
             previous_battery_relay_status = battery_relay_status
 
-    def _handle_can(self, message: Message) -> None:
+    def _handle_can(self, message: CANMessage) -> None:
+        super()._handle_can(message)
+
+        self._handle_can_messages([message])
+
+    def _handle_can_batch(self, messages: list[Message]) -> None:
+        self._handle_can_messages([message.args[0] for message in messages])
+
+    def _handle_can_messages(self, messages: list[CANMessage]) -> None:
+        broadcast_messages = []
+
+        for message in messages:
+            broadcast_message = (
+                self
+                .environment
+                .peripheries
+                .motor_wavesculptor22
+                .parse(message)
+            )
+
+            if broadcast_message is not None:
+                broadcast_messages.append(broadcast_message)
+
+        if not broadcast_messages:
+            return
+
+        with self.environment.contexts(Partition.MOTOR) as contexts:
+            for broadcast_message in broadcast_messages:
+                self._update_contexts(contexts, broadcast_message)
+
+            contexts.motor_heartbeat_timestamp = time()
+
+    def _update_contexts(
+            self,
+            contexts: Contexts,
+            broadcast_message: MotorControlBroadcastMessage,
+    ) -> None:
 
         def rpm2kph(rpm: float) -> float:
             return (
@@ -384,106 +456,94 @@ class Motor(Application):
                 / 1000
             )
 
-        super()._handle_can(message)
-
-        broadcast_message = (
-            self.environment.peripheries.motor_wavesculptor22.parse(message)
-        )
-
-        if broadcast_message is None:
-            return
-
-        with self.environment.contexts() as contexts:
-            if isinstance(broadcast_message, StatusInformation):
-                contexts.motor_controller_limit_flags = (
-                    broadcast_message.limit_flags
-                )
-                contexts.motor_controller_error_flags = (
-                    broadcast_message.error_flags
-                )
-                contexts.motor_controller_active_motor = (
-                    broadcast_message.active_motor
-                )
-                contexts.motor_controller_transmit_error_count = (
-                    broadcast_message.transmit_error_count
-                )
-                contexts.motor_controller_receive_error_count = (
-                    broadcast_message.receive_error_count
-                )
-            if isinstance(broadcast_message, BusMeasurement):
-                contexts.motor_controller_bus_voltage = (
-                    broadcast_message.bus_voltage
-                )
-                contexts.motor_controller_bus_current = (
-                    broadcast_message.bus_current
-                )
-            if isinstance(broadcast_message, VelocityMeasurement):
-                contexts.motor_velocity = rpm2kph(
-                    broadcast_message.motor_velocity,
-                )
-                contexts.motor_controller_vehicle_velocity = (
-                    broadcast_message.vehicle_velocity
-                )
-            if isinstance(broadcast_message, PhaseCurrentMeasurement):
-                contexts.motor_controller_phase_B_current = (
-                    broadcast_message.motor_velocity
-                )
-                contexts.motor_controller_phase_C_current = (
-                    broadcast_message.phase_c_current
-                )
-            if isinstance(broadcast_message, MotorVoltageVectorMeasurement):
-                contexts.motor_controller_Vq = broadcast_message.Vq
-                contexts.motor_controller_Vd = broadcast_message.Vd
-            if isinstance(broadcast_message, MotorCurrentVectorMeasurement):
-                contexts.motor_controller_Iq = broadcast_message.Iq
-                contexts.motor_controller_Id = broadcast_message.Id
-            if isinstance(
-                broadcast_message, MotorBackEMFMeasurementPrediction
-            ):
-                contexts.motor_controller_BEMFq = broadcast_message.BEMFq
-                contexts.motor_controller_BEMFd = broadcast_message.BEMFd
-            if isinstance(broadcast_message, VoltageRailMeasurement15V):
-                contexts.motor_controller_supply_15v = (
-                    broadcast_message.supply_15v
-                )
-            if isinstance(
-                broadcast_message, VoltageRailMeasurement3_3VAnd1_9V
-            ):
-                contexts.motor_controller_supply_1_9v = (
-                    broadcast_message.supply_1_9v
-                )
-                contexts.motor_controller_supply_3_3v = (
-                    broadcast_message.supply_3_3v
-                )
-            if isinstance(
-                broadcast_message, HeatSinkAndMotorTemperatureMeasurement
-            ):
-                contexts.motor_controller_motor_temp = (
-                    broadcast_message.motor_temp
-                )
-                contexts.motor_controller_heat_sink_temp = (
-                    broadcast_message.heat_sink_temp
-                )
-            if isinstance(
-                broadcast_message, DSPBoardTemperatureMeasurement
-            ):
-                contexts.motor_controller_dsp_board_temp = (
-                    broadcast_message.dsp_board_temp
-                )
-            if isinstance(
-                broadcast_message, OdometerAndBusAmpHoursMeasurement
-            ):
-                contexts.motor_controller_odometer = (
-                    broadcast_message.odometer
-                )
-                contexts.motor_controller_dc_bus_amphours = (
-                    broadcast_message.dc_bus_amphours
-                )
-            if isinstance(
-                broadcast_message, SlipSpeedMeasurement
-            ):
-                contexts.motor_controller_slip_speed = (
-                    broadcast_message.slip_speed
-                )
-
-            contexts.motor_heartbeat_timestamp = time()
+        if isinstance(broadcast_message, StatusInformation):
+            contexts.motor_controller_limit_flags = (
+                broadcast_message.limit_flags
+            )
+            contexts.motor_controller_error_flags = (
+                broadcast_message.error_flags
+            )
+            contexts.motor_controller_active_motor = (
+                broadcast_message.active_motor
+            )
+            contexts.motor_controller_transmit_error_count = (
+                broadcast_message.transmit_error_count
+            )
+            contexts.motor_controller_receive_error_count = (
+                broadcast_message.receive_error_count
+            )
+        if isinstance(broadcast_message, BusMeasurement):
+            contexts.motor_controller_bus_voltage = (
+                broadcast_message.bus_voltage
+            )
+            contexts.motor_controller_bus_current = (
+                broadcast_message.bus_current
+            )
+        if isinstance(broadcast_message, VelocityMeasurement):
+            contexts.motor_velocity = rpm2kph(
+                broadcast_message.motor_velocity,
+            )
+            contexts.motor_controller_vehicle_velocity = (
+                broadcast_message.vehicle_velocity
+            )
+        if isinstance(broadcast_message, PhaseCurrentMeasurement):
+            contexts.motor_controller_phase_B_current = (
+                broadcast_message.motor_velocity
+            )
+            contexts.motor_controller_phase_C_current = (
+                broadcast_message.phase_c_current
+            )
+        if isinstance(broadcast_message, MotorVoltageVectorMeasurement):
+            contexts.motor_controller_Vq = broadcast_message.Vq
+            contexts.motor_controller_Vd = broadcast_message.Vd
+        if isinstance(broadcast_message, MotorCurrentVectorMeasurement):
+            contexts.motor_controller_Iq = broadcast_message.Iq
+            contexts.motor_controller_Id = broadcast_message.Id
+        if isinstance(
+            broadcast_message, MotorBackEMFMeasurementPrediction
+        ):
+            contexts.motor_controller_BEMFq = broadcast_message.BEMFq
+            contexts.motor_controller_BEMFd = broadcast_message.BEMFd
+        if isinstance(broadcast_message, VoltageRailMeasurement15V):
+            contexts.motor_controller_supply_15v = (
+                broadcast_message.supply_15v
+            )
+        if isinstance(
+            broadcast_message, VoltageRailMeasurement3_3VAnd1_9V
+        ):
+            contexts.motor_controller_supply_1_9v = (
+                broadcast_message.supply_1_9v
+            )
+            contexts.motor_controller_supply_3_3v = (
+                broadcast_message.supply_3_3v
+            )
+        if isinstance(
+            broadcast_message, HeatSinkAndMotorTemperatureMeasurement
+        ):
+            contexts.motor_controller_motor_temp = (
+                broadcast_message.motor_temp
+            )
+            contexts.motor_controller_heat_sink_temp = (
+                broadcast_message.heat_sink_temp
+            )
+        if isinstance(
+            broadcast_message, DSPBoardTemperatureMeasurement
+        ):
+            contexts.motor_controller_dsp_board_temp = (
+                broadcast_message.dsp_board_temp
+            )
+        if isinstance(
+            broadcast_message, OdometerAndBusAmpHoursMeasurement
+        ):
+            contexts.motor_controller_odometer = (
+                broadcast_message.odometer
+            )
+            contexts.motor_controller_dc_bus_amphours = (
+                broadcast_message.dc_bus_amphours
+            )
+        if isinstance(
+            broadcast_message, SlipSpeedMeasurement
+        ):
+            contexts.motor_controller_slip_speed = (
+                broadcast_message.slip_speed
+            )
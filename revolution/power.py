@@ -1,12 +1,11 @@
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from logging import getLogger
 from os import makedirs
+from os.path import dirname
 from time import sleep, time
-from typing import ClassVar
-
-from battlib import EKFSOCEstimator
-from can import Message
+from typing import Any, ClassVar, TYPE_CHECKING
 
 from revolution.application import Application
 from revolution.battery_management_system import (
@@ -16,6 +15,7 @@ from revolution.battery_management_system import (
     BATTERY_THERMISTOR_COUNT,
     BATTERY_THERMISTOR_PER_PACK_COUNT,
     CellVoltagesInformation,
+    Information,
     LVInformation,
     OverBatteryFlagsHoldInformation,
     OverBatteryFlagsInformation,
@@ -30,8 +30,13 @@ from revolution.battery_management_system import (
     UndertemperatureHoldInformation,
     UndervoltageHoldInformation,
 )
-from revolution.environment import Endpoint
-from revolution.worker import Worker
+from revolution.environment import Endpoint, Message, Partition
+from revolution.utilities import AggregateArray, FlagArray
+
+if TYPE_CHECKING:
+    from can import Message as CANMessage
+
+    from revolution.soc import BatchedEKFSOCEstimator
 
 _logger = getLogger(__name__)
 
@@ -54,27 +59,76 @@ class Power(Application):
             filename = f'{filepath}{now}_flag_log.txt'
             self.phub_battery_flag_log_file = open(filename, 'w')
 
-        self._monitor_worker = Worker(target=self._monitor)
-        self._soc_worker = Worker(target=self._soc)
-        self._psm_worker = Worker(target=self._psm)
-        self._steering_wheel_led_worker = Worker(
-            target=self._steering_wheel_led,
+        with self.environment.contexts(Partition.POWER) as contexts:
+            self._battery_cell_voltages = (
+                contexts.power_battery_cell_voltages.copy()
+            )
+            self._battery_thermistor_temperatures = (
+                contexts.power_battery_thermistor_temperatures.copy()
+            )
+            self._battery_cell_flags = contexts.power_battery_cell_flags.copy()
+            self._battery_thermistor_flags = (
+                contexts.power_battery_thermistor_flags.copy()
+            )
+            self._battery_current_flag = contexts.power_battery_current_flag
+            self._battery_hold_cell_flags = (
+                contexts.power_battery_hold_cell_flags.copy()
+            )
+            self._battery_hold_thermistor_flags = (
+                contexts.power_battery_hold_thermistor_flags.copy()
+            )
+            self._battery_hold_current_flag = (
+                contexts.power_battery_hold_current_flag
+            )
+            self._battery_hold_elapsed_count = (
+                contexts.power_battery_hold_elapsed_count
+            )
+
+        self._steering_wheel_led_subscription = self._subscribe(
+            'power_battery_discharge_status',
+        )
+        self._psm_task = self.environment.schedule(
+            self._psm,
+            self.environment.settings.power_psm_timeout,
+        )
+        self._monitor_worker = self.environment.create_worker(
+            self._monitor,
+            self._stoppage,
+        )
+        self._soc_worker = self.environment.create_worker(
+            self._soc,
+            self._stoppage,
+        )
+        self._steering_wheel_led_worker = self.environment.create_worker(
+            self._steering_wheel_led,
+            self._stoppage,
         )
 
         self._monitor_worker.start()
         self._soc_worker.start()
-        self._psm_worker.start()
         self._steering_wheel_led_worker.start()
 
     def _teardown(self) -> None:
         self._monitor_worker.join()
         self._soc_worker.join()
-        self._psm_worker.join()
+        self._psm_task.cancel()
         self._steering_wheel_led_worker.join()
+        self._steering_wheel_led_subscription.close()
 
         if self.print_log:
             self.phub_battery_flag_log_file.close()
 
+    def _get_can_arbitration_ids(self) -> range:
+        base_address = (
+            self
+            .environment
+            .peripheries
+            .power_battery_management_system
+            .BASE_ADDRESS
+        )
+
+        return range(base_address, base_address + (1 << 5))
+
     def _monitor(self) -> None:
         def array_relay(status: bool) -> None:
             (
@@ -128,7 +182,7 @@ class Power(Application):
                     self.environment.settings.power_monitor_timeout,
                 )
         ):
-            with self.environment.contexts() as contexts:
+            with self.environment.contexts(Partition.POWER) as contexts:
                 array_relay_status_input = (
                     contexts.power_array_relay_status_input
                 )
@@ -148,7 +202,7 @@ class Power(Application):
                 (time() - battery_heartbeat_timestamp)
                 < self.environment.settings.power_battery_can_timeout
             )
-            with self.environment.contexts() as contexts:
+            with self.environment.contexts(Partition.POWER) as contexts:
                 contexts.power_battery_heartbeat_working = (
                     battery_heartbeat_working
                 )
@@ -170,7 +224,7 @@ class Power(Application):
             ):
                 array_relay(True)
                 ppt_relay(True)
-                with self.environment.contexts() as contexts:
+                with self.environment.contexts(Partition.POWER) as contexts:
                     contexts.power_array_relay_status = True
             elif (
                     previous_array_relay_status_input
@@ -178,7 +232,7 @@ class Power(Application):
             ):
                 ppt_relay(False)
                 array_relay(False)
-                with self.environment.contexts() as contexts:
+                with self.environment.contexts(Partition.POWER) as contexts:
                     contexts.power_array_relay_status = False
 
             if not battery_relay_status and battery_relay_status_input:
@@ -205,54 +259,116 @@ class Power(Application):
             previous_array_relay_status_input = array_relay_status_input
 
     def _soc(self) -> None:
-        estimators: list[EKFSOCEstimator | None] = [
-            None for _ in range(BATTERY_CELL_COUNT)
-        ]
-        previous_time = time()
+        from revolution.soc import BatchedEKFSOCEstimator
 
-        while (
-                not self._stoppage.wait(
-                    self.environment.settings.power_soc_timeout,
+        settings = self.environment.settings
+        estimator = BatchedEKFSOCEstimator(
+            settings.power_battery,
+            BATTERY_CELL_COUNT,
+        )
+        checkpoint_filepath = settings.power_soc_checkpoint_filepath
+
+        if checkpoint_filepath:
+            try:
+                restored = estimator.restore(
+                    checkpoint_filepath,
+                    time(),
+                    settings.power_soc_checkpoint_maximum_age,
                 )
-        ):
-            with self.environment.contexts() as contexts:
+            except FileNotFoundError:
+                restored = False
+            except (OSError, ValueError):
+                _logger.exception('Unable to restore SOC checkpoint')
+
+                restored = False
+
+            if restored:
+                _logger.info('Restored SOC checkpoint')
+
+            try:
+                makedirs(dirname(checkpoint_filepath) or '.', exist_ok=True)
+            except OSError:
+                _logger.exception(
+                    'Unable to create SOC checkpoint directory, continuing'
+                    ' without checkpoints',
+                )
+
+                checkpoint_filepath = ''
+
+        previous_time = checkpoint_time = time()
+
+        while not self._stoppage.wait(settings.power_soc_timeout):
+            with self.environment.contexts(Partition.POWER) as contexts:
                 battery_cell_voltages = (
-                    contexts.power_battery_cell_voltages.copy()
+                    contexts.power_battery_cell_voltages.tolist()
                 )
                 battery_current = contexts.power_battery_HV_current
+                battery_state_of_charges = (
+                    contexts.power_battery_state_of_charges
+                )
 
-                for i, estimator in enumerate(estimators):
-                    if estimator is not None:
-                        contexts.power_battery_state_of_charges[i] = (
-                            estimator.soc.item()  # type: ignore[attr-defined]
-                        )
+                for i, (initialization, soc) in enumerate(
+                        zip(
+                            estimator.initializations.tolist(),
+                            estimator.socs.tolist(),
+                        ),
+                ):
+                    if initialization:
+                        battery_state_of_charges[i] = soc
+
+                contexts.power_battery_min_state_of_charge = (
+                    battery_state_of_charges.minimum
+                )
+                contexts.power_battery_max_state_of_charge = (
+                    battery_state_of_charges.maximum
+                )
+                contexts.power_battery_mean_state_of_charge = (
+                    battery_state_of_charges.mean
+                )
 
             time_ = time()
-            time_difference = time_ - previous_time
 
-            for i, (estimator, voltage) in enumerate(
-                    zip(estimators, battery_cell_voltages),
-            ):
-                if estimator is None and voltage:
-                    estimators[i] = EKFSOCEstimator(
-                        self.environment.settings.power_battery,
-                        voltage,
-                    )
-                elif estimator is not None:
-                    estimator.step(
-                        dt=time_difference,
-                        i_in=-battery_current,
-                        measured_v=voltage,
-                    )
+            estimator.step(
+                dt=time_ - previous_time,
+                i_in=-battery_current,
+                measured_vs=battery_cell_voltages,
+            )
+            estimator.initialize(battery_cell_voltages)
 
             previous_time = time_
 
-    def _psm(self) -> None:
-        while (
-                not self._stoppage.wait(
-                    self.environment.settings.power_psm_timeout,
-                )
-        ):
+            if (
+                    checkpoint_filepath
+                    and (
+                        time_ - checkpoint_time
+                        >= settings.power_soc_checkpoint_timeout
+                    )
+            ):
+                self._save_soc(estimator, checkpoint_filepath, time_)
+
+                checkpoint_time = time_
+
+        if checkpoint_filepath:
+            self._save_soc(estimator, checkpoint_filepath, previous_time)
+
+    def _save_soc(
+            self,
+            estimator: 'BatchedEKFSOCEstimator',
+            filepath: str,
+            timestamp: float,
+    ) -> None:
+        if not estimator.initializations.any():
+            return
+
+        try:
+            estimator.save(filepath, timestamp)
+        except OSError:
+            _logger.exception('Unable to save SOC checkpoint')
+
+    def _psm(self) -> Iterator[None]:
+        while True:
+            yield
+
             motor_current = (
                 self.environment.peripheries.power_psm_motor_ina229.current
             )
@@ -296,7 +412,7 @@ class Power(Application):
                 )
             )
 
-            with self.environment.contexts() as contexts:
+            with self.environment.contexts(Partition.POWER) as contexts:
                 contexts.power_psm_motor_current = motor_current
                 contexts.power_psm_motor_voltage = motor_voltage
                 contexts.power_psm_battery_current = battery_current
@@ -307,12 +423,8 @@ class Power(Application):
     def _steering_wheel_led(self) -> None:
         status = False
 
-        while (
-                not self._stoppage.wait(
-                    self.environment.settings.power_steering_wheel_led_timeout,
-                )
-        ):
-            with self.environment.contexts() as contexts:
+        while not self._stoppage.is_set():
+            with self.environment.contexts(Partition.POWER) as contexts:
                 battery_discharge_status = (
                     contexts.power_battery_discharge_status
                 )
@@ -326,271 +438,380 @@ class Power(Application):
                 status,
             )
 
-    def _handle_can(self, message: Message) -> None:
+            if battery_discharge_status:
+                self._stoppage.wait(
+                    self.environment.settings.power_steering_wheel_led_timeout,
+                )
+            else:
+                self._steering_wheel_led_subscription.wait(
+                    self.environment.settings.general_subscription_timeout,
+                )
+
+    def _handle_can(self, message: 'CANMessage') -> None:
         super()._handle_can(message)
 
-        information = (
-            self
-            .environment
-            .peripheries
-            .power_battery_management_system
-            .parse(message)
-        )
+        self._handle_can_messages([message])
+
+    def _handle_can_batch(self, messages: list[Message]) -> None:
+        self._handle_can_messages([message.args[0] for message in messages])
+
+    def _handle_can_messages(self, messages: list['CANMessage']) -> None:
+        updates: dict[str, Any] = {}
 
-        if information is None:
+        for message in messages:
+            information = (
+                self
+                .environment
+                .peripheries
+                .power_battery_management_system
+                .parse(message)
+            )
+
+            if information is not None:
+                self.INFORMATION_HANDLERS[type(information)](
+                    self,
+                    information,
+                    updates,
+                )
+
+        if not updates:
             return
 
+        for name, value in updates.items():
+            if isinstance(value, (AggregateArray, FlagArray)):
+                updates[name] = value.copy()
+
+        updates['power_battery_heartbeat_timestamp'] = time()
+
+        with self.environment.contexts(Partition.POWER) as contexts:
+            for name, value in updates.items():
+                setattr(contexts, name, value)
+
+    def _log_battery_flags(self, line: str) -> None:
         if self.print_log:
-            log_file = self.phub_battery_flag_log_file
-
-        with self.environment.contexts() as contexts:
-            # Important
-            if isinstance(information, StatusesAndHVInformation):
-                contexts.power_battery_relay_status = information.relay_status
-                contexts.power_battery_electric_safe_discharge_status = (
-                    information.electric_safe_discharge_status
-                )
-                contexts.power_battery_discharge_status = (
-                    information.discharge_status
-                )
-                contexts.power_battery_flags_hold = BatteryFlag(
-                    information.flag_hold
-                )
-                contexts.power_battery_HV_voltage = information.HV_voltage
-                contexts.power_battery_HV_current = information.HV_current
-            elif (
-                    isinstance(
-                        information,
-                        (
-                            OverBatteryFlagsInformation
-                            | UnderBatteryFlagsInformation
-                        ),
-                    )
-            ):
-                for i, flag in information.cell_flags.items():
-                    contexts.power_battery_cell_flags[i] -= (
-                        contexts.power_battery_cell_flags[i]
-                        & information.CELL_FLAG
-                    )
-                    contexts.power_battery_cell_flags[i] |= flag
+            print(
+                f'{datetime.now().time()} {line}',
+                file=self.phub_battery_flag_log_file,
+            )
+            self.phub_battery_flag_log_file.flush()
+
+    # Important
+
+    def _handle_statuses_and_HV_information(
+            self,
+            information: StatusesAndHVInformation,
+            updates: dict[str, Any],
+    ) -> None:
+        updates['power_battery_relay_status'] = information.relay_status
+        updates['power_battery_electric_safe_discharge_status'] = (
+            information.electric_safe_discharge_status
+        )
+        updates['power_battery_discharge_status'] = (
+            information.discharge_status
+        )
+        updates['power_battery_flags_hold'] = BatteryFlag(
+            information.flag_hold,
+        )
+        updates['power_battery_HV_voltage'] = information.HV_voltage
+        updates['power_battery_HV_current'] = information.HV_current
+
+    def _handle_battery_flags_information(
+            self,
+            information: (
+                OverBatteryFlagsInformation
+                | UnderBatteryFlagsInformation
+            ),
+            updates: dict[str, Any],
+    ) -> None:
+        self._battery_cell_flags.assign(
+            information.CELL_FLAG,
+            information.cell_flag_mask,
+        )
+        self._battery_thermistor_flags.assign(
+            information.THERMISTOR_FLAG,
+            information.thermistor_flag_mask,
+        )
 
-                for i, flag in information.thermistor_flags.items():
-                    contexts.power_battery_thermistor_flags[i] -= (
-                        contexts.power_battery_thermistor_flags[i]
-                        & information.THERMISTOR_FLAG
-                    )
-                    contexts.power_battery_thermistor_flags[i] |= flag
+        self._battery_current_flag -= (
+            self._battery_current_flag
+            & information.CURRENT_FLAG
+        )
+        self._battery_current_flag |= information.current_flag
+        updates['power_battery_cell_flags'] = self._battery_cell_flags
+        updates['power_battery_thermistor_flags'] = (
+            self._battery_thermistor_flags
+        )
+        updates['power_battery_current_flag'] = self._battery_current_flag
+        updates['power_battery_flags'] = BatteryFlag(
+            self._battery_cell_flags.union
+            | self._battery_thermistor_flags.union
+            | self._battery_current_flag
+        )
 
-                contexts.power_battery_current_flag -= (
-                    contexts.power_battery_current_flag
-                    & information.CURRENT_FLAG
-                )
-                contexts.power_battery_current_flag |= (
-                    information.current_flag
-                )
-            elif isinstance(information, LVInformation):
-                contexts.power_battery_LV_voltage = information.LV_voltage
-                contexts.power_battery_LV_current = information.LV_current
-                contexts.power_battery_supp_voltage = information.supp_voltage
-                contexts.power_battery_rolling_min_LV_voltage = (
-                    information.rolling_min_LV_voltage
-                )
+    def _handle_LV_information(
+            self,
+            information: LVInformation,
+            updates: dict[str, Any],
+    ) -> None:
+        updates['power_battery_LV_voltage'] = information.LV_voltage
+        updates['power_battery_LV_current'] = information.LV_current
+        updates['power_battery_supp_voltage'] = information.supp_voltage
+        updates['power_battery_rolling_min_LV_voltage'] = (
+            information.rolling_min_LV_voltage
+        )
 
-            # Battery Flag Event
-            elif (
-                    isinstance(
-                        information,
-                        (
-                            OverBatteryFlagsHoldInformation
-                            | UnderBatteryFlagsHoldInformation
-                        ),
-                    )
-            ):
-                if isinstance(information, OverBatteryFlagsHoldInformation):
-                    voltage_str = 'OV flag: '
-                    temperature_str = 'OT flag: '
-                    current_str = 'OC flag'
-                else:
-                    voltage_str = 'UV flag: '
-                    temperature_str = 'UT flag: '
-                    current_str = 'UC flag'
-
-                for i, flag in information.cell_flags.items():
-                    contexts.power_battery_hold_cell_flags[i] -= (
-                        contexts.power_battery_hold_cell_flags[i]
-                        & information.CELL_FLAG
-                    )
-                    contexts.power_battery_hold_cell_flags[i] |= flag
-                    pack = i // BATTERY_CELL_PER_PACK_COUNT
-                    cell = i % BATTERY_CELL_PER_PACK_COUNT
-                    voltage_str += f'{pack}.{cell} '
-
-                for i, flag in information.thermistor_flags.items():
-                    contexts.power_battery_hold_thermistor_flags[i] -= (
-                        contexts.power_battery_hold_thermistor_flags[i]
-                        & information.THERMISTOR_FLAG
-                    )
-                    contexts.power_battery_hold_thermistor_flags[i] |= flag
-                    pack = i // BATTERY_THERMISTOR_PER_PACK_COUNT
-                    thermistor = i % BATTERY_THERMISTOR_PER_PACK_COUNT
-                    temperature_str += f'{pack}.{thermistor} '
-
-                contexts.power_battery_hold_current_flag -= (
-                    contexts.power_battery_hold_current_flag
-                    & information.CURRENT_FLAG
-                )
-                contexts.power_battery_hold_current_flag |= (
-                    information.current_flag
-                )
+    # Battery Flag Event
+
+    def _handle_battery_flags_hold_information(
+            self,
+            information: (
+                OverBatteryFlagsHoldInformation
+                | UnderBatteryFlagsHoldInformation
+            ),
+            updates: dict[str, Any],
+    ) -> None:
+        if isinstance(information, OverBatteryFlagsHoldInformation):
+            voltage_str = 'OV flag: '
+            temperature_str = 'OT flag: '
+            current_str = 'OC flag'
+        else:
+            voltage_str = 'UV flag: '
+            temperature_str = 'UT flag: '
+            current_str = 'UC flag'
+
+        cell_flag_mask = information.cell_flag_mask
+        thermistor_flag_mask = information.thermistor_flag_mask
+
+        self._battery_hold_cell_flags.assign(
+            information.CELL_FLAG,
+            cell_flag_mask,
+        )
+        self._battery_hold_thermistor_flags.assign(
+            information.THERMISTOR_FLAG,
+            thermistor_flag_mask,
+        )
 
-                if not information.current_flag:
-                    current_str = ''
+        for i in range(BATTERY_CELL_COUNT):
+            if cell_flag_mask >> i & 1:
+                pack = i // BATTERY_CELL_PER_PACK_COUNT
+                cell = i % BATTERY_CELL_PER_PACK_COUNT
+                voltage_str += f'{pack}.{cell} '
+
+        for i in range(BATTERY_THERMISTOR_COUNT):
+            if thermistor_flag_mask >> i & 1:
+                pack = i // BATTERY_THERMISTOR_PER_PACK_COUNT
+                thermistor = i % BATTERY_THERMISTOR_PER_PACK_COUNT
+                temperature_str += f'{pack}.{thermistor} '
+
+        self._battery_hold_current_flag -= (
+            self._battery_hold_current_flag
+            & information.CURRENT_FLAG
+        )
+        self._battery_hold_current_flag |= information.current_flag
+        updates['power_battery_hold_cell_flags'] = (
+            self._battery_hold_cell_flags
+        )
+        updates['power_battery_hold_thermistor_flags'] = (
+            self._battery_hold_thermistor_flags
+        )
+        updates['power_battery_hold_current_flag'] = (
+            self._battery_hold_current_flag
+        )
 
-                if self.print_log:
-                    print(
-                        f'{datetime.now().time()} '
-                        f'{voltage_str} {temperature_str} {current_str}',
-                        file=log_file
-                    )
-                    log_file.flush()
+        if not information.current_flag:
+            current_str = ''
 
-            elif isinstance(information, OvervoltageHoldInformation):
-                contexts.power_battery_hold_elapsed_count = max(
-                    information.hold_elapsed_count,
-                    contexts.power_battery_hold_elapsed_count
-                )
-                contexts.power_battery_hold_OV_count = (
-                    information.hold_OV_count
-                )
-                contexts.power_battery_hold_OV_max = (
-                    information.hold_OV_max
-                )
+        self._log_battery_flags(
+            f'{voltage_str} {temperature_str} {current_str}',
+        )
 
-                if self.print_log:
-                    print(
-                        f'{datetime.now().time()} OV_hold '
-                        f'elapsed_count={information.hold_elapsed_count} '
-                        f'OV_count={information.hold_OV_count} '
-                        f'OV_max={information.hold_OV_max}',
-                        file=log_file
-                    )
-                    log_file.flush()
-            elif isinstance(information, UndervoltageHoldInformation):
-                contexts.power_battery_hold_elapsed_count = max(
-                    information.hold_elapsed_count,
-                    contexts.power_battery_hold_elapsed_count
-                )
-                contexts.power_battery_hold_UV_count = (
-                    information.hold_UV_count
-                )
-                contexts.power_battery_hold_UV_min = (
-                    information.hold_UV_min
-                )
+    def _handle_hold_information(
+            self,
+            name: str,
+            elapsed_count: int,
+            count: int,
+            extremum_name: str,
+            extremum: float,
+            updates: dict[str, Any],
+    ) -> None:
+        self._battery_hold_elapsed_count = max(
+            elapsed_count,
+            self._battery_hold_elapsed_count,
+        )
+        updates['power_battery_hold_elapsed_count'] = (
+            self._battery_hold_elapsed_count
+        )
+        updates[f'power_battery_hold_{name}_count'] = count
+        updates[f'power_battery_hold_{name}_{extremum_name}'] = extremum
 
-                if self.print_log:
-                    print(
-                        f'{datetime.now().time()} UV_hold '
-                        f'elapsed_count={information.hold_elapsed_count} '
-                        f'UV_count={information.hold_UV_count} '
-                        f'UV_min={information.hold_UV_min}',
-                        file=log_file
-                    )
-                    log_file.flush()
-            elif isinstance(information, OvertemperatureHoldInformation):
-                contexts.power_battery_hold_elapsed_count = max(
-                    information.hold_elapsed_count,
-                    contexts.power_battery_hold_elapsed_count
-                )
-                contexts.power_battery_hold_OT_count = (
-                    information.hold_OT_count
-                )
-                contexts.power_battery_hold_OT_max = (
-                    information.hold_OT_max
-                )
+        self._log_battery_flags(
+            (
+                f'{name}_hold elapsed_count={elapsed_count}'
+                f' {name}_count={count} {name}_{extremum_name}={extremum}'
+            ),
+        )
 
-                if self.print_log:
-                    print(
-                        f'{datetime.now().time()} OT_hold '
-                        f'elapsed_count={information.hold_elapsed_count} '
-                        f'OT_count={information.hold_OT_count} '
-                        f'OT_max={information.hold_OT_max}',
-                        file=log_file
-                    )
-                    log_file.flush()
-            elif isinstance(information, UndertemperatureHoldInformation):
-                contexts.power_battery_hold_elapsed_count = max(
-                    information.hold_elapsed_count,
-                    contexts.power_battery_hold_elapsed_count
-                )
-                contexts.power_battery_hold_UT_count = (
-                    information.hold_UT_count
-                )
-                contexts.power_battery_hold_UT_min = (
-                    information.hold_UT_min
-                )
+    def _handle_overvoltage_hold_information(
+            self,
+            information: OvervoltageHoldInformation,
+            updates: dict[str, Any],
+    ) -> None:
+        self._handle_hold_information(
+            'OV',
+            information.hold_elapsed_count,
+            information.hold_OV_count,
+            'max',
+            information.hold_OV_max,
+            updates,
+        )
 
-                if self.print_log:
-                    print(
-                        f'{datetime.now().time()} UT_hold '
-                        f'elapsed_count={information.hold_elapsed_count} '
-                        f'UT_count={information.hold_UT_count} '
-                        f'UT_min={information.hold_UT_min}',
-                        file=log_file
-                    )
-                    log_file.flush()
-            elif isinstance(information, OvercurrentHoldInformation):
-                contexts.power_battery_hold_elapsed_count = max(
-                    information.hold_elapsed_count,
-                    contexts.power_battery_hold_elapsed_count
-                )
-                contexts.power_battery_hold_OC_count = (
-                    information.hold_OC_count
-                )
-                contexts.power_battery_hold_OC_max = (
-                    information.hold_OC_max
-                )
+    def _handle_undervoltage_hold_information(
+            self,
+            information: UndervoltageHoldInformation,
+            updates: dict[str, Any],
+    ) -> None:
+        self._handle_hold_information(
+            'UV',
+            information.hold_elapsed_count,
+            information.hold_UV_count,
+            'min',
+            information.hold_UV_min,
+            updates,
+        )
 
-                if self.print_log:
-                    print(
-                        f'{datetime.now().time()} OC_hold '
-                        f'elapsed_count={information.hold_elapsed_count} '
-                        f'OC_count={information.hold_OC_count} '
-                        f'OC_max={information.hold_OC_max}',
-                        file=log_file
-                    )
-                    log_file.flush()
-            elif isinstance(information, UndercurrentHoldInformation):
-                contexts.power_battery_hold_elapsed_count = max(
-                    information.hold_elapsed_count,
-                    contexts.power_battery_hold_elapsed_count
-                )
-                contexts.power_battery_hold_UC_count = (
-                    information.hold_UC_count
-                )
-                contexts.power_battery_hold_UC_min = (
-                    information.hold_UC_min
-                )
+    def _handle_overtemperature_hold_information(
+            self,
+            information: OvertemperatureHoldInformation,
+            updates: dict[str, Any],
+    ) -> None:
+        self._handle_hold_information(
+            'OT',
+            information.hold_elapsed_count,
+            information.hold_OT_count,
+            'max',
+            information.hold_OT_max,
+            updates,
+        )
 
-                if self.print_log:
-                    print(
-                        f'{datetime.now().time()} UC_hold '
-                        f'elapsed_count={information.hold_elapsed_count} '
-                        f'UC_count={information.hold_UC_count} '
-                        f'UC_min={information.hold_UC_min}',
-                        file=log_file
-                    )
-                    log_file.flush()
-
-            # Voltages / Temperatures
-            elif isinstance(information, CellVoltagesInformation):
-                for i, voltage in information.data.items():
-                    if i < BATTERY_CELL_COUNT:
-                        contexts.power_battery_cell_voltages[i] = voltage
-            elif isinstance(information, ThermistorTemperaturesInformation):
-                for i, temperature in information.data.items():
-                    if i < BATTERY_THERMISTOR_COUNT:
-                        contexts.power_battery_thermistor_temperatures[i] = (
-                            temperature
-                        )
-
-            contexts.power_battery_heartbeat_timestamp = time()
+    def _handle_undertemperature_hold_information(
+            self,
+            information: UndertemperatureHoldInformation,
+            updates: dict[str, Any],
+    ) -> None:
+        self._handle_hold_information(
+            'UT',
+            information.hold_elapsed_count,
+            information.hold_UT_count,
+            'min',
+            information.hold_UT_min,
+            updates,
+        )
+
+    def _handle_overcurrent_hold_information(
+            self,
+            information: OvercurrentHoldInformation,
+            updates: dict[str, Any],
+    ) -> None:
+        self._handle_hold_information(
+            'OC',
+            information.hold_elapsed_count,
+            information.hold_OC_count,
+            'max',
+            information.hold_OC_max,
+            updates,
+        )
+
+    def _handle_undercurrent_hold_information(
+            self,
+            information: UndercurrentHoldInformation,
+            updates: dict[str, Any],
+    ) -> None:
+        self._handle_hold_information(
+            'UC',
+            information.hold_elapsed_count,
+            information.hold_UC_count,
+            'min',
+            information.hold_UC_min,
+            updates,
+        )
+
+    # Voltages / Temperatures
+
+    def _handle_cell_voltages_information(
+            self,
+            information: CellVoltagesInformation,
+            updates: dict[str, Any],
+    ) -> None:
+        for i, voltage in information.data.items():
+            if i < BATTERY_CELL_COUNT:
+                self._battery_cell_voltages[i] = voltage
+
+        updates['power_battery_cell_voltages'] = self._battery_cell_voltages
+        updates['power_battery_min_cell_voltage'] = (
+            self._battery_cell_voltages.minimum
+        )
+        updates['power_battery_max_cell_voltage'] = (
+            self._battery_cell_voltages.maximum
+        )
+        updates['power_battery_mean_cell_voltage'] = (
+            self._battery_cell_voltages.mean
+        )
+
+    def _handle_thermistor_temperatures_information(
+            self,
+            information: ThermistorTemperaturesInformation,
+            updates: dict[str, Any],
+    ) -> None:
+        for i, temperature in information.data.items():
+            if i < BATTERY_THERMISTOR_COUNT:
+                self._battery_thermistor_temperatures[i] = temperature
+
+        updates['power_battery_thermistor_temperatures'] = (
+            self._battery_thermistor_temperatures
+        )
+        updates['power_battery_min_thermistor_temperature'] = (
+            self._battery_thermistor_temperatures.minimum
+        )
+        updates['power_battery_max_thermistor_temperature'] = (
+            self._battery_thermistor_temperatures.maximum
+        )
+        updates['power_battery_mean_thermistor_temperature'] = (
+            self._battery_thermistor_temperatures.mean
+        )
+
+    INFORMATION_HANDLERS: ClassVar[
+        dict[
+            type[Information],
+            Callable[['Power', Any, dict[str, Any]], None],
+        ]
+    ] = {
+        # Important
+        StatusesAndHVInformation: _handle_statuses_and_HV_information,
+        OverBatteryFlagsInformation: _handle_battery_flags_information,
+        UnderBatteryFlagsInformation: _handle_battery_flags_information,
+        LVInformation: _handle_LV_information,
+        # Battery Flag Event
+        OverBatteryFlagsHoldInformation: (
+            _handle_battery_flags_hold_information
+        ),
+        UnderBatteryFlagsHoldInformation: (
+            _handle_battery_flags_hold_information
+        ),
+        OvervoltageHoldInformation: _handle_overvoltage_hold_information,
+        UndervoltageHoldInformation: _handle_undervoltage_hold_information,
+        OvertemperatureHoldInformation: (
+            _handle_overtemperature_hold_information
+        ),
+        UndertemperatureHoldInformation: (
+            _handle_undertemperature_hold_information
+        ),
+        OvercurrentHoldInformation: _handle_overcurrent_hold_information,
+        UndercurrentHoldInformation: _handle_undercurrent_hold_information,
+        # Voltages / Temperatures
+        CellVoltagesInformation: _handle_cell_voltages_information,
+        ThermistorTemperaturesInformation: (
+            _handle_thermistor_temperatures_information
+        ),
+    }
+    """The routine that records each type of information into the
+    contexts updates."""
@@ -0,0 +1,277 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from functools import partial
+from logging import getLogger
+from queue import Empty, Queue
+from threading import Condition, Event
+from time import monotonic
+from typing import ClassVar, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from serial import Serial
+
+_logger = getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RadioStatistics:
+    submitted_count: int
+    sent_count: int
+    coalesced_count: int
+    """The number of payloads replaced by a newer one before being
+    sent."""
+    retry_count: int
+    drop_count: int
+    """The number of payloads given up after the retries."""
+
+
+@dataclass
+class _Request:
+    factory: Callable[[], bytes | None]
+    transmitting: bool
+
+
+@dataclass
+class RadioTransmitter:
+    """A non-blocking transmitter of payloads through a radio module
+    driven by AT commands in LoRa P2P mode, such as the RAK3172.
+
+    The payloads are submitted under a key and sent by :meth:`write`,
+    while :meth:`read` collects the responses of the module. A payload
+    replaces the pending one of the same key, so that a busy radio only
+    sends the latest payload of each key. The payloads are produced by
+    factories called right before their sending, hence a payload that
+    depends on the previous ones is produced from those actually sent.
+
+    A command is retried while the module answers ``AT_BUSY_ERROR``,
+    another error or nothing, up to ``maximum_retry_count`` times, and
+    the payload is then dropped. A payload accepted by the module is
+    only followed by the next one once its transmission is done.
+    """
+
+    OK_RESPONSE: ClassVar[str] = 'OK'
+    ERROR_RESPONSE_PREFIX: ClassVar[str] = 'AT_'
+    TRANSMISSION_EVENT: ClassVar[str] = '+EVT:TXP2P DONE'
+    serial: 'Serial'
+    stoppage: Event
+    response_timeout: float = 1
+    """How long the module is waited for to answer a command (in
+    seconds)."""
+    transmission_timeout: float = 2
+    """How long the end of a transmission is waited for (in seconds)."""
+    maximum_retry_count: int = 3
+    retry_delay: float = 0.1
+    """The delay before a command is retried (in seconds)."""
+    drop_callback: Callable[[], object] | None = None
+    """The callable called by :meth:`write` after a payload is
+    dropped."""
+    _requests: OrderedDict[Hashable, _Request] = field(
+        default_factory=OrderedDict,
+        init=False,
+    )
+    _condition: Condition = field(default_factory=Condition, init=False)
+    _busy: bool = field(default=False, init=False)
+    _responses: 'Queue[str]' = field(default_factory=Queue, init=False)
+    _submitted_count: int = field(default=0, init=False)
+    _sent_count: int = field(default=0, init=False)
+    _coalesced_count: int = field(default=0, init=False)
+    _retry_count: int = field(default=0, init=False)
+    _drop_count: int = field(default=0, init=False)
+
+    @property
+    def statistics(self) -> RadioStatistics:
+        with self._condition:
+            return RadioStatistics(
+                self._submitted_count,
+                self._sent_count,
+                self._coalesced_count,
+                self._retry_count,
+                self._drop_count,
+            )
+
+    def configure(self, command: str) -> None:
+        """Send a command to the module, after the pending requests.
+
+        :param command: The command, without the line ending.
+        :return: ``None``.
+        """
+        self._request(
+            command,
+            _Request(f'{command}\r\n'.encode, False),
+            False,
+        )
+
+    def submit(
+            self,
+            key: Hashable,
+            factory: Callable[[], bytes | None],
+            urgent: bool = False,
+    ) -> None:
+        """Submit a payload to send, replacing the pending payload of
+        the same key.
+
+        :param key: The key of the payload.
+        :param factory: The callable that produces the payload right
+                        before its sending, or ``None`` to send nothing.
+        :param urgent: Whether the payload is sent before the pending
+                       ones.
+        :return: ``None``.
+        """
+        self._request(
+            key,
+            _Request(partial(self._format, factory), True),
+            urgent,
+        )
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait until no request is pending or being sent.
+
+        :return: ``True`` if no request is pending, otherwise ``False``.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._requests and not self._busy,
+                timeout,
+            )
+
+    def read(self) -> None:
+        """Collect the responses of the module until the stoppage is
+        set.
+
+        :return: ``None``.
+        """
+        while not self.stoppage.is_set():
+            line = self.serial.readline()
+
+            if line:
+                self._responses.put(line.decode(errors='replace').strip())
+
+    def write(self) -> None:
+        """Send the requests until the stoppage is set.
+
+        :return: ``None``.
+        """
+        while not self.stoppage.is_set():
+            with self._condition:
+                self._busy = False
+
+                self._condition.notify_all()
+
+                if not self._condition.wait_for(
+                        lambda: self._requests,
+                        self.response_timeout,
+                ):
+                    continue
+
+                _, request = self._requests.popitem(last=False)
+                self._busy = True
+
+            command = request.factory()
+
+            if command is None:
+                continue
+
+            sent = self._execute(command, request.transmitting)
+
+            if not request.transmitting:
+                if not sent:
+                    _logger.error(f'Radio rejected {repr(command)}')
+
+                continue
+
+            with self._condition:
+                if sent:
+                    self._sent_count += 1
+                else:
+                    self._drop_count += 1
+
+            if not sent:
+                _logger.warning('Dropped radio payload')
+
+                if self.drop_callback is not None:
+                    self.drop_callback()
+
+        with self._condition:
+            self._busy = False
+
+            self._condition.notify_all()
+
+    def _request(self, key: Hashable, request: _Request, urgent: bool) -> None:
+        with self._condition:
+            if key in self._requests:
+                self._coalesced_count += 1
+
+            self._requests[key] = request
+
+            if urgent:
+                self._requests.move_to_end(key, False)
+
+            if request.transmitting:
+                self._submitted_count += 1
+
+            self._condition.notify_all()
+
+    def _format(self, factory: Callable[[], bytes | None]) -> bytes | None:
+        payload = factory()
+
+        if payload is None:
+            return None
+
+        return f'AT+PSEND={payload.hex()}\r\n'.encode()
+
+    def _execute(self, command: bytes, transmitting: bool) -> bool:
+        for i in range(self.maximum_retry_count + 1):
+            if i:
+                with self._condition:
+                    self._retry_count += 1
+
+                if self.stoppage.wait(self.retry_delay):
+                    break
+
+            while not self._responses.empty():
+                self._responses.get_nowait()
+
+            self.serial.write(command)
+            self.serial.flush()
+
+            response = self._wait_response(
+                lambda response: (
+                    response == self.OK_RESPONSE
+                    or response.startswith(self.ERROR_RESPONSE_PREFIX)
+                ),
+                self.response_timeout,
+            )
+
+            if response != self.OK_RESPONSE:
+                _logger.debug(f'Radio answered {repr(response)}')
+
+                continue
+
+            if transmitting and self._wait_response(
+                    lambda response: response == self.TRANSMISSION_EVENT,
+                    self.transmission_timeout,
+            ) is None:
+                _logger.warning('Radio transmission not confirmed')
+
+            return True
+
+        return False
+
+    def _wait_response(
+            self,
+            predicate: Callable[[str], bool],
+            timeout: float,
+    ) -> str | None:
+        end_time = monotonic() + timeout
+
+        while (remaining_time := end_time - monotonic()) > 0:
+            try:
+                response = self._responses.get(timeout=remaining_time)
+            except Empty:
+                break
+
+            if predicate(response):
+                return response
+
+        return None
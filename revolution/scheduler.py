@@ -0,0 +1,412 @@
+from collections import deque
+from collections.abc import Callable, Generator, Iterator
+from dataclasses import dataclass, field
+from heapq import heappop, heappush
+from itertools import count
+from logging import getLogger
+from random import random
+from threading import Condition, current_thread, Event, Lock, Thread
+from time import monotonic
+from typing import Any
+
+from revolution.utilities import RingBuffer
+from revolution.worker import RestartPolicy
+
+_logger = getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TimingSummary:
+    p50: float
+    p99: float
+    maximum: float
+
+    @classmethod
+    def from_ring_buffer(cls, ring_buffer: RingBuffer) -> 'TimingSummary':
+        return cls(
+            ring_buffer.quantile(0.5),
+            ring_buffer.quantile(0.99),
+            ring_buffer.maximum,
+        )
+
+
+@dataclass(frozen=True)
+class TaskStatistics:
+    """The timing of a periodic task.
+
+    The counts cover all runs while the timing summaries only cover the
+    latest runs kept by the scheduler. All times are in seconds.
+    """
+
+    name: str
+    period: float
+    run_count: int
+    overrun_count: int
+    """The number of runs that ended after, and so missed, the next
+    deadline."""
+    skip_count: int
+    """The number of deadlines skipped because of overruns."""
+    periods: TimingSummary
+    """The times between the starts of consecutive runs."""
+    execution_times: TimingSummary
+    """How long the runs took."""
+    latencies: TimingSummary
+    """How late the runs started relative to their deadlines."""
+
+
+@dataclass(eq=False)
+class PeriodicTask:
+    """A task run by a :class:`Scheduler` on absolute deadlines.
+
+    The deadlines are ``period`` seconds apart, no matter how long each
+    run takes, so the task does not drift. If a run ends after the next
+    deadline, the missed deadlines are skipped instead of being caught
+    up on.
+
+    If the target returns a generator, the generator is resumed once per
+    deadline instead, so that a loop keeps its local state between runs.
+    The task is cancelled when the generator is exhausted. Like a
+    :class:`revolution.worker.Worker`, the target is called again when
+    an exception is raised, with the next run delayed according to the
+    restart policy.
+    """
+
+    scheduler: 'Scheduler'
+    target: Callable[[], object]
+    period: float
+    name: str
+    _deadline: float
+    restart_policy: RestartPolicy = RestartPolicy()
+    """How the runs are delayed after errors."""
+    _cancellation: bool = field(default=False, init=False)
+    _wakeup: Event = field(default_factory=Event, init=False)
+    _idleness: Event = field(default_factory=Event, init=False)
+    _thread: Thread | None = field(default=None, init=False)
+    _generator: Generator[Any, None, Any] | None = field(
+        default=None,
+        init=False,
+    )
+    _run_count: int = field(default=0, init=False)
+    _overrun_count: int = field(default=0, init=False)
+    _skip_count: int = field(default=0, init=False)
+    _start_time: float | None = field(default=None, init=False)
+    _periods: RingBuffer = field(init=False)
+    _execution_times: RingBuffer = field(init=False)
+    _latencies: RingBuffer = field(init=False)
+    _statistics_lock: Lock = field(default_factory=Lock, init=False)
+    _restart_delay: float = field(init=False)
+    _restart_times: deque[float] = field(init=False)
+
+    def __post_init__(self) -> None:
+        policy = self.restart_policy
+        self._restart_delay = policy.initial_delay
+        self._restart_times = deque(maxlen=policy.maximum_restart_count)
+
+        self._idleness.set()
+
+        self._periods = RingBuffer(self.scheduler.sample_count)
+        self._execution_times = RingBuffer(self.scheduler.sample_count)
+        self._latencies = RingBuffer(self.scheduler.sample_count)
+
+    @property
+    def statistics(self) -> TaskStatistics:
+        with self._statistics_lock:
+            return TaskStatistics(
+                self.name,
+                self.period,
+                self._run_count,
+                self._overrun_count,
+                self._skip_count,
+                TimingSummary.from_ring_buffer(self._periods),
+                TimingSummary.from_ring_buffer(self._execution_times),
+                TimingSummary.from_ring_buffer(self._latencies),
+            )
+
+    def cancel(self, block: bool = True) -> None:
+        """Cancel the task.
+
+        :param block: Whether to wait for the current run to end, unless
+                      called from the run itself.
+        :return: ``None``.
+        """
+        self.scheduler._cancel(self)
+
+        if block and self._thread is not current_thread():
+            self._idleness.wait()
+
+    def _run(self) -> None:
+        start_time = monotonic()
+        restart_timeout = None
+
+        try:
+            if self._generator is None:
+                result = self.target()
+
+                if isinstance(result, Generator):
+                    self._generator = result
+
+            if self._generator is not None:
+                next(self._generator)
+        except StopIteration:
+            self._generator = None
+            self._cancellation = True
+        except:  # noqa: E722
+            restart_timeout = self._back_off()
+
+            _logger.exception(
+                (
+                    'Exception raised during task call, restarting in'
+                    f' {restart_timeout:.3f} seconds'
+                ),
+            )
+
+            self._generator = None
+        else:
+            self._restart_delay = self.restart_policy.initial_delay
+
+        end_time = monotonic()
+        deadline = self._deadline + self.period
+
+        if restart_timeout is not None:
+            deadline = max(deadline, end_time + restart_timeout)
+
+        with self._statistics_lock:
+            if self._start_time is not None:
+                self._periods.append(start_time - self._start_time)
+
+            self._execution_times.append(end_time - start_time)
+            self._latencies.append(start_time - self._deadline)
+
+            self._run_count += 1
+
+            if deadline <= end_time:
+                skip_count = int((end_time - deadline) // self.period) + 1
+                deadline += skip_count * self.period
+                self._overrun_count += 1
+                self._skip_count += skip_count
+
+        self._start_time = start_time
+        self._deadline = deadline
+
+    def _back_off(self) -> float:
+        policy = self.restart_policy
+        time_ = monotonic()
+        timeout = self._restart_delay * (1 - policy.jitter * random())
+
+        if (
+                self._restart_times
+                and len(self._restart_times) == self._restart_times.maxlen
+        ):
+            timeout = max(
+                timeout,
+                self._restart_times[0] + policy.restart_window - time_,
+            )
+
+        self._restart_times.append(time_ + timeout)
+        self._restart_delay = min(
+            self._restart_delay * policy.multiplier,
+            policy.maximum_delay,
+        )
+
+        return timeout
+
+
+@dataclass
+class Scheduler:
+    """A scheduler that runs periodic tasks on a small pool of threads.
+
+    The threads are started when the first task is scheduled. A task
+    that must not wait behind the others, such as a safety-critical
+    control loop, can be given a dedicated thread instead.
+
+    >>> scheduler = Scheduler()
+    >>> counter = 0
+    >>> def target():
+    ...     global counter
+    ...     counter += 1
+    ...     while True:
+    ...         yield
+    ...         counter += 1
+    >>> task = scheduler.schedule(target, 0.01)
+    >>> _ = Event().wait(0.1)
+    >>> task.cancel()
+    >>> 5 <= counter <= 11
+    True
+    >>> task.statistics.run_count == counter
+    True
+    """
+
+    thread_count: int = 1
+    sample_count: int = 1000
+    """The number of latest runs the timing summaries cover."""
+    restart_policy: RestartPolicy = RestartPolicy()
+    """How the runs of a task are delayed after errors, unless the task
+    has its own policy."""
+    _tasks: list[PeriodicTask] = field(default_factory=list, init=False)
+    _queue: list[tuple[float, int, PeriodicTask]] = field(
+        default_factory=list,
+        init=False,
+    )
+    _counter: Iterator[int] = field(default_factory=count, init=False)
+    _condition: Condition = field(default_factory=Condition, init=False)
+    _threads: list[Thread] = field(default_factory=list, init=False)
+
+    def schedule(
+            self,
+            target: Callable[[], object],
+            period: float,
+            name: str | None = None,
+            delay: float | None = None,
+            dedicated: bool = False,
+            restart_policy: RestartPolicy | None = None,
+    ) -> PeriodicTask:
+        """Schedule the target to run every ``period`` seconds.
+
+        :param name: The task name, which defaults to the name of the
+                     target.
+        :param delay: The delay of the first deadline, which defaults to
+                      the period.
+        :param dedicated: Whether the task runs on its own thread rather
+                          than on the shared pool.
+        :param restart_policy: How the runs are delayed after errors,
+                               which defaults to the policy of the
+                               scheduler.
+        :return: The task.
+        """
+        if name is None:
+            name = getattr(target, '__qualname__', None) or repr(target)
+
+        if delay is None:
+            delay = period
+
+        if restart_policy is None:
+            restart_policy = self.restart_policy
+
+        task = PeriodicTask(
+            self,
+            target,
+            period,
+            name,
+            monotonic() + delay,
+            restart_policy,
+        )
+
+        if dedicated:
+            with self._condition:
+                self._tasks.append(task)
+
+            Thread(
+                target=self._run_dedicated,
+                args=(task,),
+                name=f'{type(self).__name__}-{name}',
+                daemon=True,
+            ).start()
+
+            return task
+
+        with self._condition:
+            if not self._threads:
+                for i in range(self.thread_count):
+                    thread = Thread(
+                        target=self._run,
+                        name=f'{type(self).__name__}-{i}',
+                        daemon=True,
+                    )
+
+                    thread.start()
+                    self._threads.append(thread)
+
+            self._tasks.append(task)
+            self._push(task)
+
+        return task
+
+    def get_task_statistics(self) -> dict[str, TaskStatistics]:
+        with self._condition:
+            tasks = self._tasks.copy()
+
+        return {task.name: task.statistics for task in tasks}
+
+    def _push(self, task: PeriodicTask) -> None:
+        heappush(self._queue, (task._deadline, next(self._counter), task))
+        self._condition.notify()
+
+    def _cancel(self, task: PeriodicTask) -> None:
+        with self._condition:
+            task._cancellation = True
+
+            if task in self._tasks:
+                self._tasks.remove(task)
+
+        task._wakeup.set()
+
+    def _run_dedicated(self, task: PeriodicTask) -> None:
+        while True:
+            timeout = task._deadline - monotonic()
+
+            if timeout > 0:
+                task._wakeup.wait(timeout)
+
+            with self._condition:
+                if task._cancellation:
+                    break
+
+                if task._deadline > monotonic():
+                    continue
+
+                task._idleness.clear()
+
+                task._thread = current_thread()
+
+            task._run()
+
+            with self._condition:
+                task._thread = None
+
+                task._idleness.set()
+
+                if task._cancellation:
+                    break
+
+        with self._condition:
+            if task in self._tasks:
+                self._tasks.remove(task)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    timeout = None
+
+                    if self._queue:
+                        deadline, _, task = self._queue[0]
+
+                        if task._cancellation:
+                            heappop(self._queue)
+
+                            continue
+
+                        timeout = deadline - monotonic()
+
+                        if timeout <= 0:
+                            heappop(self._queue)
+                            task._idleness.clear()
+
+                            task._thread = current_thread()
+
+                            break
+
+                    self._condition.wait(timeout)
+
+            task._run()
+
+            with self._condition:
+                task._thread = None
+
+                task._idleness.set()
+
+                if task._cancellation:
+                    if task in self._tasks:
+                        self._tasks.remove(task)
+                else:
+                    self._push(task)
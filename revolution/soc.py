@@ -0,0 +1,269 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from os import fsync, replace
+from struct import error, Struct
+from typing import ClassVar, TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+if TYPE_CHECKING:
+    from battlib import Battery
+
+
+@dataclass
+class BatchedEKFSOCEstimator:
+    """An extended Kalman filter (EKF) estimator of the state of charge
+    (SOC) of many cells of one battery model at once.
+
+    Each cell follows the model of :class:`battlib.EKFSOCEstimator`,
+    but the states and covariances of the cells are rows of NumPy
+    arrays, so that every cell is predicted and updated by the same few
+    vectorized operations. The model and the current are shared by the
+    cells, which makes the innovation covariance of each cell a scalar
+    that needs no matrix inversion.
+
+    A cell is estimated from its first nonzero voltage on, like an
+    :class:`battlib.EKFSOCEstimator` created from that voltage. Like the
+    latter, it is then updated with every voltage, including zeros.
+
+    The estimation can be saved to a checkpoint file and restored from
+    it, so that the cells are not estimated again from their voltages
+    after a restart.
+    """
+
+    STATE_SIZE: ClassVar[int] = 3
+    CHECKPOINT_MAGIC: ClassVar[bytes] = b'SOC1'
+    CHECKPOINT_HEADER: ClassVar[Struct] = Struct('<4sHd')
+    """The header of a checkpoint, with the magic, the number of cells
+    and the timestamp. The header is followed by the initializations,
+    the states and the upper triangles of the covariances.
+    """
+    battery: 'Battery'
+    count: int
+    states: npt.NDArray[np.float64] = field(init=False)
+    """The state vectors of the cells, whose first element is the
+    SOC."""
+    covariances: npt.NDArray[np.float64] = field(init=False)
+    """The covariance matrices of the state vectors of the cells."""
+    initializations: npt.NDArray[np.bool_] = field(init=False)
+    """Whether each cell is estimated."""
+
+    def __post_init__(self) -> None:
+        battery = self.battery
+        self.states = np.zeros((self.count, self.STATE_SIZE))
+        self.covariances = np.zeros(
+            (self.count, self.STATE_SIZE, self.STATE_SIZE),
+        )
+        self.initializations = np.zeros(self.count, np.bool_)
+        self._initial_covariance = np.diag(
+            [battery.var_z, battery.var_i_ct, battery.var_i_d],
+        )
+        self._process_noise = np.eye(self.STATE_SIZE) * battery.var_in
+        self._jacobian = np.array([0, -battery.r_ct, -battery.r_d])
+        self._identity = np.eye(self.STATE_SIZE)
+        self._ocvs = np.asarray(battery.ocv, np.float64)
+        self._socs = np.asarray(battery.soc, np.float64)
+        self._lower_ocv_slope = (
+            (self._ocvs[1] - self._ocvs[0])
+            / (self._socs[1] - self._socs[0])
+        )
+        self._upper_ocv_slope = (
+            (self._ocvs[-1] - self._ocvs[-2])
+            / (self._socs[-1] - self._socs[-2])
+        )
+
+    @property
+    def socs(self) -> npt.NDArray[np.float64]:
+        """The SOCs of the cells, which are zero for the cells not
+        estimated.
+        """
+        return self.states[:, 0]
+
+    def initialize(self, voltages: Iterable[float]) -> None:
+        """Start estimating the cells not yet estimated whose voltage is
+        nonzero.
+
+        :param voltages: The voltages of the cells (in volts).
+        :return: ``None``.
+        """
+        voltage_array = np.fromiter(voltages, np.float64, self.count)
+        mask = ~self.initializations & (voltage_array != 0)
+        self.states[mask] = 0
+        self.states[mask, 0] = np.interp(
+            voltage_array[mask],
+            self._ocvs,
+            self._socs,
+        )
+        self.covariances[mask] = self._initial_covariance
+        self.initializations |= mask
+
+    def step(
+            self,
+            *,
+            dt: float,
+            i_in: float,
+            measured_vs: Iterable[float],
+    ) -> None:
+        """Predict and update the estimated cells.
+
+        :param dt: The time step (in seconds).
+        :param i_in: The input current (in amperes).
+        :param measured_vs: The measured voltages of the cells (in
+                            volts).
+        :return: ``None``.
+        """
+        measured_v_array = np.fromiter(measured_vs, np.float64, self.count)
+        mask = self.initializations
+
+        if not mask.any():
+            return
+
+        battery = self.battery
+        charge_transfer_decay = np.exp(-dt / (battery.r_ct * battery.c_ct))
+        diffusion_decay = np.exp(-dt / (battery.r_d * battery.c_d))
+        transition = np.array([1, charge_transfer_decay, diffusion_decay])
+        control = np.array(
+            [
+                -battery.coulomb_eta * dt / battery.q_cap,
+                1 - charge_transfer_decay,
+                1 - diffusion_decay,
+            ],
+        ) * i_in
+        jacobian = self._jacobian
+        states = self.states[mask] * transition + control
+        covariances = (
+            self.covariances[mask] * np.outer(transition, transition)
+            + self._process_noise
+        )
+        covariance_jacobians = covariances @ jacobian
+        innovation_covariances = (
+            covariance_jacobians @ jacobian
+            + battery.var_sens
+        )
+        gains = covariance_jacobians / innovation_covariances[:, np.newaxis]
+        innovations = measured_v_array[mask] - (
+            self._intexterp_ocvs(states[:, 0])
+            + states @ jacobian
+            - battery.r_int * i_in
+        )
+        self.states[mask] = states + gains * innovations[:, np.newaxis]
+        factors = (
+            self._identity
+            - gains[:, :, np.newaxis] * jacobian[np.newaxis, np.newaxis]
+        )
+        self.covariances[mask] = (
+            factors @ covariances @ factors.transpose(0, 2, 1)
+            + (
+                gains[:, :, np.newaxis]
+                * gains[:, np.newaxis]
+                * battery.var_sens
+            )
+        )
+
+    def save(self, filepath: str, timestamp: float) -> None:
+        """Save the estimation to a checkpoint file.
+
+        The checkpoint is written to a temporary file which then
+        atomically replaces the checkpoint file, so that the latter is
+        never partially written.
+
+        :param filepath: The path of the checkpoint file.
+        :param timestamp: The timestamp of the estimation.
+        :return: ``None``.
+        """
+        rows, columns = np.triu_indices(self.STATE_SIZE)
+        temporary_filepath = f'{filepath}.tmp'
+
+        with open(temporary_filepath, 'wb') as file:
+            file.write(
+                self.CHECKPOINT_HEADER.pack(
+                    self.CHECKPOINT_MAGIC,
+                    self.count,
+                    timestamp,
+                ),
+            )
+            file.write(self.initializations.tobytes())
+            file.write(self.states.astype('<f8').tobytes())
+            file.write(
+                self.covariances[:, rows, columns].astype('<f8').tobytes(),
+            )
+            file.flush()
+            fsync(file.fileno())
+
+        replace(temporary_filepath, filepath)
+
+    def restore(
+            self,
+            filepath: str,
+            timestamp: float,
+            maximum_age: float,
+    ) -> bool:
+        """Restore the estimation from a checkpoint file if the
+        checkpoint is recent.
+
+        :param filepath: The path of the checkpoint file.
+        :param timestamp: The current timestamp.
+        :param maximum_age: The maximum age of the checkpoint (in
+                            seconds).
+        :return: ``True`` if the estimation is restored, otherwise
+                 ``False``.
+        :raise OSError: If the checkpoint file cannot be read.
+        :raise ValueError: If the checkpoint is invalid.
+        """
+        with open(filepath, 'rb') as file:
+            data = file.read()
+
+        try:
+            magic, count, checkpoint_timestamp = (
+                self.CHECKPOINT_HEADER.unpack_from(data)
+            )
+        except error as exception:
+            raise ValueError('truncated checkpoint header') from exception
+
+        if magic != self.CHECKPOINT_MAGIC:
+            raise ValueError(f'unknown checkpoint magic {repr(magic)}')
+
+        if count != self.count:
+            raise ValueError(f'checkpoint of {count} cells, not {self.count}')
+
+        rows, columns = np.triu_indices(self.STATE_SIZE)
+        offset = self.CHECKPOINT_HEADER.size
+        sizes = count, count * self.STATE_SIZE, count * len(rows)
+
+        if len(data) != offset + sizes[0] + 8 * (sizes[1] + sizes[2]):
+            raise ValueError('checkpoint of invalid size')
+
+        if not 0 <= timestamp - checkpoint_timestamp <= maximum_age:
+            return False
+
+        initializations = np.frombuffer(data, np.bool_, sizes[0], offset)
+        offset += sizes[0]
+        states = np.frombuffer(data, '<f8', sizes[1], offset)
+        offset += 8 * sizes[1]
+        triangles = np.frombuffer(data, '<f8', sizes[2], offset)
+        self.initializations[:] = initializations
+        self.states[:] = states.reshape(count, self.STATE_SIZE)
+        triangles = triangles.reshape(count, len(rows))
+        self.covariances[:, rows, columns] = triangles
+        self.covariances[:, columns, rows] = triangles
+
+        return True
+
+    def _intexterp_ocvs(
+            self,
+            socs: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        ocvs = np.interp(socs, self._socs, self._ocvs)
+        ocvs = np.where(
+            socs < self._socs[0],
+            self._ocvs[0] + self._lower_ocv_slope * (socs - self._socs[0]),
+            ocvs,
+        )
+        ocvs = np.where(
+            self._socs[-1] < socs,
+            self._ocvs[-1] + self._upper_ocv_slope * (socs - self._socs[-1]),
+            ocvs,
+        )
+
+        return ocvs
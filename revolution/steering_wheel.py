@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 from enum import Enum, IntEnum
-from typing import ClassVar
+from typing import ClassVar, TYPE_CHECKING
 from warnings import warn
 
-from periphery import GPIO, SPI
+if TYPE_CHECKING:
+    from periphery import GPIO, SPI
 
 
 class DisplayItem(IntEnum):
@@ -79,15 +80,15 @@ class SteeringWheel:
     """The supported spi bit order."""
     SPI_WORD_BIT_COUNT: ClassVar[int] = 8
     """The supported spi number of bits per word."""
-    spi: SPI
+    spi: 'SPI'
     """The SPI for the steering wheel."""
-    interrupt_gpio: GPIO
+    interrupt_gpio: 'GPIO'
     """The interrupt pin for button toggles."""
     INTERRUPT_DIRECTION: ClassVar[str] = 'in'
     """The INTERRUPT GPIO direction."""
     INTERRUPT_INVERTED: ClassVar[bool] = False
     """The INTERRUPT GPIO inverted status."""
-    fault_light_gpio: GPIO
+    fault_light_gpio: 'GPIO'
     """The LED for BPS fault."""
     FAULT_LIGHT_DIRECTION: ClassVar[str] = 'out'
     """The FAULT LIGHT GPIO direction."""
@@ -1,13 +1,18 @@
+from collections.abc import Callable
 from dataclasses import dataclass, fields
-from hashlib import md5
+from functools import partial
 from logging import getLogger
-from typing import ClassVar
-
-from databrief import dump
+from time import monotonic
+from typing import Any, ClassVar
 
 from revolution.application import Application
-from revolution.environment import Endpoint, Header, Message
-from revolution.worker import Worker
+from revolution.environment import Endpoint, Partition
+from revolution.radio import RadioTransmitter
+from revolution.telemetry_codec import (
+    telemetry_field,
+    TelemetryEncoder,
+    TelemetryLayout,
+)
 
 _logger = getLogger(__name__)
 
@@ -18,125 +23,306 @@ class Telemetry(Application):
 
     @dataclass
     class Data:
-        driver_steering_wheel_heartbeat_working: bool
-
-        motor_acceleration_input: float
-        motor_cruise_control_status_input: bool
-        motor_cruise_control_velocity: float
-        motor_variable_field_magnet_position: int
-        motor_velocity: float
-        motor_heartbeat_working: bool
-        motor_controller_error_flags: int
-
-        power_array_relay_status_input: bool
-        power_array_relay_status: bool
-
-        power_battery_relay_status_input: bool
-        power_battery_min_cell_voltage: float
-        power_battery_max_cell_voltage: float
-        power_battery_mean_cell_voltage: float
-        power_battery_max_thermistor_temperature: float
-        power_battery_mean_thermistor_temperature: float
-
-        power_battery_HV_current: float
-        power_battery_LV_voltage: float
-        power_battery_LV_current: float
-        power_battery_supp_voltage: float
-        power_battery_relay_status: bool
-        power_battery_electric_safe_discharge_status: bool
-        power_battery_discharge_status: bool
-        power_battery_heartbeat_working: bool
-
-        power_battery_flags: int
-        power_battery_flags_hold: int
-
-        power_battery_min_state_of_charge: float
-        power_battery_max_state_of_charge: float
-        power_battery_mean_state_of_charge: float
-
-        power_psm_battery_current: float
-        power_psm_battery_voltage: float
-        power_psm_array_current: float
-        power_psm_array_voltage: float
-        power_psm_motor_current: float
-        power_psm_motor_voltage: float
-
-        miscellaneous_latitude: float
-        miscellaneous_longitude: float
-        miscellaneous_altitude: float
-        miscellaneous_gps_speed_kmh: float
-
-        def serialize(self) -> bytes:
-            return dump(self, 2, 2)
+        driver_steering_wheel_heartbeat_working: bool = telemetry_field(
+            '?',
+            priority=3,
+            urgent=True,
+        )
+
+        motor_acceleration_input: float = telemetry_field(
+            'h',
+            0.001,
+            priority=1,
+        )
+        motor_cruise_control_status_input: bool = telemetry_field('?')
+        motor_cruise_control_velocity: float = telemetry_field('h', 0.01)
+        motor_variable_field_magnet_position: int = telemetry_field(
+            'h',
+            period=5,
+        )
+        motor_velocity: float = telemetry_field('h', 0.01, priority=2)
+        motor_heartbeat_working: bool = telemetry_field(
+            '?',
+            priority=3,
+            urgent=True,
+        )
+        motor_controller_error_flags: int = telemetry_field(
+            'H',
+            priority=3,
+            urgent=True,
+        )
+
+        power_array_relay_status_input: bool = telemetry_field('?')
+        power_array_relay_status: bool = telemetry_field('?', priority=2)
+
+        power_battery_relay_status_input: bool = telemetry_field('?')
+        power_battery_min_cell_voltage: float = telemetry_field(
+            'h',
+            0.001,
+            priority=2,
+        )
+        power_battery_max_cell_voltage: float = telemetry_field(
+            'h',
+            0.001,
+            priority=2,
+        )
+        power_battery_mean_cell_voltage: float = telemetry_field(
+            'h',
+            0.001,
+            period=5,
+        )
+        power_battery_max_thermistor_temperature: float = telemetry_field(
+            'h',
+            0.1,
+            priority=2,
+        )
+        power_battery_mean_thermistor_temperature: float = telemetry_field(
+            'h',
+            0.1,
+            period=5,
+        )
+
+        power_battery_HV_current: float = telemetry_field(
+            'h',
+            0.01,
+            priority=2,
+        )
+        power_battery_LV_voltage: float = telemetry_field(
+            'h',
+            0.01,
+            period=5,
+        )
+        power_battery_LV_current: float = telemetry_field(
+            'h',
+            0.01,
+            period=5,
+        )
+        power_battery_supp_voltage: float = telemetry_field(
+            'h',
+            0.01,
+            period=5,
+        )
+        power_battery_relay_status: bool = telemetry_field('?', priority=2)
+        power_battery_electric_safe_discharge_status: bool = (
+            telemetry_field('?', priority=2)
+        )
+        power_battery_discharge_status: bool = telemetry_field(
+            '?',
+            priority=2,
+        )
+        power_battery_heartbeat_working: bool = telemetry_field(
+            '?',
+            priority=3,
+            urgent=True,
+        )
+
+        power_battery_flags: int = telemetry_field(
+            'B',
+            priority=3,
+            urgent=True,
+        )
+        power_battery_flags_hold: int = telemetry_field(
+            'B',
+            priority=3,
+            urgent=True,
+        )
+
+        power_battery_min_state_of_charge: float = telemetry_field(
+            'h',
+            0.0001,
+            period=10,
+        )
+        power_battery_max_state_of_charge: float = telemetry_field(
+            'h',
+            0.0001,
+            period=10,
+        )
+        power_battery_mean_state_of_charge: float = telemetry_field(
+            'h',
+            0.0001,
+            period=10,
+        )
+
+        power_psm_battery_current: float = telemetry_field(
+            'h',
+            0.01,
+            priority=1,
+        )
+        power_psm_battery_voltage: float = telemetry_field(
+            'h',
+            0.01,
+            priority=1,
+        )
+        power_psm_array_current: float = telemetry_field(
+            'h',
+            0.01,
+            priority=1,
+        )
+        power_psm_array_voltage: float = telemetry_field(
+            'h',
+            0.01,
+            priority=1,
+        )
+        power_psm_motor_current: float = telemetry_field(
+            'h',
+            0.01,
+            priority=1,
+        )
+        power_psm_motor_voltage: float = telemetry_field(
+            'h',
+            0.01,
+            priority=1,
+        )
+
+        miscellaneous_latitude: float = telemetry_field('i', 1e-7)
+        miscellaneous_longitude: float = telemetry_field('i', 1e-7)
+        miscellaneous_altitude: float = telemetry_field('h', 0.1, period=10)
+        miscellaneous_gps_speed_kmh: float = telemetry_field('h', 0.01)
 
     def _setup(self) -> None:
         super()._setup()
 
-        self._telemetry_worker = Worker(target=self._telemetry)
-        self._can_worker = Worker(target=self._can)
+        settings = self.environment.settings
+        layout = TelemetryLayout(self.Data)
+        self._encoder = TelemetryEncoder(
+            layout,
+            settings.telemetry_keyframe_interval,
+            (
+                settings.telemetry_radio_maximum_payload_size
+                - len(settings.telemetry_begin_token)
+                - len(settings.telemetry_end_token)
+            ),
+        )
+        self._transmitter = RadioTransmitter(
+            self.environment.peripheries.telemetry_radio_serial,
+            self._stoppage,
+            settings.telemetry_radio_response_timeout,
+            settings.telemetry_radio_transmission_timeout,
+            settings.telemetry_radio_maximum_retry_count,
+            settings.telemetry_radio_retry_delay,
+            self._encoder.reset,
+        )
+        self._urgent_subscription = self._subscribe(
+            *(
+                name
+                for name, schedule in zip(layout.names, layout.schedules)
+                if schedule.urgent
+            ),
+        )
+        self._radio_reader_worker = self.environment.create_worker(
+            self._transmitter.read,
+            self._stoppage,
+        )
+        self._radio_writer_worker = self.environment.create_worker(
+            self._transmitter.write,
+            self._stoppage,
+        )
+        self._telemetry_worker = self.environment.create_worker(
+            self._telemetry,
+            self._stoppage,
+        )
 
+        self._radio_reader_worker.start()
+        self._radio_writer_worker.start()
         self._telemetry_worker.start()
-        self._can_worker.start()
 
     def _teardown(self) -> None:
         self._telemetry_worker.join()
-        self._can_worker.join()
+        self._radio_writer_worker.join()
+        self._radio_reader_worker.join()
+        self._urgent_subscription.close()
 
     def _telemetry(self) -> None:
-        p2p_command = (
-            f"AT+P2P={self.environment.settings.telemetry_radio_frequency}"
-            f":{self.environment.settings.telemetry_radio_spreading_factor}"
-            f":{self.environment.settings.telemetry_radio_bandwidth}"
-            f":{self.environment.settings.telemetry_radio_code_rate}"
-            f":{self.environment.settings.telemetry_radio_preamble_length}"
-            f":{self.environment.settings.telemetry_radio_tx_power}\r\n"
-        )
-        serial = self.environment.peripheries.telemetry_radio_serial
-        serial.write(p2p_command.encode())
-        serial.flush()
-
-        while (
-                not self._stoppage.wait(
-                    self.environment.settings.telemetry_timeout,
-                )
-        ):
+        settings = self.environment.settings
+
+        self._transmitter.configure(
+            (
+                f'AT+P2P={settings.telemetry_radio_frequency}'
+                f':{settings.telemetry_radio_spreading_factor}'
+                f':{settings.telemetry_radio_bandwidth}'
+                f':{settings.telemetry_radio_code_rate}'
+                f':{settings.telemetry_radio_preamble_length}'
+                f':{settings.telemetry_radio_tx_power}'
+            ),
+        )
+
+        frame_time = monotonic()
+
+        while not self._stoppage.is_set():
+            changed_names = self._urgent_subscription.wait(
+                max(frame_time - monotonic(), 0),
+            )
+
+            if self._stoppage.is_set():
+                break
+
+            timestamp = monotonic()
+
+            if timestamp < frame_time and not changed_names:
+                continue
+
             kwargs = {}
 
-            with self.environment.contexts() as contexts:
-                for field in fields(self.Data):
-                    name = field.name
-                    kwargs[name] = getattr(contexts, name)
+            contexts = self.environment.contexts.snapshot()
+
+            for field in fields(self.Data):
+                name = field.name
+                kwargs[name] = getattr(contexts, name)
 
             data = self.Data(**kwargs)
-            data_token = data.serialize()
-            checksum_token = md5(data_token).hexdigest().encode()
-            tokens = (
-                self.environment.settings.telemetry_begin_token,
-                data_token,
-                self.environment.settings.telemetry_separator_token,
-                checksum_token,
-                self.environment.settings.telemetry_end_token,
-            )
-            raw_data = b''.join(tokens)
-            hex_payload = raw_data.hex()
-            at_command = f"AT+PSEND={hex_payload}\r\n".encode()
-            # print(
-            #     f'data_token={len(data_token)} '
-            #     f'checksum_token={len(checksum_token)} '
-            #     f'raw={len(raw_data)} hex={len(hex_payload)} '
-            #     f'at={len(at_command)}\n'
-            # )
-            self.environment.peripheries.telemetry_radio_serial.write(
-                at_command
-            )
-            self.environment.peripheries.telemetry_radio_serial.flush()
 
-    def _can(self) -> None:
-        while not self._stoppage.is_set():
-            can_message = self.environment.peripheries.general_can_bus.recv(
-                self.environment.settings.telemetry_timeout,
+            if timestamp < frame_time:
+                self._transmitter.submit(
+                    'urgent',
+                    partial(
+                        self._encode,
+                        self._encoder.encode_urgent,
+                        data,
+                        timestamp,
+                    ),
+                    True,
+                )
+
+                continue
+
+            self._transmitter.submit(
+                'periodic',
+                partial(self._encode, self._encoder.encode, data, timestamp),
             )
 
-            if can_message is not None:
-                message = Message(Header.CAN, (can_message,))
-                self.environment.send_all(message)
+            frame_time += settings.telemetry_timeout
+
+            if frame_time < timestamp:
+                frame_time = timestamp + settings.telemetry_timeout
+
+            statistics = self._transmitter.statistics
+
+            with self.environment.contexts(Partition.TELEMETRY) as contexts:
+                contexts.telemetry_radio_submitted_count = (
+                    statistics.submitted_count
+                )
+                contexts.telemetry_radio_sent_count = statistics.sent_count
+                contexts.telemetry_radio_coalesced_count = (
+                    statistics.coalesced_count
+                )
+                contexts.telemetry_radio_retry_count = statistics.retry_count
+                contexts.telemetry_radio_drop_count = statistics.drop_count
+
+    def _encode(
+            self,
+            encode: Callable[[Any, float], bytes | None],
+            data: Any,
+            timestamp: float,
+    ) -> bytes | None:
+        frame = encode(data, timestamp)
+
+        if frame is None:
+            return None
+
+        return b''.join(
+            (
+                self.environment.settings.telemetry_begin_token,
+                frame,
+                self.environment.settings.telemetry_end_token,
+            ),
+        )
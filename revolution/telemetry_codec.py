@@ -0,0 +1,479 @@
+from binascii import crc_hqx
+from dataclasses import dataclass, field, fields, is_dataclass
+from enum import IntEnum
+from math import isfinite
+from struct import calcsize, error as StructError, pack, Struct
+from time import monotonic
+from typing import Any, ClassVar, get_type_hints
+
+_QUANTIZATION_KEY = 'quantization'
+_SCHEDULE_KEY = 'schedule'
+
+
+class FrameType(IntEnum):
+    KEYFRAME = 0
+    """A frame with all fields."""
+    DELTA = 1
+    """A frame with only the fields changed since the previous frame."""
+
+
+@dataclass(frozen=True)
+class Quantization:
+    """How a field is quantized into an integer for telemetry.
+
+    The field is sent as a multiple of ``resolution`` packed with the
+    ``struct`` format character ``format``. Values out of range are
+    clipped. Non-finite floats are sent as the minimum of the format,
+    which is excluded from the range of finite values.
+
+    >>> quantization = Quantization('h', 0.01)
+    >>> quantization.quantize(3.14159)
+    314
+    >>> quantization.dequantize(314)
+    3.14
+    >>> quantization.quantize(1e9)
+    32767
+    >>> quantization.dequantize(quantization.quantize(float('nan')))
+    nan
+    """
+
+    format: str
+    resolution: float = 1
+    value_type: type = float
+    size: int = field(init=False)
+    minimum: int = field(init=False)
+    maximum: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'size', calcsize(f'<{self.format}'))
+
+        if self.format == '?':
+            minimum, maximum = 0, 1
+        else:
+            bit_count = 8 * calcsize(self.format)
+
+            if self.format.islower():
+                minimum = -(1 << (bit_count - 1))
+                maximum = (1 << (bit_count - 1)) - 1
+            else:
+                minimum = 0
+                maximum = (1 << bit_count) - 1
+
+            if self.value_type is float:
+                if not minimum:
+                    raise ValueError('float fields need a signed format')
+
+                minimum += 1
+
+        object.__setattr__(self, 'minimum', minimum)
+        object.__setattr__(self, 'maximum', maximum)
+
+    def quantize(self, value: Any) -> int:
+        if self.value_type is float:
+            if not isfinite(value):
+                return self.minimum - 1
+
+            quantized_value: int = round(value / self.resolution)
+        else:
+            quantized_value = int(value)
+
+        return min(max(quantized_value, self.minimum), self.maximum)
+
+    def dequantize(self, value: int) -> Any:
+        if self.value_type is float:
+            if value < self.minimum:
+                return float('nan')
+
+            return round(value * self.resolution, 12)
+
+        return self.value_type(value)
+
+
+@dataclass(frozen=True)
+class TelemetrySchedule:
+    """When a field is sent in delta frames."""
+
+    period: float = 0
+    """The shortest time between two sendings of the field (in
+    seconds)."""
+    priority: int = 0
+    """The precedence of the field when a frame cannot fit all changed
+    fields (higher first)."""
+    urgent: bool = False
+    """Whether a change of the field is sent at once, out of band."""
+
+
+def telemetry_field(
+        format_: str,
+        resolution: float = 1,
+        *,
+        period: float = 0,
+        priority: int = 0,
+        urgent: bool = False,
+) -> Any:
+    """Declare how a telemetry dataclass field is quantized and
+    scheduled.
+
+    Fields without a declaration are sent as is, which is only possible
+    for booleans and integers, at every frame with the lowest priority.
+
+    :param format_: The ``struct`` format character.
+    :param resolution: The smallest change that is sent.
+    :param period: The shortest time between two sendings of the field
+                   in delta frames (in seconds).
+    :param priority: The precedence of the field when a frame is full.
+    :param urgent: Whether a change of the field is sent at once.
+    :return: The dataclass field.
+    """
+    return field(
+        metadata={
+            _QUANTIZATION_KEY: (format_, resolution),
+            _SCHEDULE_KEY: TelemetrySchedule(period, priority, urgent),
+        },
+    )
+
+
+@dataclass(frozen=True)
+class TelemetryLayout:
+    """The layout of the frames of a telemetry dataclass.
+
+    A frame is a header with the frame type and a sequence number, then
+    the fields, then a CRC-16/CCITT of everything before it. A keyframe
+    carries every field. A delta frame carries a bitmask of the fields
+    whose quantized value changed since the previous frame and only
+    those fields, in order.
+    """
+
+    HEADER: ClassVar[Struct] = Struct('<BB')
+    TRAILER: ClassVar[Struct] = Struct('<H')
+    data_type: type[Any]
+    names: tuple[str, ...] = field(init=False)
+    quantizations: tuple[Quantization, ...] = field(init=False)
+    schedules: tuple[TelemetrySchedule, ...] = field(init=False)
+    keyframe_struct: Struct = field(init=False)
+    mask_size: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        if not is_dataclass(self.data_type):
+            raise ValueError('data type is not a dataclass')
+
+        type_hints = get_type_hints(self.data_type)
+        names = []
+        quantizations = []
+        schedules = []
+
+        for field_ in fields(self.data_type):
+            type_ = type_hints[field_.name]
+
+            if _QUANTIZATION_KEY in field_.metadata:
+                format_, resolution = field_.metadata[_QUANTIZATION_KEY]
+                quantization = Quantization(format_, resolution, type_)
+            elif type_ is bool:
+                quantization = Quantization('?', value_type=bool)
+            elif type_ is int:
+                quantization = Quantization('i', value_type=int)
+            else:
+                raise ValueError(f'field {repr(field_.name)} is not quantized')
+
+            names.append(field_.name)
+            quantizations.append(quantization)
+            schedules.append(
+                field_.metadata.get(_SCHEDULE_KEY, TelemetrySchedule()),
+            )
+
+        object.__setattr__(self, 'names', tuple(names))
+        object.__setattr__(self, 'quantizations', tuple(quantizations))
+        object.__setattr__(self, 'schedules', tuple(schedules))
+        object.__setattr__(
+            self,
+            'keyframe_struct',
+            Struct(
+                '<' + ''.join(
+                    quantization.format for quantization in quantizations
+                ),
+            ),
+        )
+        object.__setattr__(self, 'mask_size', (len(names) + 7) // 8)
+
+    @property
+    def keyframe_size(self) -> int:
+        return self.HEADER.size + self.keyframe_struct.size + self.TRAILER.size
+
+    def quantize(self, data: Any) -> list[int]:
+        return [
+            quantization.quantize(getattr(data, name))
+            for name, quantization in zip(self.names, self.quantizations)
+        ]
+
+    def dequantize(self, values: list[int]) -> Any:
+        return self.data_type(
+            **{
+                name: quantization.dequantize(value)
+                for name, quantization, value in zip(
+                    self.names,
+                    self.quantizations,
+                    values,
+                )
+            },
+        )
+
+
+@dataclass
+class TelemetryEncoder:
+    """An encoder of telemetry frames.
+
+    A keyframe is sent every ``keyframe_interval`` frames so that a
+    receiver recovers from lost frames, and delta frames in between.
+
+    A delta frame carries the changed fields whose period elapsed, the
+    highest priorities first, up to ``maximum_frame_size`` bytes. The
+    fields left out stay pending until a later frame. The changes of
+    the urgent fields can also be sent at once with
+    :meth:`encode_urgent`.
+
+    >>> from dataclasses import dataclass
+    >>> @dataclass
+    ... class Data:
+    ...     status: bool
+    ...     voltage: float = telemetry_field('h', 0.01)
+    >>> encoder = TelemetryEncoder(TelemetryLayout(Data), 10)
+    >>> decoder = TelemetryDecoder(TelemetryLayout(Data))
+    >>> frame = encoder.encode(Data(True, 3.3))
+    >>> len(frame)
+    7
+    >>> decoder.decode(frame)
+    Data(status=True, voltage=3.3)
+    >>> frame = encoder.encode(Data(True, 3.301))
+    >>> len(frame)
+    5
+    >>> decoder.decode(frame)
+    Data(status=True, voltage=3.3)
+    >>> decoder.decode(encoder.encode(Data(False, 3.31)))
+    Data(status=False, voltage=3.31)
+    """
+
+    layout: TelemetryLayout
+    keyframe_interval: int
+    maximum_frame_size: int = 255
+    _values: list[int] | None = field(default=None, init=False)
+    _sending_times: list[float] = field(default_factory=list, init=False)
+    _sequence: int = field(default=0, init=False)
+    _frame_count: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        if self.layout.keyframe_size > self.maximum_frame_size:
+            raise ValueError(
+                (
+                    f'keyframe of {self.layout.keyframe_size} bytes exceeds'
+                    f' the maximum frame size'
+                ),
+            )
+
+    def encode(self, data: Any, timestamp: float | None = None) -> bytes:
+        """Encode the next frame.
+
+        :param timestamp: The time of the frame (in seconds), by default
+                          the current monotonic time.
+        :return: The frame.
+        """
+        if timestamp is None:
+            timestamp = monotonic()
+
+        values = self.layout.quantize(data)
+
+        if self._values is None or self._frame_count == 0:
+            self._values = values
+            self._sending_times = [timestamp] * len(values)
+            frame = self._pack(
+                FrameType.KEYFRAME,
+                self.layout.keyframe_struct.pack(*values),
+            )
+        else:
+            frame = self._encode_delta(
+                values,
+                [
+                    i
+                    for i, schedule in enumerate(self.layout.schedules)
+                    if values[i] != self._values[i] and (
+                        schedule.urgent
+                        or (
+                            timestamp - self._sending_times[i]
+                            >= schedule.period
+                        )
+                    )
+                ],
+                timestamp,
+            )
+
+        self._frame_count = (self._frame_count + 1) % self.keyframe_interval
+
+        return frame
+
+    def encode_urgent(
+            self,
+            data: Any,
+            timestamp: float | None = None,
+    ) -> bytes | None:
+        """Encode a frame with the changed urgent fields, out of band.
+
+        The frame does not count toward the keyframe interval. Before
+        the first keyframe, the next frame is encoded instead.
+
+        :param timestamp: The time of the frame (in seconds), by default
+                          the current monotonic time.
+        :return: The frame, or ``None`` if no urgent field changed.
+        """
+        if self._values is None:
+            return self.encode(data, timestamp)
+
+        if timestamp is None:
+            timestamp = monotonic()
+
+        values = self.layout.quantize(data)
+        indices = [
+            i
+            for i, schedule in enumerate(self.layout.schedules)
+            if schedule.urgent and values[i] != self._values[i]
+        ]
+
+        if not indices:
+            return None
+
+        return self._encode_delta(values, indices, timestamp)
+
+    def reset(self) -> None:
+        """Make the next frame a keyframe.
+
+        :return: ``None``.
+        """
+        self._values = None
+        self._frame_count = 0
+
+    def _encode_delta(
+            self,
+            values: list[int],
+            indices: list[int],
+            timestamp: float,
+    ) -> bytes:
+        assert self._values is not None
+
+        size = (
+            self.layout.HEADER.size
+            + self.layout.mask_size
+            + self.layout.TRAILER.size
+        )
+        selected_indices = []
+
+        for i in sorted(
+                indices,
+                key=lambda i: -self.layout.schedules[i].priority,
+        ):
+            field_size = self.layout.quantizations[i].size
+
+            if size + field_size <= self.maximum_frame_size:
+                size += field_size
+
+                selected_indices.append(i)
+
+        selected_indices.sort()
+
+        mask = 0
+        format_ = '<'
+
+        for i in selected_indices:
+            mask |= 1 << i
+            format_ += self.layout.quantizations[i].format
+            self._values[i] = values[i]
+            self._sending_times[i] = timestamp
+
+        return self._pack(
+            FrameType.DELTA,
+            mask.to_bytes(self.layout.mask_size, 'little') + pack(
+                format_,
+                *(values[i] for i in selected_indices),
+            ),
+        )
+
+    def _pack(self, frame_type: FrameType, body: bytes) -> bytes:
+        frame = self.layout.HEADER.pack(frame_type, self._sequence) + body
+        frame += self.layout.TRAILER.pack(crc_hqx(frame, 0xFFFF))
+        self._sequence = (self._sequence + 1) & 0xFF
+
+        return frame
+
+
+@dataclass
+class TelemetryDecoder:
+    """A decoder of telemetry frames.
+
+    After a frame is lost, the delta frames are rejected until the next
+    keyframe, since the changes in the lost frame are unknown.
+    """
+
+    layout: TelemetryLayout
+    _values: list[int] | None = field(default=None, init=False)
+    _sequence: int = field(default=0, init=False)
+
+    def decode(self, frame: bytes) -> Any:
+        """Decode the next frame.
+
+        :return: The data.
+        :raise ValueError: If the frame is corrupted, or is a delta frame
+                           that does not follow the previous frame.
+        """
+        header_size = self.layout.HEADER.size
+        trailer_size = self.layout.TRAILER.size
+
+        if len(frame) < header_size + trailer_size:
+            raise ValueError('frame too short')
+
+        checksum, = self.layout.TRAILER.unpack_from(frame, -trailer_size)
+
+        if crc_hqx(frame[:-trailer_size], 0xFFFF) != checksum:
+            raise ValueError('checksum mismatch')
+
+        frame_type, sequence = self.layout.HEADER.unpack_from(frame)
+        body = frame[header_size:-trailer_size]
+
+        try:
+            if frame_type == FrameType.KEYFRAME:
+                values = list(self.layout.keyframe_struct.unpack(body))
+            elif frame_type == FrameType.DELTA:
+                values = self._apply(sequence, body)
+            else:
+                raise ValueError(f'unknown frame type {frame_type}')
+        except StructError as error:
+            self._values = None
+
+            raise ValueError('malformed frame') from error
+        except ValueError:
+            self._values = None
+
+            raise
+
+        self._values = values
+        self._sequence = sequence
+
+        return self.layout.dequantize(values)
+
+    def _apply(self, sequence: int, body: bytes) -> list[int]:
+        if self._values is None:
+            raise ValueError('delta frame without a keyframe')
+
+        if sequence != (self._sequence + 1) & 0xFF:
+            raise ValueError('frame lost since the keyframe')
+
+        mask_size = self.layout.mask_size
+        mask = int.from_bytes(body[:mask_size], 'little')
+        indices = [
+            i for i in range(len(self.layout.names)) if mask >> i & 1
+        ]
+        format_ = '<' + ''.join(
+            self.layout.quantizations[i].format for i in indices
+        )
+        values = self._values.copy()
+
+        for i, value in zip(indices, Struct(format_).unpack(body[mask_size:])):
+            values[i] = value
+
+        return values
@@ -18,18 +18,23 @@ from periphery import GPIO, PWM
 from serial import Serial
 
 from revolution import (
+    AggregateArray,
     Application,
     BATTERY_CELL_COUNT,
     BatteryFlag,
     BatteryManagementSystem,
     BATTERY_THERMISTOR_COUNT,
+    CANReader,
     Contexts,
     Debugger,
     Direction,
     Display,
     Driver,
+    Endpoint,
+    FlagArray,
     Miscellaneous,
     Motor,
+    OverflowPolicy,
     Peripheries,
     Power,
     PRBS,
@@ -39,6 +44,7 @@ from revolution import (
 )
 
 APPLICATION_TYPES: tuple[type[Application], ...] = (
+    CANReader,
     Debugger,
     Display,
     Driver,
@@ -53,6 +59,14 @@ CONTEXTS: Contexts = Contexts(
 
     general_unused_status_input=False,
 
+    # CAN Reader
+
+    can_reader_frame_count=0,
+    can_reader_frame_rate=0,
+    can_reader_frame_rates={},
+    can_reader_drop_count=0,
+    can_reader_drop_counts={},
+
     # Debugger
 
     # Display
@@ -137,10 +151,20 @@ CONTEXTS: Contexts = Contexts(
     power_array_relay_status_input=False,
     power_array_relay_status=False,
     power_battery_relay_status_input=False,
-    power_battery_cell_voltages=[0 for _ in range(BATTERY_CELL_COUNT)],
-    power_battery_thermistor_temperatures=[
-        0 for _ in range(BATTERY_THERMISTOR_COUNT)
-    ],
+    power_battery_cell_voltages=AggregateArray(
+        'd',
+        [0 for _ in range(BATTERY_CELL_COUNT)],
+    ),
+    power_battery_min_cell_voltage=0,
+    power_battery_max_cell_voltage=0,
+    power_battery_mean_cell_voltage=0,
+    power_battery_thermistor_temperatures=AggregateArray(
+        'd',
+        [0 for _ in range(BATTERY_THERMISTOR_COUNT)],
+    ),
+    power_battery_min_thermistor_temperature=0,
+    power_battery_max_thermistor_temperature=0,
+    power_battery_mean_thermistor_temperature=0,
 
     power_battery_HV_voltage=0,
     power_battery_HV_current=0,
@@ -152,17 +176,14 @@ CONTEXTS: Contexts = Contexts(
     power_battery_relay_status=False,
     power_battery_electric_safe_discharge_status=False,
     power_battery_discharge_status=False,
-    power_battery_cell_flags=[0 for _ in range(BATTERY_CELL_COUNT)],
-    power_battery_thermistor_flags=[
-        0 for _ in range(BATTERY_THERMISTOR_COUNT)
-    ],
+    power_battery_cell_flags=FlagArray(BATTERY_CELL_COUNT),
+    power_battery_thermistor_flags=FlagArray(BATTERY_THERMISTOR_COUNT),
     power_battery_current_flag=0,
+    power_battery_flags=BatteryFlag.CLEAR,
     power_battery_flags_hold=BatteryFlag.CLEAR,
 
-    power_battery_hold_cell_flags=[0 for _ in range(BATTERY_CELL_COUNT)],
-    power_battery_hold_thermistor_flags=[
-        0 for _ in range(BATTERY_THERMISTOR_COUNT)
-    ],
+    power_battery_hold_cell_flags=FlagArray(BATTERY_CELL_COUNT),
+    power_battery_hold_thermistor_flags=FlagArray(BATTERY_THERMISTOR_COUNT),
     power_battery_hold_current_flag=0,
     power_battery_hold_elapsed_count=0,
     power_battery_hold_OV_count=0,
@@ -181,7 +202,13 @@ CONTEXTS: Contexts = Contexts(
     power_battery_heartbeat_timestamp=inf,
     power_battery_heartbeat_working=False,
 
-    power_battery_state_of_charges=[0 for _ in range(BATTERY_CELL_COUNT)],
+    power_battery_state_of_charges=AggregateArray(
+        'd',
+        [0 for _ in range(BATTERY_CELL_COUNT)],
+    ),
+    power_battery_min_state_of_charge=0,
+    power_battery_max_state_of_charge=0,
+    power_battery_mean_state_of_charge=0,
 
     power_psm_motor_current=0,
     power_psm_motor_voltage=0,
@@ -191,6 +218,12 @@ CONTEXTS: Contexts = Contexts(
     power_psm_array_voltage=0,
 
     # Telemetry
+
+    telemetry_radio_submitted_count=0,
+    telemetry_radio_sent_count=0,
+    telemetry_radio_coalesced_count=0,
+    telemetry_radio_retry_count=0,
+    telemetry_radio_drop_count=0,
 )
 
 CAN_BUS: BusABC = MagicMock()
@@ -268,6 +301,8 @@ PERIPHERIES: Peripheries = Peripheries(
 
     general_can_bus=CAN_BUS,
 
+    # CAN Reader
+
     # Debugger
 
     # Display
@@ -373,6 +408,34 @@ SETTINGS: Settings = Settings(
 
     general_wheel_diameter=0.557,
     general_log_filepath='./temp_logs/',
+    general_queue_capacities={endpoint: 1000 for endpoint in Endpoint},
+    general_queue_overflow_policies={
+        Endpoint.CAN_READER: OverflowPolicy.DROP_OLDEST,
+        Endpoint.DEBUGGER: OverflowPolicy.DROP_OLDEST,
+        Endpoint.DISPLAY: OverflowPolicy.DROP_OLDEST,
+        Endpoint.DRIVER: OverflowPolicy.DROP_OLDEST,
+        Endpoint.MISCELLANEOUS: OverflowPolicy.DROP_OLDEST,
+        Endpoint.MOTOR: OverflowPolicy.COALESCE,
+        Endpoint.POWER: OverflowPolicy.COALESCE,
+        Endpoint.TELEMETRY: OverflowPolicy.DROP_OLDEST,
+    },
+    general_process_queue_capacity=1000,
+    general_process_queue_overflow_policy=OverflowPolicy.COALESCE,
+    general_batch_size=64,
+    general_batch_timeout=0,
+    general_subscription_timeout=1,
+    general_scheduler_thread_count=2,
+    general_scheduler_sample_count=1000,
+    general_worker_restart_initial_delay=0.1,
+    general_worker_restart_maximum_delay=10,
+    general_worker_restart_jitter=0.5,
+    general_worker_restart_maximum_count=10,
+    general_worker_restart_window=60,
+
+    # CAN Reader
+
+    can_reader_timeout=0.1,
+    can_reader_statistics_timeout=1,
 
     # Debugger
 
@@ -392,12 +455,12 @@ SETTINGS: Settings = Settings(
 
     # Miscellaneous
 
-    miscellaneous_light_timeout=0.05,
     miscellaneous_light_flash_timeout=0.5,
     miscellaneous_imu_timeout=0.1,
     miscellaneous_imu_mode_timeout=0.05,
     miscellaneous_gps_timeout=1,
     miscellaneous_front_wheels_timeout=0.02,
+    miscellaneous_timing_log_timeout=1,
 
     # Motor
 
@@ -421,12 +484,15 @@ SETTINGS: Settings = Settings(
     power_array_relay_timeout=2.5,
     power_point_tracking_timeout=1.0,
     power_soc_timeout=0.05,
+    power_soc_checkpoint_timeout=10,
     power_psm_timeout=0.1,
     power_steering_wheel_led_timeout=0.5,
     power_log_timeout=0.1,
 
     power_battery=BATTERY,
     power_battery_can_timeout=5.0,
+    power_soc_checkpoint_filepath='',
+    power_soc_checkpoint_maximum_age=600,
     power_disable_charging_battery_soc_threshold=0.98,
     power_psm_motor_ina229_voltage_correction_factor=12.9,
     power_psm_battery_ina229_voltage_correction_factor=12.9,
@@ -436,12 +502,17 @@ SETTINGS: Settings = Settings(
 
     telemetry_timeout=1,
     telemetry_begin_token=b'',
-    telemetry_separator_token=b'_',
     telemetry_end_token=b'',
+    telemetry_keyframe_interval=10,
     telemetry_radio_frequency=915000000,
     telemetry_radio_spreading_factor=7,
     telemetry_radio_bandwidth=0,
     telemetry_radio_code_rate=0,
     telemetry_radio_preamble_length=200,
     telemetry_radio_tx_power=14,
+    telemetry_radio_maximum_payload_size=255,
+    telemetry_radio_response_timeout=1,
+    telemetry_radio_transmission_timeout=2,
+    telemetry_radio_maximum_retry_count=3,
+    telemetry_radio_retry_delay=0.1,
 )
@@ -0,0 +1,69 @@
+from struct import pack
+from unittest import TestCase, main
+from unittest.mock import MagicMock
+
+from can import Message
+
+from revolution.battery_management_system import (
+    BatteryManagementSystem,
+    CellVoltagesInformation,
+    OverBatteryFlagsInformation,
+    StatusesAndHVInformation,
+    ThermistorTemperaturesInformation,
+)
+
+
+class BatteryManagementSystemTestCase(TestCase):
+    def setUp(self) -> None:
+        self.battery_management_system = BatteryManagementSystem(
+            MagicMock(),
+            0x500,
+        )
+
+    def parse(self, arbitration_id: int, data: bytes) -> object:
+        return self.battery_management_system.parse(
+            Message(arbitration_id=arbitration_id, data=data),
+        )
+
+    def test_information_table(self) -> None:
+        table = BatteryManagementSystem.INFORMATION_TABLE
+
+        self.assertEqual(len(table), 32)
+
+        for message_identifier, entry in enumerate(table):
+            types = [
+                type_
+                for type_ in BatteryManagementSystem.INFORMATION_TYPES
+                if message_identifier in type_.MESSAGE_IDENTIFIERS
+            ]
+
+            if entry is None:
+                self.assertEqual(types, [])
+            else:
+                self.assertEqual([entry[0]], types)
+                self.assertEqual(entry[1].format, entry[0].FORMAT)
+
+    def test_parse(self) -> None:
+        self.assertEqual(
+            self.parse(0x400, pack('<BBeee', 1, 2, 0, 120, 1.5)),
+            StatusesAndHVInformation(0, 1, 2, 0, 120, 1.5),
+        )
+        self.assertEqual(
+            self.parse(0x401, pack('<Q', 0b101)),
+            OverBatteryFlagsInformation(1, 0b101),
+        )
+        self.assertEqual(
+            self.parse(0x414, pack('<eeee', 3, 3.5, 4, 4.5)),
+            CellVoltagesInformation(20, 3, 3.5, 4, 4.5),
+        )
+        self.assertEqual(
+            self.parse(0x41F, pack('<eeee', 20, 25, 30, 35)),
+            ThermistorTemperaturesInformation(31, 20, 25, 30, 35),
+        )
+        self.assertIsNone(self.parse(0x40C, bytes(8)))
+        self.assertIsNone(self.parse(0x420, bytes(8)))
+        self.assertIsNone(self.parse(0x3E0, bytes(8)))
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
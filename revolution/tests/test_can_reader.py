@@ -0,0 +1,108 @@
+from dataclasses import replace
+from logging import CRITICAL, disable, NOTSET
+from time import sleep
+from unittest import TestCase, main
+from unittest.mock import MagicMock
+
+from can import Message as CANMessage
+
+from revolution.can_reader import CANReader
+from revolution.environment import (
+    ContextsDoor,
+    Endpoint,
+    Environment,
+    OverflowPolicy,
+)
+from revolution.tests import configurations
+
+
+class CANReaderTestCase(TestCase):
+    def setUp(self) -> None:
+        disable(CRITICAL)
+
+    def tearDown(self) -> None:
+        disable(NOTSET)
+
+    def test_can(self) -> None:
+        can_messages = [
+            CANMessage(arbitration_id=0x400, data=[0]),
+            CANMessage(arbitration_id=0x401, data=[1]),
+            CANMessage(arbitration_id=0x400, data=[2]),
+            CANMessage(arbitration_id=0x400, data=[3]),
+            CANMessage(arbitration_id=0x700, data=[4]),
+        ]
+
+        def recv(timeout: float) -> CANMessage | None:
+            if can_messages:
+                return can_messages.pop(0)
+
+            sleep(timeout)
+
+            return None
+
+        can_bus = MagicMock()
+        can_bus.recv.side_effect = recv
+        environment = Environment(
+            ContextsDoor(replace(configurations.CONTEXTS)),
+            replace(configurations.PERIPHERIES, general_can_bus=can_bus),
+            replace(
+                configurations.SETTINGS,
+                general_queue_capacities={Endpoint.MOTOR: 2},
+                general_queue_overflow_policies={
+                    Endpoint.MOTOR: OverflowPolicy.DROP_NEWEST,
+                },
+                can_reader_timeout=0.01,
+                can_reader_statistics_timeout=0.05,
+            ),
+        )
+        subscription = environment.contexts.subscribe(
+            'can_reader_frame_count',
+        )
+        can_reader = CANReader(environment)
+
+        environment.subscribe_can(Endpoint.MOTOR, (0x400,))
+        environment.subscribe_can(Endpoint.POWER, (0x400, 0x401))
+        can_reader._setup()
+
+        try:
+            for _ in range(100):
+                subscription.wait(0.1)
+
+                if (
+                        environment.contexts.snapshot().can_reader_frame_count
+                        == 5
+                ):
+                    break
+        finally:
+            subscription.close()
+            can_reader._handle_stop()
+            can_reader._teardown()
+
+        contexts = environment.contexts.snapshot()
+
+        self.assertEqual(contexts.can_reader_frame_count, 5)
+        self.assertEqual(
+            set(contexts.can_reader_frame_rates),
+            {0x400, 0x401, 0x700},
+        )
+        self.assertGreater(contexts.can_reader_frame_rates[0x400], 0)
+        self.assertEqual(contexts.can_reader_drop_count, 1)
+        self.assertEqual(contexts.can_reader_drop_counts, {'MOTOR': 1})
+        self.assertEqual(
+            [
+                message.args[0].data[0]
+                for message in environment.receive_batch(Endpoint.MOTOR, 5)
+            ],
+            [0, 2],
+        )
+        self.assertEqual(
+            [
+                message.args[0].data[0]
+                for message in environment.receive_batch(Endpoint.POWER, 5)
+            ],
+            [0, 1, 2, 3],
+        )
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
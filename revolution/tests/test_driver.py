@@ -4,10 +4,13 @@ from time import sleep
 from typing import ClassVar
 from unittest import TestCase, main
 
-from door.threading2 import AcquirableDoor
-
 from revolution.driver import Driver
-from revolution.environment import Environment, Header, Message
+from revolution.environment import (
+    ContextsDoor,
+    Environment,
+    Header,
+    Message,
+)
 from revolution.tests import configurations
 
 
@@ -16,7 +19,7 @@ class DriverTestCase(TestCase):
 
     def setUp(self) -> None:
         self.environment: Environment = Environment(
-            AcquirableDoor(replace(configurations.CONTEXTS)),
+            ContextsDoor(replace(configurations.CONTEXTS)),
             replace(configurations.PERIPHERIES),
             replace(configurations.SETTINGS),
         )
@@ -0,0 +1,651 @@
+from dataclasses import replace
+from json import load
+from logging import CRITICAL, disable, ERROR, NOTSET
+from multiprocessing import get_context
+from queue import Empty, Full
+from tempfile import NamedTemporaryFile
+from threading import current_thread, Event, Thread
+from time import perf_counter, sleep
+from unittest import TestCase, main
+from unittest.mock import MagicMock
+
+from can import Message as CANMessage
+from iclib.wavesculptor22 import WaveSculptor22
+
+from revolution.battery_management_system import BatteryFlag
+from revolution.environment import (
+    ContextsDoor,
+    Endpoint,
+    Environment,
+    Header,
+    Message,
+    MessageQueue,
+    OverflowPolicy,
+    Partition,
+)
+from revolution.initializer import Initializer
+from revolution.motor import Motor
+from revolution.power import Power
+from revolution.tests import configurations
+from revolution.utilities import Direction
+
+
+class EnvironmentTestCase(TestCase):
+    def setUp(self) -> None:
+        self.environment: Environment = Environment(
+            ContextsDoor(replace(configurations.CONTEXTS)),
+            replace(configurations.PERIPHERIES),
+            replace(configurations.SETTINGS),
+        )
+
+    def test_send_can(self) -> None:
+        self.environment.subscribe_can(Endpoint.MOTOR, range(0x400, 0x420))
+        self.environment.subscribe_can(Endpoint.POWER, range(0x600, 0x620))
+        self.environment.subscribe_can(Endpoint.DEBUGGER, range(0x41F, 0x421))
+
+        self.environment.send_can(CANMessage(arbitration_id=0x401))
+        self.environment.send_can(CANMessage(arbitration_id=0x41F))
+        self.environment.send_can(CANMessage(arbitration_id=0x700))
+
+        message = self.environment.receive(Endpoint.MOTOR, timeout=0)
+
+        self.assertEqual(message.header, Header.CAN)
+        self.assertEqual(message.args[0].arbitration_id, 0x401)
+        self.assertEqual(
+            self.environment.receive(Endpoint.MOTOR, timeout=0).args[0]
+            .arbitration_id,
+            0x41F,
+        )
+        self.assertEqual(
+            self.environment.receive(Endpoint.DEBUGGER, timeout=0).args[0]
+            .arbitration_id,
+            0x41F,
+        )
+
+        for endpoint in Endpoint:
+            self.assertRaises(
+                Empty,
+                self.environment.receive,
+                endpoint,
+                timeout=0,
+            )
+
+    def test_send_can_overflow(self) -> None:
+        environment = Environment(
+            ContextsDoor(replace(configurations.CONTEXTS)),
+            replace(configurations.PERIPHERIES),
+            replace(
+                configurations.SETTINGS,
+                general_queue_capacities={
+                    Endpoint.MOTOR: 3,
+                    Endpoint.POWER: 3,
+                },
+                general_queue_overflow_policies={
+                    Endpoint.MOTOR: OverflowPolicy.DROP_NEWEST,
+                },
+            ),
+        )
+
+        environment.subscribe_can(Endpoint.MOTOR, range(0x400, 0x410))
+        environment.subscribe_can(Endpoint.POWER, range(0x400, 0x410))
+
+        for arbitration_id in range(0x400, 0x403):
+            self.assertEqual(
+                environment.send_can(
+                    CANMessage(arbitration_id=arbitration_id),
+                    block=False,
+                ),
+                [],
+            )
+
+        environment.receive(Endpoint.POWER, timeout=0)
+
+        self.assertEqual(
+            environment.send_can(
+                CANMessage(arbitration_id=0x403),
+                block=False,
+            ),
+            [Endpoint.MOTOR],
+        )
+        self.assertEqual(
+            environment.send_can(
+                CANMessage(arbitration_id=0x404),
+                block=False,
+            ),
+            [Endpoint.MOTOR, Endpoint.POWER],
+        )
+
+        statistics = environment.get_queue_statistics(Endpoint.MOTOR)
+
+        self.assertEqual(statistics.size, 3)
+        self.assertEqual(statistics.high_water_mark, 3)
+        self.assertEqual(statistics.drop_count, 2)
+
+    def test_message_queue_drop_oldest(self) -> None:
+        queue = MessageQueue(2, OverflowPolicy.DROP_OLDEST)
+
+        self.assertFalse(queue.put(Message(Header.CAN, (1,))))
+        self.assertFalse(queue.put(Message(Header.CAN, (2,))))
+        self.assertTrue(queue.put(Message(Header.CAN, (3,))))
+        self.assertFalse(queue.put(Message(Header.STOP)))
+        self.assertEqual(queue.get().args, (2,))
+        self.assertEqual(queue.get().args, (3,))
+        self.assertEqual(queue.get().header, Header.STOP)
+        self.assertRaises(Empty, queue.get, timeout=0)
+        self.assertEqual(queue.statistics.high_water_mark, 3)
+
+    def test_message_queue_coalesce(self) -> None:
+        queue = MessageQueue(0, OverflowPolicy.COALESCE)
+
+        for key, value in ((1, 'a'), (2, 'b'), (1, 'c'), (2, 'd')):
+            queue.put(Message(Header.CAN, (value,), key=key))
+
+        self.assertEqual(queue.get().args, ('c',))
+
+        queue.put(Message(Header.CAN, ('e',), key=1))
+
+        self.assertEqual(queue.get().args, ('d',))
+        self.assertEqual(queue.get().args, ('e',))
+        self.assertEqual(queue.statistics.coalesce_count, 2)
+
+    def test_message_queue_stop(self) -> None:
+        for overflow_policy in (
+                OverflowPolicy.DROP_OLDEST,
+                OverflowPolicy.COALESCE,
+        ):
+            queue = MessageQueue(2, overflow_policy)
+
+            queue.put(Message(Header.STOP))
+
+            for i in range(4):
+                queue.put(Message(Header.CAN, (i,), key=i))
+
+            self.assertEqual(queue.get().header, Header.STOP)
+            self.assertEqual(queue.get().args, (3,))
+            self.assertRaises(Empty, queue.get, timeout=0)
+            self.assertEqual(queue.statistics.drop_count, 3)
+
+            queue = MessageQueue(1, overflow_policy)
+
+            queue.put(Message(Header.STOP))
+            queue.put(Message(Header.STOP))
+            queue.put(Message(Header.CAN, (0,), key=0))
+
+            self.assertEqual(queue.get().header, Header.STOP)
+            self.assertEqual(queue.get().header, Header.STOP)
+            self.assertEqual(queue.get().args, (0,))
+
+    def test_message_queue_block(self) -> None:
+        queue = MessageQueue(1, OverflowPolicy.BLOCK)
+
+        queue.put(Message(Header.CAN))
+
+        self.assertRaises(Full, queue.put, Message(Header.CAN), False)
+        self.assertRaises(Full, queue.put, Message(Header.CAN), True, 0)
+
+    def test_receive_batch(self) -> None:
+        for i in range(5):
+            self.environment.send(Endpoint.MOTOR, Message(Header.CAN, (i,)))
+
+        messages = self.environment.receive_batch(Endpoint.MOTOR, 3)
+
+        self.assertEqual(
+            [message.args for message in messages],
+            [(0,), (1,), (2,)],
+        )
+
+        messages = self.environment.receive_batch(
+            Endpoint.MOTOR,
+            3,
+            batch_timeout=0.01,
+        )
+
+        self.assertEqual(
+            [message.args for message in messages],
+            [(3,), (4,)],
+        )
+        self.assertRaises(
+            Empty,
+            self.environment.receive_batch,
+            Endpoint.MOTOR,
+            3,
+            timeout=0,
+        )
+
+    def test_unsubscribe_can(self) -> None:
+        self.environment.subscribe_can(Endpoint.MOTOR, range(0x400, 0x420))
+        self.environment.subscribe_can(Endpoint.POWER, range(0x400, 0x401))
+        self.environment.unsubscribe_can(Endpoint.MOTOR)
+
+        self.assertEqual(
+            self.environment.get_can_subscribers(0x400),
+            (Endpoint.POWER,),
+        )
+        self.assertEqual(self.environment.get_can_subscribers(0x401), ())
+
+    def test_contexts_partitions(self) -> None:
+        acquisition = Event()
+        release = Event()
+
+        def hold_power() -> None:
+            with self.environment.contexts(Partition.POWER) as contexts:
+                contexts.power_battery_relay_status = True
+
+                acquisition.set()
+                release.wait()
+
+        thread = Thread(target=hold_power)
+
+        thread.start()
+        acquisition.wait()
+
+        with self.environment.contexts(Partition.MOTOR) as contexts:
+            contexts.motor_velocity = 1
+
+            self.assertRaises(
+                ValueError,
+                getattr,
+                contexts,
+                'power_battery_relay_status',
+            )
+            self.assertRaises(
+                ValueError,
+                setattr,
+                contexts,
+                'power_battery_relay_status',
+                True,
+            )
+
+        snapshot = self.environment.contexts.snapshot()
+
+        self.assertEqual(snapshot.motor_velocity, 1)
+        self.assertFalse(snapshot.power_battery_relay_status)
+
+        release.set()
+        thread.join()
+
+        snapshot = self.environment.contexts.snapshot()
+
+        self.assertTrue(snapshot.power_battery_relay_status)
+
+        with self.environment.contexts(
+                Partition.POWER,
+                Partition.MOTOR,
+        ) as contexts:
+            contexts.motor_status_input = contexts.power_battery_relay_status
+
+            with self.environment.contexts(Partition.MOTOR) as contexts:
+                contexts.motor_velocity = 2
+
+            self.assertRaises(
+                ValueError,
+                self.environment.contexts(Partition.DRIVER).__enter__,
+            )
+
+        self.assertRaises(ValueError, getattr, contexts, 'motor_velocity')
+
+        with self.environment.contexts() as contexts:
+            self.assertEqual(contexts.motor_velocity, 2)
+            self.assertEqual(contexts.general_unused_status_input, False)
+
+    def test_contexts_instrumentation(self) -> None:
+        door = ContextsDoor(replace(configurations.CONTEXTS), True)
+        acquisition = Event()
+
+        def hold_power() -> None:
+            with door(Partition.POWER):
+                acquisition.set()
+                sleep(0.01)
+
+        thread = Thread(target=hold_power, name='holder')
+
+        thread.start()
+        acquisition.wait()
+
+        for _ in range(3):
+            with door(Partition.POWER) as contexts:
+                contexts.power_battery_relay_status = True
+
+        thread.join()
+
+        holder_statistics, statistics = door.get_acquisition_statistics()
+
+        self.assertEqual(holder_statistics.thread_name, 'holder')
+        self.assertIn('hold_power', holder_statistics.call_site)
+        self.assertGreaterEqual(holder_statistics.hold_times.maximum, 0.01)
+        self.assertIn('test_contexts_instrumentation', statistics.call_site)
+        self.assertEqual(statistics.partitions, (Partition.POWER,))
+        self.assertEqual(statistics.count, 3)
+        self.assertEqual(statistics.interval_times.count, 2)
+        self.assertGreater(statistics.wait_times.maximum, 0.005)
+
+        with NamedTemporaryFile('w+') as file:
+            door.dump_acquisition_statistics(file.name)
+
+            summaries = load(file)
+
+        self.assertEqual(summaries[1]['count'], 3)
+        self.assertEqual(summaries[1]['partitions'], ['POWER'])
+
+        door.reset_acquisition_statistics()
+
+        self.assertEqual(door.get_acquisition_statistics(), [])
+
+    def test_contexts_subscription(self) -> None:
+        self.assertRaises(
+            ValueError,
+            self.environment.contexts.subscribe,
+            'power_battery_unknown_voltage',
+        )
+
+        subscription = self.environment.contexts.subscribe(
+            'miscellaneous_brake_status_input',
+            'power_battery_cell_voltages',
+        )
+
+        def brake() -> None:
+            sleep(0.01)
+
+            with self.environment.contexts(
+                    Partition.MISCELLANEOUS,
+            ) as contexts:
+                contexts.miscellaneous_brake_status_input = True
+
+        thread = Thread(target=brake)
+        time_0 = perf_counter()
+
+        thread.start()
+
+        self.assertEqual(
+            subscription.wait(1),
+            {'miscellaneous_brake_status_input'},
+        )
+        self.assertLess(perf_counter() - time_0, 0.5)
+        self.assertTrue(
+            self.environment.contexts.snapshot()
+            .miscellaneous_brake_status_input,
+        )
+
+        thread.join()
+
+        with self.environment.contexts() as contexts:
+            contexts.miscellaneous_brake_status_input = True
+            contexts.miscellaneous_horn_status_input = True
+
+        self.assertEqual(subscription.wait(0), set())
+
+        with self.environment.contexts(Partition.POWER) as contexts:
+            contexts.power_battery_cell_voltages[0] = 3
+
+        self.assertEqual(subscription.wait(0), {'power_battery_cell_voltages'})
+
+        subscription.close()
+
+    def test_share(self) -> None:
+        self.environment.share((Endpoint.MOTOR,))
+
+        self.assertNotIn(
+            'power_battery_cell_flags',
+            (
+                self
+                .environment
+                .contexts
+                ._shared_partitions[Partition.POWER]
+                .variable_names
+            ),
+        )
+
+        def target() -> None:
+            self.environment.subscribe_can(Endpoint.MOTOR, (0x400,))
+            self.environment.attach(1)
+
+            message = self.environment.receive(Endpoint.MOTOR, timeout=5)
+
+            with self.environment.contexts(
+                    Partition.CAN_READER,
+                    Partition.MOTOR,
+                    Partition.POWER,
+            ) as contexts:
+                contexts.can_reader_frame_rates = {0x400: 1}
+                contexts.power_battery_cell_flags.assign(
+                    BatteryFlag.OVERVOLTAGE | BatteryFlag.UNDERCURRENT,
+                    0b1010,
+                )
+                contexts.motor_velocity += message.args[0].data[0]
+                contexts.motor_direction_input = Direction.BACKWARD
+
+            self.environment.send(Endpoint.POWER, Message(Header.STOP))
+            self.environment.detach(5)
+
+        process = get_context('fork').Process(target=target)
+
+        with self.environment.contexts(Partition.MOTOR) as contexts:
+            contexts.motor_velocity = 1
+
+        process.start()
+        self.environment.attach(0)
+
+        try:
+            subscription = self.environment.contexts.subscribe(
+                'motor_velocity',
+            )
+
+            for _ in range(500):
+                if self.environment.get_can_subscribers(0x400):
+                    break
+
+                sleep(0.01)
+
+            self.assertEqual(
+                self.environment.get_can_subscribers(0x400),
+                (Endpoint.MOTOR,),
+            )
+            self.environment.send_can(
+                CANMessage(arbitration_id=0x400, data=[2]),
+            )
+
+            self.assertEqual(subscription.wait(5), {'motor_velocity'})
+            self.assertEqual(
+                self.environment.receive(Endpoint.POWER, timeout=5).header,
+                Header.STOP,
+            )
+
+            snapshot = self.environment.contexts.snapshot()
+
+            self.assertEqual(snapshot.can_reader_frame_rates, {0x400: 1})
+            self.assertEqual(
+                snapshot.power_battery_cell_flags[:4],
+                [0, 0b100001, 0, 0b100001],
+            )
+            self.assertEqual(snapshot.motor_velocity, 3)
+            self.assertIs(snapshot.motor_direction_input, Direction.BACKWARD)
+
+            with self.environment.contexts(Partition.MOTOR) as contexts:
+                self.assertEqual(contexts.motor_velocity, 3)
+
+            subscription.close()
+        finally:
+            process.join(5)
+            self.environment.contexts.unshare()
+
+        self.assertEqual(process.exitcode, 0)
+        self.assertEqual(
+            self.environment.contexts.snapshot().motor_velocity,
+            3,
+        )
+
+    def test_share_routing(self) -> None:
+        environment = Environment(
+            ContextsDoor(replace(configurations.CONTEXTS)),
+            replace(configurations.PERIPHERIES),
+            replace(
+                configurations.SETTINGS,
+                general_process_queue_capacity=2,
+                general_process_queue_overflow_policy=OverflowPolicy.COALESCE,
+            ),
+        )
+
+        environment.share((Endpoint.MOTOR,), (Endpoint.POWER,))
+
+        try:
+            environment.subscribe_can(Endpoint.MOTOR, (0x400, 0x401, 0x402))
+
+            for _ in range(2):
+                for arbitration_id in (0x400, 0x401, 0x402, 0x700):
+                    environment.send_can(
+                        CANMessage(arbitration_id=arbitration_id),
+                    )
+
+            environment.send(Endpoint.MOTOR, Message(Header.STOP))
+
+            statistics = environment.get_process_queue_statistics(1)
+
+            self.assertEqual(statistics.size, 3)
+            self.assertEqual(statistics.high_water_mark, 3)
+            self.assertEqual(statistics.drop_count, 4)
+            self.assertEqual(statistics.coalesce_count, 0)
+            self.assertEqual(
+                environment.get_process_queue_statistics(2).size,
+                0,
+            )
+        finally:
+            environment.contexts.unshare()
+
+    def test_create_worker(self) -> None:
+        stoppage = Event()
+
+        def target() -> None:
+            raise ValueError
+
+        disable(CRITICAL)
+
+        try:
+            worker = self.environment.create_worker(target, stoppage, 'target')
+
+            worker.start()
+            sleep(0.01)
+            stoppage.set()
+            worker.join()
+        finally:
+            disable(NOTSET)
+
+        statistics = self.environment.get_worker_statistics()['target']
+
+        self.assertFalse(statistics.alive)
+        self.assertEqual(statistics.restart_count, 0)
+        self.assertEqual(statistics.last_exception, 'ValueError()')
+        self.assertIsNotNone(statistics.last_exception_time)
+
+    def test_peripheries_initialization(self) -> None:
+        initializer = Initializer()
+        wavesculptor22 = configurations.PERIPHERIES.motor_wavesculptor22
+
+        def create() -> WaveSculptor22:
+            sleep(0.05)
+
+            return wavesculptor22
+
+        peripheries = replace(
+            configurations.PERIPHERIES,
+            motor_wavesculptor22=initializer.initialize(
+                'WAVESCULPTOR22',
+                create,
+            ),
+        )
+
+        self.assertFalse(peripheries.wait_initializations(0))
+        self.assertIs(
+            peripheries.driver_steering_wheel,
+            configurations.PERIPHERIES.driver_steering_wheel,
+        )
+        self.assertIs(peripheries.motor_wavesculptor22, wavesculptor22)
+        self.assertTrue(peripheries.wait_initializations(0))
+        self.assertRaises(AttributeError, getattr, peripheries, 'unknown')
+
+        statistics = peripheries.get_initialization_statistics()
+        initialization_time = statistics['WAVESCULPTOR22'].initialization_time
+
+        assert initialization_time is not None
+
+        self.assertGreaterEqual(initialization_time, 0.05)
+
+    def test_peripheries_initialization_failure(self) -> None:
+        initializer = Initializer()
+
+        def create() -> WaveSculptor22:
+            raise OSError
+
+        peripheries = replace(
+            configurations.PERIPHERIES,
+            motor_wavesculptor22=initializer.initialize(
+                'WAVESCULPTOR22',
+                create,
+            ),
+        )
+
+        with self.assertLogs('revolution.environment', ERROR) as logs:
+            self.assertTrue(peripheries.wait_initializations(1))
+
+            for _ in range(2):
+                self.assertRaisesRegex(
+                    RuntimeError,
+                    'motor_wavesculptor22',
+                    getattr,
+                    peripheries,
+                    'motor_wavesculptor22',
+                )
+
+        self.assertEqual(len(logs.output), 2)
+        self.assertIn(current_thread().name, logs.output[1])
+        self.assertIs(
+            peripheries.driver_steering_wheel,
+            configurations.PERIPHERIES.driver_steering_wheel,
+        )
+
+    def test_peripheries_startup(self) -> None:
+        initializer = Initializer()
+        gps = MagicMock()
+        event = Event()
+
+        def create() -> MagicMock:
+            event.wait(5)
+
+            return gps
+
+        environment = Environment(
+            ContextsDoor(replace(configurations.CONTEXTS)),
+            replace(
+                configurations.PERIPHERIES,
+                miscellaneous_gps=initializer.initialize('GPS', create),
+            ),
+            replace(configurations.SETTINGS, general_log_filepath=''),
+        )
+        applications = Motor(environment), Power(environment)
+        start_time = perf_counter()
+
+        try:
+            for application in applications:
+                application._setup()
+
+            self.assertIs(
+                environment.peripheries.motor_wavesculptor22,
+                configurations.PERIPHERIES.motor_wavesculptor22,
+            )
+            self.assertIs(
+                environment.peripheries.power_psm_motor_ina229,
+                configurations.PERIPHERIES.power_psm_motor_ina229,
+            )
+            self.assertLess(perf_counter() - start_time, 1)
+            self.assertFalse(environment.peripheries.wait_initializations(0))
+        finally:
+            event.set()
+
+            for application in applications:
+                application._handle_stop()
+                application._teardown()
+
+        self.assertIs(environment.peripheries.miscellaneous_gps, gps)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,51 @@
+from subprocess import run
+from sys import executable
+from unittest import TestCase, main
+
+import revolution
+
+
+class ImportsTestCase(TestCase):
+    def test_lazy_imports(self) -> None:
+        process = run(
+            (
+                executable,
+                '-c',
+                (
+                    'import sys, revolution;'
+                    ' print(*(name.split(".")[0] for name in sys.modules))'
+                ),
+            ),
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        module_names = set(process.stdout.split())
+
+        for module_name in (
+                'adafruit_gps',
+                'battlib',
+                'can',
+                'iclib',
+                'numpy',
+                'periphery',
+                'serial',
+                'websockets',
+        ):
+            self.assertNotIn(module_name, module_names)
+
+    def test_exports(self) -> None:
+        for name in revolution.__all__:
+            self.assertIsNotNone(getattr(revolution, name))
+
+        self.assertTrue(callable(revolution.main))
+        self.assertEqual(
+            revolution.Power.__module__,
+            'revolution.power',
+        )
+        self.assertLessEqual(set(revolution.__all__), set(dir(revolution)))
+        self.assertRaises(AttributeError, getattr, revolution, 'Unknown')
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
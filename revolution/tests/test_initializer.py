@@ -0,0 +1,117 @@
+from logging import CRITICAL, disable, NOTSET
+from time import perf_counter, sleep
+from unittest import TestCase, main
+
+from revolution.initializer import Initialization, Initializer
+
+
+class InitializerTestCase(TestCase):
+    def setUp(self) -> None:
+        disable(CRITICAL)
+
+    def tearDown(self) -> None:
+        disable(NOTSET)
+
+    def test_concurrency(self) -> None:
+        initializer = Initializer(4)
+
+        def create(value: int) -> int:
+            sleep(0.05)
+
+            return value
+
+        placeholders = [
+            initializer.initialize(str(i), create, i) for i in range(4)
+        ]
+        start_time = perf_counter()
+
+        initializer.start()
+
+        self.assertTrue(initializer.join())
+        self.assertLess(perf_counter() - start_time, 0.15)
+
+        for i, placeholder in enumerate(placeholders):
+            assert isinstance(placeholder, Initialization)
+
+            self.assertEqual(placeholder.result(), i)
+
+    def test_dependencies(self) -> None:
+        initializer = Initializer(2)
+        names: list[str] = []
+
+        def create(name: str, *dependencies: str) -> str:
+            sleep(0.01)
+            names.append(name)
+
+            return name
+
+        bus = initializer.initialize('bus', create, 'bus')
+        motor = initializer.initialize('motor', create, 'motor', bus)
+        battery = initializer.initialize('battery', create, 'battery', bus)
+        light = initializer.initialize('light', create, 'light')
+
+        initializer.start()
+
+        assert isinstance(motor, Initialization)
+        assert isinstance(battery, Initialization)
+        assert isinstance(light, Initialization)
+
+        self.assertEqual(motor.result(), 'motor')
+        self.assertTrue(initializer.join())
+        self.assertLess(names.index('bus'), names.index('motor'))
+        self.assertLess(names.index('bus'), names.index('battery'))
+
+        statistics = initializer.get_statistics()
+
+        self.assertEqual(statistics['motor'].dependencies, ('bus',))
+        self.assertEqual(statistics['light'].dependencies, ())
+
+        start_times = {}
+
+        for name in ('bus', 'motor', 'battery', 'light'):
+            start_time = statistics[name].start_time
+            initialization_time = statistics[name].initialization_time
+
+            assert start_time is not None
+            assert initialization_time is not None
+
+            self.assertIsNone(statistics[name].exception)
+            self.assertGreaterEqual(start_time, 0)
+            self.assertGreaterEqual(initialization_time, 0.01)
+
+            start_times[name] = start_time
+
+        self.assertGreaterEqual(
+            start_times['motor'],
+            start_times['bus'] + 0.01,
+        )
+
+    def test_failure(self) -> None:
+        initializer = Initializer()
+
+        def fail() -> None:
+            raise ValueError
+
+        def create(bus: None) -> None:
+            return bus
+
+        bus = initializer.initialize('bus', fail)
+        motor = initializer.initialize('motor', create, bus)
+
+        initializer.start()
+
+        self.assertTrue(initializer.join())
+
+        assert isinstance(motor, Initialization)
+
+        self.assertRaises(RuntimeError, motor.result)
+
+        statistics = initializer.get_statistics()
+
+        self.assertEqual(statistics['bus'].exception, 'ValueError()')
+        self.assertIsNotNone(statistics['motor'].exception)
+        self.assertRaises(ValueError, initializer.initialize, 'light', fail)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,64 @@
+from dataclasses import replace
+from glob import glob
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import sleep
+from unittest import TestCase, main
+
+from revolution.environment import ContextsDoor, Environment
+from revolution.miscellaneous import Miscellaneous
+from revolution.tests import configurations
+
+
+class MiscellaneousTestCase(TestCase):
+    def test_runtime_log(self) -> None:
+        with TemporaryDirectory() as directory:
+            environment = Environment(
+                ContextsDoor(replace(configurations.CONTEXTS)),
+                configurations.PERIPHERIES,
+                replace(
+                    configurations.SETTINGS,
+                    general_log_filepath=f'{directory}/',
+                    power_log_timeout=0.01,
+                ),
+            )
+
+            with environment.contexts() as contexts:
+                contexts.power_battery_cell_flags[3] = 1
+                contexts.power_battery_hold_thermistor_flags[5] = 2
+
+            miscellaneous = Miscellaneous(environment)
+            thread = Thread(target=miscellaneous._runtime_log)
+
+            thread.start()
+            sleep(0.05)
+            miscellaneous._stoppage.set()
+            thread.join()
+
+            filepath, = glob(f'{directory}/runtime_log/*_runtime_log.csv')
+
+            with open(filepath) as file:
+                header, *rows = file.read().splitlines()
+
+        names = header.split(', ')
+
+        self.assertIn('power_battery_cell_flags.35', names)
+        self.assertIn('power_battery_hold_thermistor_flags.17', names)
+        self.assertTrue(rows)
+
+        for row in rows:
+            values = row.split(', ')
+
+            self.assertEqual(len(values), len(names))
+            self.assertEqual(
+                values[names.index('power_battery_cell_flags.3')],
+                '1',
+            )
+            self.assertEqual(
+                values[names.index('power_battery_hold_thermistor_flags.5')],
+                '2',
+            )
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
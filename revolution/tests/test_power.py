@@ -0,0 +1,229 @@
+from dataclasses import replace
+from logging import CRITICAL, disable, NOTSET
+from os import path
+from struct import pack
+from tempfile import TemporaryDirectory
+from time import perf_counter, time
+from unittest import TestCase, main
+from unittest.mock import MagicMock
+
+from can import Message
+
+from revolution.battery_management_system import (
+    BATTERY_CELL_COUNT,
+    BatteryFlag,
+    BatteryManagementSystem,
+)
+from revolution.environment import ContextsDoor, Environment
+from revolution.power import Power
+from revolution.soc import BatchedEKFSOCEstimator
+from revolution.tests import configurations
+
+
+class PowerTestCase(TestCase):
+    def setUp(self) -> None:
+        disable(CRITICAL)
+
+        self.environment = Environment(
+            ContextsDoor(replace(configurations.CONTEXTS)),
+            replace(
+                configurations.PERIPHERIES,
+                power_battery_management_system=BatteryManagementSystem(
+                    MagicMock(),
+                    0x500,
+                ),
+            ),
+            replace(configurations.SETTINGS, general_log_filepath=''),
+        )
+        self.power = Power(self.environment)
+
+        self.power._setup()
+
+    def tearDown(self) -> None:
+        self.power._handle_stop()
+        self.power._teardown()
+        disable(NOTSET)
+
+    def test_stop(self) -> None:
+        power = Power(
+            replace(
+                self.environment,
+                settings=replace(
+                    self.environment.settings,
+                    general_subscription_timeout=10,
+                ),
+            ),
+        )
+
+        power._setup()
+
+        start_time = perf_counter()
+
+        power._handle_stop()
+        power._teardown()
+
+        self.assertLess(perf_counter() - start_time, 1)
+
+    def test_information_handlers(self) -> None:
+        self.assertEqual(
+            set(Power.INFORMATION_HANDLERS),
+            set(BatteryManagementSystem.INFORMATION_TYPES),
+        )
+
+    def test_handle_can_messages(self) -> None:
+        self.power._handle_can_messages(
+            [
+                Message(
+                    arbitration_id=0x400,
+                    data=pack('<BBeee', 0b101, 0, 0, 120, 1.5),
+                ),
+                Message(
+                    arbitration_id=0x401,
+                    data=pack('<Q', (1 << 3) | (1 << 37)),
+                ),
+                Message(
+                    arbitration_id=0x406,
+                    data=pack('<HHee', 7, 2, 4.25, 0),
+                ),
+                Message(
+                    arbitration_id=0x413,
+                    data=pack('<eeee', 3, 3.5, 4, 4.5),
+                ),
+                Message(arbitration_id=0x500, data=bytes(8)),
+            ],
+        )
+
+        contexts = self.environment.contexts.snapshot()
+
+        self.assertTrue(contexts.power_battery_relay_status)
+        self.assertFalse(contexts.power_battery_electric_safe_discharge_status)
+        self.assertTrue(contexts.power_battery_discharge_status)
+        self.assertEqual(contexts.power_battery_HV_voltage, 120)
+        self.assertEqual(
+            contexts.power_battery_cell_flags[3],
+            BatteryFlag.OVERVOLTAGE,
+        )
+        self.assertEqual(
+            contexts.power_battery_thermistor_flags[1],
+            BatteryFlag.OVERTEMPERATURE,
+        )
+        self.assertEqual(
+            contexts.power_battery_flags,
+            BatteryFlag.OVERVOLTAGE | BatteryFlag.OVERTEMPERATURE,
+        )
+        self.assertEqual(contexts.power_battery_hold_elapsed_count, 7)
+        self.assertEqual(contexts.power_battery_hold_OV_count, 2)
+        self.assertEqual(contexts.power_battery_hold_OV_max, 4.25)
+        self.assertEqual(
+            contexts.power_battery_cell_voltages[4:8],
+            [3, 3.5, 4, 4.5],
+        )
+        self.assertEqual(contexts.power_battery_max_cell_voltage, 4.5)
+        self.assertGreater(contexts.power_battery_heartbeat_timestamp, 0)
+
+        self.power._handle_can_messages(
+            [Message(arbitration_id=0x401, data=pack('<Q', 0))],
+        )
+
+        contexts = self.environment.contexts.snapshot()
+
+        self.assertEqual(contexts.power_battery_flags, BatteryFlag.CLEAR)
+        self.assertEqual(contexts.power_battery_cell_flags.union, 0)
+
+    def test_soc_checkpoint(self) -> None:
+        estimator = BatchedEKFSOCEstimator(
+            configurations.BATTERY,
+            BATTERY_CELL_COUNT,
+        )
+
+        estimator.initialize([3.5] * BATTERY_CELL_COUNT)
+
+        with TemporaryDirectory() as directory:
+            filepath = path.join(directory, 'soc_checkpoint.bin')
+
+            estimator.save(filepath, time())
+
+            environment = Environment(
+                ContextsDoor(replace(configurations.CONTEXTS)),
+                self.environment.peripheries,
+                replace(
+                    self.environment.settings,
+                    power_soc_checkpoint_filepath=filepath,
+                ),
+            )
+            power = Power(environment)
+            subscription = environment.contexts.subscribe(
+                'power_battery_min_state_of_charge',
+            )
+
+            power._setup()
+
+            try:
+                self.assertTrue(subscription.wait(1))
+            finally:
+                subscription.close()
+                power._handle_stop()
+                power._teardown()
+
+            contexts = environment.contexts.snapshot()
+
+            self.assertAlmostEqual(
+                contexts.power_battery_min_state_of_charge,
+                estimator.socs[0],
+            )
+            self.assertAlmostEqual(
+                contexts.power_battery_max_state_of_charge,
+                estimator.socs[0],
+            )
+
+            estimator = BatchedEKFSOCEstimator(
+                configurations.BATTERY,
+                BATTERY_CELL_COUNT,
+            )
+
+            self.assertTrue(estimator.restore(filepath, time(), 1))
+
+    def test_soc_checkpoint_error(self) -> None:
+        with TemporaryDirectory() as directory:
+            filepath = path.join(directory, 'file')
+
+            with open(filepath, 'w'):
+                pass
+
+            environment = Environment(
+                ContextsDoor(replace(configurations.CONTEXTS)),
+                self.environment.peripheries,
+                replace(
+                    self.environment.settings,
+                    power_soc_checkpoint_filepath=path.join(
+                        filepath,
+                        'soc_checkpoint.bin',
+                    ),
+                ),
+            )
+            with environment.contexts() as contexts:
+                for i in range(BATTERY_CELL_COUNT):
+                    contexts.power_battery_cell_voltages[i] = 3.5
+
+            power = Power(environment)
+            subscription = environment.contexts.subscribe(
+                'power_battery_min_state_of_charge',
+            )
+
+            power._setup()
+
+            try:
+                self.assertTrue(subscription.wait(1))
+            finally:
+                subscription.close()
+                power._handle_stop()
+                power._teardown()
+
+            contexts = environment.contexts.snapshot()
+
+            self.assertGreater(contexts.power_battery_min_state_of_charge, 0)
+            self.assertEqual(power._soc_worker.statistics.restart_count, 0)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,147 @@
+from functools import partial
+from logging import CRITICAL, disable, NOTSET
+from queue import Empty, Queue
+from threading import Event, Thread
+from time import sleep
+from typing import Any
+from unittest import TestCase, main
+
+from revolution.radio import RadioTransmitter
+
+
+class FakeSerial:
+    def __init__(self, *responses: list[bytes]) -> None:
+        self.commands: list[bytes] = []
+        self.responses = list(responses)
+        self.lines: Queue[bytes] = Queue()
+        self.ready = Event()
+        self.ready.set()
+
+    def write(self, data: bytes) -> int:
+        self.commands.append(data)
+        self.ready.wait()
+
+        for line in self.responses.pop(0) if self.responses else []:
+            self.lines.put(line)
+
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def readline(self) -> bytes:
+        try:
+            return self.lines.get(timeout=0.01)
+        except Empty:
+            return b''
+
+
+class RadioTransmitterTestCase(TestCase):
+    SENT_RESPONSES: list[bytes] = [b'OK\r\n', b'+EVT:TXP2P DONE\r\n']
+
+    def setUp(self) -> None:
+        disable(CRITICAL)
+
+    def tearDown(self) -> None:
+        disable(NOTSET)
+
+    def start(self, serial: FakeSerial, **kwargs: Any) -> RadioTransmitter:
+        stoppage = Event()
+        transmitter = RadioTransmitter(
+            serial,  # type: ignore[arg-type]
+            stoppage,
+            0.05,
+            0.05,
+            retry_delay=0.01,
+            **kwargs,
+        )
+        threads = [
+            Thread(target=transmitter.read),
+            Thread(target=transmitter.write),
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        def stop() -> None:
+            stoppage.set()
+
+            for thread in threads:
+                thread.join()
+
+        self.addCleanup(stop)
+
+        return transmitter
+
+    def test_sending(self) -> None:
+        serial = FakeSerial([b'OK\r\n'], self.SENT_RESPONSES)
+        transmitter = self.start(serial)
+
+        transmitter.configure('AT+P2P=915000000:7:0:0:200:14')
+        transmitter.submit('data', lambda: b'\x01\xab')
+        transmitter.submit('nothing', lambda: None)
+
+        self.assertTrue(transmitter.wait(1))
+        self.assertEqual(
+            serial.commands,
+            [b'AT+P2P=915000000:7:0:0:200:14\r\n', b'AT+PSEND=01ab\r\n'],
+        )
+
+        statistics = transmitter.statistics
+
+        self.assertEqual(statistics.submitted_count, 2)
+        self.assertEqual(statistics.sent_count, 1)
+        self.assertEqual(statistics.drop_count, 0)
+
+    def test_retry_and_drop(self) -> None:
+        drops = []
+        serial = FakeSerial(
+            [b'AT_BUSY_ERROR\r\n'],
+            [],
+            self.SENT_RESPONSES,
+        )
+        transmitter = self.start(serial, drop_callback=lambda: drops.append(1))
+
+        transmitter.submit('data', lambda: b'\x01')
+
+        self.assertTrue(transmitter.wait(1))
+        self.assertEqual(len(serial.commands), 3)
+        self.assertEqual(transmitter.statistics.retry_count, 2)
+        self.assertEqual(transmitter.statistics.sent_count, 1)
+
+        serial.responses = [[b'AT_BUSY_ERROR\r\n']] * 4
+        transmitter.submit('data', lambda: b'\x02')
+
+        self.assertTrue(transmitter.wait(1))
+        self.assertEqual(len(serial.commands), 7)
+        self.assertEqual(transmitter.statistics.retry_count, 5)
+        self.assertEqual(transmitter.statistics.drop_count, 1)
+        self.assertEqual(drops, [1])
+
+    def test_coalescing(self) -> None:
+        serial = FakeSerial(*[self.SENT_RESPONSES] * 3)
+        serial.ready.clear()
+        transmitter = self.start(serial)
+
+        transmitter.submit('data', lambda: b'\x00')
+
+        while not serial.commands:
+            sleep(0.001)
+
+        for i in range(1, 4):
+            transmitter.submit('data', partial(bytes, [i]))
+
+        transmitter.submit('fault', lambda: b'\xff', True)
+        serial.ready.set()
+
+        self.assertTrue(transmitter.wait(1))
+        self.assertEqual(
+            serial.commands,
+            [b'AT+PSEND=00\r\n', b'AT+PSEND=ff\r\n', b'AT+PSEND=03\r\n'],
+        )
+        self.assertEqual(transmitter.statistics.coalesced_count, 2)
+        self.assertEqual(transmitter.statistics.sent_count, 3)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,277 @@
+from collections.abc import Iterator
+from logging import CRITICAL, disable, NOTSET
+from threading import Event
+from time import sleep
+from unittest import TestCase, main
+from unittest.mock import patch
+
+from revolution.scheduler import PeriodicTask, Scheduler
+from revolution.worker import RestartPolicy
+
+
+class SchedulerTestCase(TestCase):
+    def setUp(self) -> None:
+        self.scheduler = Scheduler(2)
+
+    def test_schedule(self) -> None:
+        def target() -> None:
+            sleep(0.005)
+
+        task = self.scheduler.schedule(target, 0.01, 'target')
+
+        sleep(0.205)
+        task.cancel()
+
+        statistics = task.statistics
+
+        self.assertEqual(statistics.name, 'target')
+        self.assertGreaterEqual(statistics.run_count, 10)
+        self.assertLessEqual(statistics.run_count, 20)
+        self.assertLessEqual(statistics.overrun_count, 2)
+        self.assertGreaterEqual(statistics.execution_times.maximum, 0.005)
+        self.assertEqual(self.scheduler.get_task_statistics(), {})
+
+    def test_overrun(self) -> None:
+        def target() -> None:
+            sleep(0.025)
+
+        task = self.scheduler.schedule(target, 0.01, delay=0)
+
+        sleep(0.1)
+        task.cancel()
+
+        statistics = task.statistics
+
+        self.assertIn(statistics.run_count, (2, 3, 4))
+        self.assertEqual(statistics.overrun_count, statistics.run_count)
+        self.assertGreaterEqual(
+            statistics.skip_count,
+            2 * statistics.run_count,
+        )
+
+    def test_timing(self) -> None:
+        clock = [0.0]
+
+        def target() -> None:
+            clock[0] += 0.005
+
+        task = PeriodicTask(self.scheduler, target, 0.02, 'target', 0.02)
+
+        with patch('revolution.scheduler.monotonic', lambda: clock[0]):
+            for latency in (0.001, 0.001, 0.001, 0.003, 0.001):
+                clock[0] = task._deadline + latency
+
+                task._run()
+
+        statistics = task.statistics
+
+        self.assertEqual(statistics.run_count, 5)
+        self.assertEqual(statistics.overrun_count, 0)
+        self.assertAlmostEqual(statistics.periods.p50, 0.02)
+        self.assertAlmostEqual(statistics.periods.maximum, 0.022)
+        self.assertAlmostEqual(statistics.execution_times.p50, 0.005)
+        self.assertAlmostEqual(statistics.execution_times.maximum, 0.005)
+        self.assertAlmostEqual(statistics.latencies.p50, 0.001)
+        self.assertAlmostEqual(statistics.latencies.maximum, 0.003)
+
+    def test_overrun_timing(self) -> None:
+        clock = [0.0]
+
+        def target() -> None:
+            clock[0] += 0.025
+
+        task = PeriodicTask(self.scheduler, target, 0.02, 'target', 0)
+
+        with patch('revolution.scheduler.monotonic', lambda: clock[0]):
+            for _ in range(3):
+                clock[0] = task._deadline
+
+                task._run()
+
+        statistics = task.statistics
+
+        self.assertEqual(statistics.run_count, 3)
+        self.assertEqual(statistics.overrun_count, 3)
+        self.assertEqual(statistics.skip_count, 3)
+        self.assertAlmostEqual(statistics.periods.p50, 0.04)
+        self.assertAlmostEqual(statistics.latencies.maximum, 0)
+
+    def test_sample_count(self) -> None:
+        scheduler = Scheduler(sample_count=2)
+        clock = [0.0]
+        durations = [0.001, 0.001, 0.015, 0.001, 0.001]
+
+        def target() -> None:
+            clock[0] += durations.pop(0)
+
+        task = PeriodicTask(scheduler, target, 0.02, 'target', 0)
+
+        with patch('revolution.scheduler.monotonic', lambda: clock[0]):
+            for _ in range(3):
+                clock[0] = task._deadline
+
+                task._run()
+
+            self.assertAlmostEqual(
+                task.statistics.execution_times.maximum,
+                0.015,
+            )
+
+            for _ in range(2):
+                clock[0] = task._deadline
+
+                task._run()
+
+        self.assertAlmostEqual(task.statistics.execution_times.maximum, 0.001)
+
+    def test_generator(self) -> None:
+        values: list[int] = []
+
+        def target() -> Iterator[None]:
+            value = 0
+
+            while True:
+                yield
+
+                value += 1
+
+                values.append(value)
+
+                if values == [1, 2]:
+                    raise ValueError
+
+                if value == 3:
+                    return
+
+        disable(CRITICAL)
+
+        try:
+            self.scheduler.schedule(target, 0.005)
+            sleep(0.1)
+        finally:
+            disable(NOTSET)
+
+        self.assertEqual(values, [1, 2, 1, 2, 3])
+        self.assertEqual(self.scheduler.get_task_statistics(), {})
+
+    def test_restart(self) -> None:
+        restart_policy = RestartPolicy(0.02, 0.08, 2, 0)
+        clock = [0.0]
+        failures = [True] * 5 + [False, True]
+
+        def target() -> None:
+            if failures.pop(0):
+                raise ValueError
+
+        task = PeriodicTask(
+            self.scheduler,
+            target,
+            0.001,
+            'target',
+            0,
+            restart_policy,
+        )
+        timeouts = []
+        disable(CRITICAL)
+
+        try:
+            with patch('revolution.scheduler.monotonic', lambda: clock[0]):
+                for _ in range(7):
+                    clock[0] = task._deadline
+
+                    task._run()
+
+                    timeouts.append(task._deadline - clock[0])
+        finally:
+            disable(NOTSET)
+
+        for timeout, expected_timeout in zip(
+                timeouts,
+                (0.02, 0.04, 0.08, 0.08, 0.08, 0.001, 0.02),
+        ):
+            self.assertAlmostEqual(timeout, expected_timeout)
+
+    def test_dedicated(self) -> None:
+        scheduler = Scheduler(1)
+        values: list[None] = []
+
+        scheduler.schedule(lambda: sleep(0.5), 0.01, 'pool', 0)
+
+        task = scheduler.schedule(
+            lambda: values.append(None),
+            0.01,
+            'dedicated',
+            dedicated=True,
+        )
+
+        sleep(0.2)
+
+        self.assertEqual(
+            set(scheduler.get_task_statistics()),
+            {'pool', 'dedicated'},
+        )
+
+        task.cancel()
+
+        self.assertGreaterEqual(len(values), 10)
+        self.assertEqual(list(scheduler.get_task_statistics()), ['pool'])
+
+        count = len(values)
+
+        sleep(0.05)
+
+        self.assertEqual(len(values), count)
+
+    def test_restart_policy(self) -> None:
+        scheduler = Scheduler(restart_policy=RestartPolicy(10, 10))
+        deadlines = []
+        event = Event()
+
+        def target() -> None:
+            deadlines.append(task._deadline)
+
+            if len(deadlines) == 1:
+                raise ValueError
+
+            event.set()
+
+        disable(CRITICAL)
+
+        try:
+            task = scheduler.schedule(
+                target,
+                0.05,
+                dedicated=True,
+                restart_policy=RestartPolicy(0.0125, 0.05, restart_window=0),
+            )
+
+            self.assertTrue(event.wait(1))
+            task.cancel()
+        finally:
+            disable(NOTSET)
+
+        self.assertEqual(len(deadlines), 2)
+        self.assertAlmostEqual(deadlines[1] - deadlines[0], 0.05)
+        self.assertEqual(task.statistics.skip_count, 0)
+
+    def test_cancel(self) -> None:
+        values: list[None] = []
+
+        def target() -> None:
+            sleep(0.02)
+            values.append(None)
+
+        task = self.scheduler.schedule(target, 0.01, delay=0)
+
+        sleep(0.01)
+        task.cancel()
+
+        self.assertEqual(len(values), 1)
+
+        sleep(0.02)
+
+        self.assertEqual(len(values), 1)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,142 @@
+from os import path
+from random import Random
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from battlib import EKFSOCEstimator
+from numpy import array_equal
+
+from revolution.soc import BatchedEKFSOCEstimator
+from revolution.tests import configurations
+
+
+class BatchedEKFSOCEstimatorTestCase(TestCase):
+    def test_step(self) -> None:
+        random = Random(0)
+        battery = configurations.BATTERY
+        count = 36
+        estimator = BatchedEKFSOCEstimator(battery, count)
+        estimators: list[EKFSOCEstimator | None] = [None] * count
+
+        for i in range(300):
+            voltages = [
+                random.uniform(2.5, 4.3) if i >= 3 * j else 0
+                for j in range(count)
+            ]
+            current = random.uniform(-50, 50)
+            dt = random.uniform(0.03, 0.07)
+
+            estimator.step(dt=dt, i_in=current, measured_vs=voltages)
+            estimator.initialize(voltages)
+
+            for j, voltage in enumerate(voltages):
+                estimator_ = estimators[j]
+
+                if estimator_ is None and voltage:
+                    estimators[j] = EKFSOCEstimator(battery, voltage)
+                elif estimator_ is not None:
+                    estimator_.step(dt=dt, i_in=current, measured_v=voltage)
+
+            for j, estimator_ in enumerate(estimators):
+                if estimator_ is None:
+                    self.assertFalse(estimator.initializations[j])
+                    self.assertEqual(estimator.socs[j], 0)
+                else:
+                    self.assertTrue(estimator.initializations[j])
+                    self.assertAlmostEqual(
+                        estimator.socs[j],
+                        estimator_.x[0],
+                        places=12,
+                    )
+                    self.assertTrue(
+                        (
+                            abs(estimator.covariances[j] - estimator_.P)
+                            < 1e-12
+                        ).all(),
+                    )
+
+    def test_checkpoint(self) -> None:
+        random = Random(0)
+        battery = configurations.BATTERY
+        estimator = BatchedEKFSOCEstimator(battery, 36)
+        voltages = [random.uniform(2.5, 4.3) for _ in range(35)] + [0]
+
+        estimator.initialize(voltages)
+
+        for _ in range(10):
+            estimator.step(dt=0.05, i_in=10, measured_vs=voltages)
+
+        with TemporaryDirectory() as directory:
+            filepath = path.join(directory, 'soc_checkpoint.bin')
+
+            estimator.save(filepath, 1000)
+
+            restored_estimator = BatchedEKFSOCEstimator(battery, 36)
+
+            self.assertFalse(restored_estimator.restore(filepath, 1601, 600))
+            self.assertFalse(restored_estimator.restore(filepath, 999, 600))
+            self.assertFalse(restored_estimator.initializations.any())
+            self.assertTrue(restored_estimator.restore(filepath, 1600, 600))
+
+            for name in ('initializations', 'states', 'covariances'):
+                self.assertTrue(
+                    array_equal(
+                        getattr(restored_estimator, name),
+                        getattr(estimator, name),
+                    ),
+                )
+
+            self.assertRaises(
+                ValueError,
+                BatchedEKFSOCEstimator(battery, 18).restore,
+                filepath,
+                1000,
+                600,
+            )
+
+            with open(filepath, 'r+b') as file:
+                file.truncate(100)
+
+            self.assertRaises(
+                ValueError,
+                restored_estimator.restore,
+                filepath,
+                1000,
+                600,
+            )
+
+    def test_zero_voltages(self) -> None:
+        random = Random(0)
+        battery = configurations.BATTERY
+        count = 4
+        estimator = BatchedEKFSOCEstimator(battery, count)
+        estimators = [EKFSOCEstimator(battery, 3.7) for _ in range(count)]
+
+        estimator.initialize([3.7] * count)
+
+        for i in range(100):
+            voltages = [
+                0 if (i + j) % 5 == 0 else random.uniform(3.5, 3.9)
+                for j in range(count)
+            ]
+            current = random.uniform(-50, 50)
+
+            estimator.step(dt=0.05, i_in=current, measured_vs=voltages)
+
+            for estimator_, voltage in zip(estimators, voltages):
+                estimator_.step(dt=0.05, i_in=current, measured_v=voltage)
+
+            for j, estimator_ in enumerate(estimators):
+                self.assertAlmostEqual(
+                    estimator.socs[j],
+                    estimator_.x[0],
+                    places=12,
+                )
+                self.assertTrue(
+                    (abs(estimator.covariances[j] - estimator_.P) < 1e-12)
+                    .all(),
+                )
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
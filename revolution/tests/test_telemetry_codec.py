@@ -0,0 +1,175 @@
+from dataclasses import dataclass, fields, replace
+from math import isnan
+from random import Random
+from typing import Any
+from unittest import TestCase, main
+
+from revolution.telemetry import Telemetry
+from revolution.telemetry_codec import (
+    FrameType,
+    telemetry_field,
+    TelemetryDecoder,
+    TelemetryEncoder,
+    TelemetryLayout,
+)
+
+
+@dataclass
+class Data:
+    status: bool
+    flags: int = telemetry_field('B', priority=2, urgent=True)
+    voltage: float = telemetry_field('h', 0.01, priority=1)
+    current: float = telemetry_field('i', 0.001, period=5)
+
+
+class TelemetryCodecTestCase(TestCase):
+    def setUp(self) -> None:
+        self.layout = TelemetryLayout(Data)
+        self.encoder = TelemetryEncoder(self.layout, 4)
+        self.decoder = TelemetryDecoder(self.layout)
+
+    def test_round_trip(self) -> None:
+        layout = TelemetryLayout(Telemetry.Data)
+        encoder = TelemetryEncoder(layout, 10)
+        decoder = TelemetryDecoder(layout)
+        random = Random(0)
+        values: dict[str, Any] = {}
+
+        for field, quantization in zip(
+                fields(Telemetry.Data),
+                layout.quantizations,
+        ):
+            if quantization.value_type is bool:
+                values[field.name] = False
+            elif quantization.value_type is int:
+                values[field.name] = 0
+            else:
+                values[field.name] = random.uniform(0, 1)
+
+        data = Telemetry.Data(**values)
+
+        for i in range(100):
+            name = random.choice(layout.names)
+            value = getattr(data, name)
+
+            if isinstance(value, bool):
+                value = not value
+            elif isinstance(value, int):
+                value = random.randrange(256)
+            else:
+                value = random.uniform(0, 1)
+
+            data = replace(data, **{name: value})
+            decoded_data = decoder.decode(encoder.encode(data, 10 * i))
+
+            for name, quantization in zip(
+                    layout.names,
+                    layout.quantizations,
+            ):
+                self.assertAlmostEqual(
+                    getattr(decoded_data, name),
+                    getattr(data, name),
+                    delta=quantization.resolution / 2 + 1e-9,
+                )
+
+    def test_delta(self) -> None:
+        data = Data(False, 0, 3.3, 1.5)
+        keyframe = self.encoder.encode(data)
+
+        self.assertEqual(keyframe[0], FrameType.KEYFRAME)
+        self.assertEqual(len(keyframe), 2 + 1 + 1 + 2 + 4 + 2)
+
+        frame = self.encoder.encode(replace(data, voltage=3.304))
+
+        self.assertEqual(frame[0], FrameType.DELTA)
+        self.assertEqual(len(frame), 2 + 1 + 2)
+
+        frame = self.encoder.encode(replace(data, flags=3, voltage=3.31))
+
+        self.assertEqual(len(frame), 2 + 1 + 1 + 2 + 2)
+
+        self.encoder.encode(data)
+
+        self.assertEqual(self.encoder.encode(data)[0], FrameType.KEYFRAME)
+
+        self.encoder.reset()
+
+        self.assertEqual(self.encoder.encode(data)[0], FrameType.KEYFRAME)
+
+    def test_scheduling(self) -> None:
+        encoder = TelemetryEncoder(self.layout, 100, 12)
+        data = Data(False, 0, 3.3, 1.5)
+
+        self.decoder.decode(encoder.encode(data, 0))
+
+        data = Data(True, 1, 3.4, 1.6)
+        frame = encoder.encode(data, 1)
+
+        self.assertEqual(len(frame), 2 + 1 + 1 + 1 + 2 + 2)
+        self.assertEqual(self.decoder.decode(frame).current, 1.5)
+
+        frame = encoder.encode(data, 2)
+
+        self.assertEqual(len(frame), 2 + 1 + 2)
+        self.assertEqual(self.decoder.decode(frame).current, 1.5)
+        self.assertEqual(self.decoder.decode(encoder.encode(data, 5)), data)
+
+        data = Data(False, 2, 3.5, 1.7)
+        frame = encoder.encode(data, 10)
+
+        self.assertEqual(len(frame), 2 + 1 + 1 + 1 + 2 + 2)
+        self.assertEqual(
+            self.decoder.decode(frame),
+            replace(data, current=1.6),
+        )
+        self.assertEqual(self.decoder.decode(encoder.encode(data, 11)), data)
+        self.assertRaises(ValueError, TelemetryEncoder, self.layout, 100, 11)
+
+    def test_urgent(self) -> None:
+        data = Data(False, 0, 3.3, 1.5)
+
+        self.decoder.decode(self.encoder.encode_urgent(data) or b'')
+        self.assertIsNone(self.encoder.encode_urgent(replace(data, voltage=4)))
+
+        frame = self.encoder.encode_urgent(Data(True, 2, 4, 1.5))
+
+        assert frame is not None
+
+        self.assertEqual(frame[0], FrameType.DELTA)
+        self.assertEqual(len(frame), 2 + 1 + 1 + 2)
+        self.assertEqual(self.decoder.decode(frame), Data(False, 2, 3.3, 1.5))
+        self.assertEqual(
+            self.decoder.decode(self.encoder.encode(Data(True, 2, 4, 1.5))),
+            Data(True, 2, 4, 1.5),
+        )
+
+    def test_clipping(self) -> None:
+        data = Data(True, 300, 1e9, float('nan'))
+        decoded_data = self.decoder.decode(self.encoder.encode(data))
+
+        self.assertEqual(decoded_data.flags, 255)
+        self.assertEqual(decoded_data.voltage, 327.67)
+        self.assertTrue(isnan(decoded_data.current))
+
+    def test_errors(self) -> None:
+        data = Data(False, 0, 3.3, 1.5)
+        frames = [
+            self.encoder.encode(replace(data, flags=i)) for i in range(8)
+        ]
+
+        corrupted_frame = bytearray(frames[0])
+        corrupted_frame[3] ^= 1
+
+        self.assertRaises(ValueError, self.decoder.decode, corrupted_frame)
+        self.assertRaises(ValueError, self.decoder.decode, frames[1])
+        self.assertEqual(self.decoder.decode(frames[0]).flags, 0)
+        self.assertEqual(self.decoder.decode(frames[1]).flags, 1)
+        self.assertRaises(ValueError, self.decoder.decode, frames[3])
+        self.assertRaises(ValueError, self.decoder.decode, frames[5])
+        self.assertEqual(self.decoder.decode(frames[4]).flags, 4)
+        self.assertEqual(self.decoder.decode(frames[5]).flags, 5)
+        self.assertRaises(ValueError, self.decoder.decode, b'\x00')
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
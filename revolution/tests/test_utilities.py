@@ -0,0 +1,129 @@
+from functools import reduce
+from operator import or_
+from random import Random
+from unittest import TestCase, main
+
+from revolution.battery_management_system import BatteryFlag
+from revolution.utilities import AggregateArray, FlagArray
+
+
+class AggregateArrayTestCase(TestCase):
+    def test_float_aggregates(self) -> None:
+        random = Random(0)
+        values = [random.uniform(2.5, 4.2) for _ in range(36)]
+        array = AggregateArray('d', values)
+
+        for _ in range(1000):
+            i = random.randrange(len(values))
+            values[i] = random.choice(
+                (min(values), max(values), random.uniform(2.5, 4.2)),
+            )
+            array[i] = values[i]
+
+            self.assertEqual(array.minimum, min(values))
+            self.assertEqual(array.maximum, max(values))
+            self.assertAlmostEqual(array.mean, sum(values) / len(values))
+
+        self.assertEqual(array, values)
+        self.assertEqual(array.copy(), array)
+
+    def test_int_aggregates(self) -> None:
+        random = Random(0)
+        values = [0] * 18
+        array = AggregateArray('q', values)
+
+        for _ in range(1000):
+            i = random.randrange(len(values))
+            values[i] = random.choice((0, 0, 1 << random.randrange(6)))
+            array[i] = values[i]
+
+            self.assertEqual(array.union, reduce(or_, values))
+            self.assertEqual(array.total, sum(values))
+
+        copy = array.copy()
+        copy[0] = 1 << 7
+
+        self.assertNotEqual(copy, array)
+        self.assertEqual(array.union, reduce(or_, values))
+
+    def test_slice_assignment(self) -> None:
+        random = Random(0)
+        values = [random.randrange(2500, 4200) for _ in range(36)]
+        array = AggregateArray('q', values)
+
+        for _ in range(1000):
+            if random.random() < 0.5:
+                i = random.randrange(len(values))
+                values[i] = random.choice(
+                    (min(values), max(values), random.randrange(2500, 4200)),
+                )
+                array[i] = values[i]
+            else:
+                start = random.randrange(len(values))
+                stop = random.randrange(start, len(values) + 1)
+                step = random.randrange(1, 4)
+                length = len(range(start, stop, step))
+                slice_values = [
+                    random.randrange(2500, 4200) for _ in range(length)
+                ]
+                values[start:stop:step] = slice_values
+                array[start:stop:step] = slice_values
+
+            self.assertEqual(array.minimum, min(values))
+            self.assertEqual(array.maximum, max(values))
+            self.assertEqual(array.total, sum(values))
+
+        self.assertEqual(array, values)
+        self.assertRaises(ValueError, array.__setitem__, slice(0, 2), [0])
+        self.assertEqual(array, values)
+
+
+class FlagArrayTestCase(TestCase):
+    def test_assign(self) -> None:
+        random = Random(0)
+        values = [0] * 36
+        array: FlagArray[BatteryFlag] = FlagArray(36)
+
+        for _ in range(1000):
+            flag = 1 << random.randrange(4)
+            mask = random.getrandbits(40) if random.random() < 0.8 else 0
+
+            for i in range(len(values)):
+                if mask >> i & 1:
+                    values[i] |= flag
+                else:
+                    values[i] &= ~flag
+
+            array.assign(flag, mask)
+
+            self.assertEqual(array, values)
+            self.assertEqual(array.union, reduce(or_, values))
+
+    def test_setitem(self) -> None:
+        random = Random(0)
+        values = [0] * 18
+        array: FlagArray[BatteryFlag] = FlagArray(18)
+
+        for _ in range(1000):
+            i = random.randrange(len(values))
+            values[i] = random.getrandbits(4)
+            array[i] = values[i]
+
+            self.assertEqual(array[i], values[i])
+            self.assertEqual(array.union, reduce(or_, values))
+
+        self.assertEqual(array[-3:], values[-3:])
+        self.assertEqual(FlagArray(len(values), values), array)
+
+        copy = array.copy()
+        copy[0] = 1 << 7
+
+        self.assertNotEqual(copy, array)
+        self.assertEqual(array, values)
+
+        with self.assertRaises(IndexError):
+            array[18] = 1
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,102 @@
+from logging import CRITICAL, disable, NOTSET
+from threading import Event
+from time import perf_counter, sleep
+from unittest import TestCase, main
+
+from revolution.worker import RestartPolicy, Worker
+
+
+class WorkerTestCase(TestCase):
+    def setUp(self) -> None:
+        disable(CRITICAL)
+
+    def tearDown(self) -> None:
+        disable(NOTSET)
+
+    def test_backoff(self) -> None:
+        times: list[float] = []
+
+        def target() -> None:
+            times.append(perf_counter())
+
+            if len(times) < 5:
+                raise ValueError(len(times))
+
+        worker = Worker(
+            target=target,
+            restart_policy=RestartPolicy(0.01, 0.04, jitter=0),
+        )
+
+        worker.start()
+        worker.join()
+
+        delays = [time_1 - time_0 for time_0, time_1 in zip(times, times[1:])]
+
+        for delay, expected_delay in zip(delays, (0.01, 0.02, 0.04, 0.04)):
+            self.assertGreaterEqual(delay, expected_delay)
+            self.assertLess(delay, expected_delay + 0.01)
+
+        statistics = worker.statistics
+
+        self.assertEqual(
+            statistics.name,
+            'WorkerTestCase.test_backoff.<locals>.target',
+        )
+        self.assertFalse(statistics.alive)
+        self.assertEqual(statistics.restart_count, 4)
+        self.assertEqual(statistics.last_exception, 'ValueError(4)')
+
+    def test_maximum_restart_count(self) -> None:
+        times: list[float] = []
+
+        def target() -> None:
+            times.append(perf_counter())
+
+            if len(times) < 4:
+                raise ValueError
+
+        worker = Worker(
+            target=target,
+            restart_policy=RestartPolicy(
+                0,
+                0,
+                maximum_restart_count=2,
+                restart_window=0.05,
+            ),
+        )
+
+        worker.start()
+        worker.join()
+
+        self.assertLess(times[2] - times[0], 0.01)
+        self.assertGreaterEqual(times[3] - times[1], 0.05)
+
+    def test_stoppage(self) -> None:
+        stoppage = Event()
+        counter = 0
+
+        def target() -> None:
+            nonlocal counter
+
+            counter += 1
+
+            raise ValueError
+
+        worker = Worker(
+            target=target,
+            restart_policy=RestartPolicy(10, 10),
+            stoppage=stoppage,
+        )
+
+        worker.start()
+        sleep(0.01)
+        stoppage.set()
+        worker.join(1)
+
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(counter, 1)
+        self.assertEqual(worker.statistics.restart_count, 0)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -1,4 +1,9 @@
-from enum import IntEnum
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from enum import IntEnum, IntFlag
+from typing import Any, cast, ClassVar, Generic, overload, TypeVar
 
 
 class Direction(IntEnum):
@@ -7,3 +12,403 @@ class Direction(IntEnum):
 
 
 PRBS = tuple[int, int]
+
+_T = TypeVar('_T', int, float)
+_F = TypeVar('_F', bound=IntFlag)
+
+
+@dataclass
+class Histogram:
+    """A histogram of durations with power-of-two buckets.
+
+    Bucket ``0`` counts durations below the resolution and bucket ``i``
+    counts durations from ``2 ** (i - 1)`` up to ``2 ** i`` times the
+    resolution. Quantiles are estimated by the upper bound of their
+    bucket.
+
+    >>> histogram = Histogram()
+    >>> for duration in (3e-6, 5e-6, 6e-6, 1e-3):
+    ...     histogram.add(duration)
+    >>> histogram.count, histogram.quantile(0.5), histogram.maximum
+    (4, 8e-06, 0.001)
+    """
+
+    BUCKET_COUNT: ClassVar[int] = 32
+    RESOLUTION: ClassVar[float] = 1e-6
+    counts: list[int] = field(
+        default_factory=lambda: [0] * Histogram.BUCKET_COUNT,
+    )
+    count: int = 0
+    total: float = 0
+    maximum: float = 0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0
+
+    def add(self, duration: float) -> None:
+        index = min(
+            int(duration / self.RESOLUTION).bit_length(),
+            self.BUCKET_COUNT - 1,
+        )
+        self.counts[index] += 1
+        self.count += 1
+        self.total += duration
+        self.maximum = max(self.maximum, duration)
+
+    def quantile(self, q: float) -> float:
+        rank = q * self.count
+        cumulative_count = 0
+
+        for index, count in enumerate(self.counts):
+            cumulative_count += count
+
+            if count and cumulative_count >= rank:
+                return min((1 << index) * self.RESOLUTION, self.maximum)
+
+        return self.maximum
+
+
+@dataclass
+class RingBuffer:
+    """A buffer of the latest samples with a fixed capacity.
+
+    >>> buffer = RingBuffer(4)
+    >>> for sample in (5, 1, 4, 2, 3):
+    ...     buffer.append(sample)
+    >>> buffer.samples
+    [1, 4, 2, 3]
+    >>> buffer.quantile(0.5), buffer.quantile(0.99), buffer.maximum
+    (3, 4, 4)
+    """
+
+    capacity: int
+    _samples: deque[float] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._samples = deque(maxlen=self.capacity)
+
+    @property
+    def samples(self) -> list[float]:
+        return list(self._samples)
+
+    @property
+    def maximum(self) -> float:
+        return max(self._samples, default=0)
+
+    def append(self, sample: float) -> None:
+        self._samples.append(sample)
+
+    def quantile(self, q: float) -> float:
+        samples = sorted(self._samples)
+
+        if not samples:
+            return 0
+
+        return samples[min(int(q * len(samples)), len(samples) - 1)]
+
+
+class AggregateArray(Sequence[_T]):
+    """A fixed-length array of numbers that keeps its aggregates up to
+    date as it is written.
+
+    The sum and, for integers, the bitwise OR are updated on each write
+    in constant time, the latter through a count of the set bits. The
+    minimum and maximum are also updated on each write unless the
+    current extreme is overwritten by a less extreme value, in which
+    case they are recomputed when next read.
+
+    >>> cell_voltages = AggregateArray('d', [3.5, 3.6, 3.7])
+    >>> cell_voltages[2] = 3.4
+    >>> cell_voltages.minimum, cell_voltages.maximum, cell_voltages.mean
+    (3.4, 3.6, 3.5)
+    >>> cell_voltages[:2] = [3.8, 3.9]
+    >>> cell_voltages.minimum, cell_voltages.maximum
+    (3.4, 3.9)
+    >>> cell_flags = AggregateArray('q', [0b01, 0b10, 0b00])
+    >>> cell_flags[1] = 0b00
+    >>> cell_flags.union
+    1
+    """
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, typecode: str, values: Iterable[_T] = ()) -> None:
+        self._values: array[_T] = array(typecode, values)
+        self._total: Any = sum(self._values)
+        self._bit_counts = [0] * 64
+        self._union = 0
+        self._minimum: _T | None = None
+        self._maximum: _T | None = None
+        self._integral = typecode not in 'fd'
+
+        if self._integral:
+            for value in self._values:
+                self._count_bits(int(value), 1)
+
+    @property
+    def typecode(self) -> str:
+        return self._values.typecode
+
+    @property
+    def minimum(self) -> _T:
+        if self._minimum is None:
+            self._minimum = min(self._values, default=0)
+
+        return self._minimum
+
+    @property
+    def maximum(self) -> _T:
+        if self._maximum is None:
+            self._maximum = max(self._values, default=0)
+
+        return self._maximum
+
+    @property
+    def total(self) -> _T:
+        return cast(_T, self._total)
+
+    @property
+    def mean(self) -> float:
+        return self._total / len(self._values) if self._values else 0
+
+    @property
+    def union(self) -> int:
+        """The bitwise OR of the integers."""
+        return self._union
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({repr(self.typecode)}, {self.tolist()})'
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[_T]:
+        return iter(self._values)
+
+    @overload
+    def __getitem__(self, index: int) -> _T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[_T]: ...
+
+    def __getitem__(self, index: int | slice) -> _T | list[_T]:
+        if isinstance(index, slice):
+            return self._values[index].tolist()
+
+        return self._values[index]
+
+    @overload
+    def __setitem__(self, index: int, value: _T) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[_T]) -> None: ...
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self._values)))
+            values = list(value)
+
+            if len(values) != len(indices):
+                raise ValueError(f'slice is not of length {len(indices)}')
+
+            for i, value in zip(indices, values):
+                self[i] = value
+
+            return
+
+        previous_value = self._values[index]
+        self._values[index] = value
+        value = self._values[index]
+        self._total += value - previous_value
+
+        if self._integral:
+            self._count_bits(int(previous_value), -1)
+            self._count_bits(int(value), 1)
+
+        if self._minimum is not None:
+            if value <= self._minimum:
+                self._minimum = value
+            elif previous_value == self._minimum:
+                self._minimum = None
+
+        if self._maximum is not None:
+            if value >= self._maximum:
+                self._maximum = value
+            elif previous_value == self._maximum:
+                self._maximum = None
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, AggregateArray):
+            return self._values == other._values
+
+        if isinstance(other, list):
+            return self.tolist() == other
+
+        return NotImplemented
+
+    def copy(self) -> 'AggregateArray[_T]':
+        copy = object.__new__(type(self))
+        copy._values = self._values[:]
+        copy._total = self._total
+        copy._bit_counts = self._bit_counts.copy()
+        copy._union = self._union
+        copy._minimum = self._minimum
+        copy._maximum = self._maximum
+        copy._integral = self._integral
+
+        return copy
+
+    def tolist(self) -> list[_T]:
+        return self._values.tolist()
+
+    def _count_bits(self, value: int, count: int) -> None:
+        value &= (1 << 64) - 1
+
+        while value:
+            bit = value & -value
+            index = bit.bit_length() - 1
+            self._bit_counts[index] += count
+
+            if self._bit_counts[index]:
+                self._union |= bit
+            else:
+                self._union &= ~bit
+
+            value ^= bit
+
+
+class FlagArray(Sequence[int], Generic[_F]):
+    """A fixed-length array of bit flags stored as one bitmask per flag,
+    whose bit ``i`` is set if element ``i`` has the flag.
+
+    A flag is set in some elements and cleared in the others by one
+    bitmask assignment, without any work per element, which suits flags
+    received as one bit per element. The array is typed by its flags,
+    as in ``FlagArray[BatteryFlag]``.
+
+    >>> cell_flags = FlagArray(4)
+    >>> cell_flags.assign(0b01, 0b0101)
+    >>> cell_flags.assign(0b10, 0b0110)
+    >>> cell_flags
+    FlagArray(4, [1, 2, 3, 0])
+    >>> cell_flags.union
+    3
+    >>> cell_flags.assign(0b01, 0)
+    >>> cell_flags[2] = 0b100
+    >>> cell_flags.tolist(), cell_flags.union
+    ([0, 2, 4, 0], 6)
+    >>> bin(cell_flags.get_mask(0b10))
+    '0b10'
+    """
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, length: int, values: Iterable[int] = ()) -> None:
+        self._length = length
+        self._masks: dict[int, int] = {}
+
+        for i, value in enumerate(values):
+            self[i] = value
+
+    @property
+    def union(self) -> int:
+        """The bitwise OR of the flags."""
+        union = 0
+
+        for flag in self._masks:
+            union |= flag
+
+        return union
+
+    def assign(self, flags: int, mask: int) -> None:
+        """Set the flags in the elements whose bit of the mask is set,
+        and clear them in the others.
+
+        :param flags: The flags.
+        :param mask: The bitmask of the elements, whose bits past the
+                     length are ignored.
+        :return: ``None``.
+        """
+        mask &= (1 << self._length) - 1
+
+        while flags:
+            flag = flags & -flags
+
+            if mask:
+                self._masks[flag] = mask
+            else:
+                self._masks.pop(flag, None)
+
+            flags ^= flag
+
+    def get_mask(self, flag: int) -> int:
+        """Get the bitmask of the elements with the flag.
+
+        :param flag: The flag, of one bit.
+        :return: The bitmask.
+        """
+        return self._masks.get(flag, 0)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._length}, {self.tolist()})'
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[int]:
+        for i in range(self._length):
+            yield self._get(i)
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[int]: ...
+
+    def __getitem__(self, index: int | slice) -> int | list[int]:
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(self._length)[index]]
+
+        return self._get(range(self._length)[index])
+
+    def __setitem__(self, index: int, value: int) -> None:
+        bit = 1 << range(self._length)[index]
+        flags = self.union | value
+
+        while flags:
+            flag = flags & -flags
+            mask = self._masks.get(flag, 0)
+            self.assign(flag, mask | bit if value & flag else mask & ~bit)
+            flags ^= flag
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FlagArray):
+            return (
+                self._length == other._length
+                and self._masks == other._masks
+            )
+
+        if isinstance(other, list):
+            return self.tolist() == other
+
+        return NotImplemented
+
+    def copy(self) -> 'FlagArray[_F]':
+        copy = object.__new__(type(self))
+        copy._length = self._length
+        copy._masks = self._masks.copy()
+
+        return copy
+
+    def tolist(self) -> list[int]:
+        return list(self)
+
+    def _get(self, index: int) -> int:
+        value = 0
+
+        for flag, mask in self._masks.items():
+            if mask >> index & 1:
+                value |= flag
+
+        return value
@@ -1,15 +1,55 @@
+from collections import deque
 from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
 from logging import getLogger
-from threading import Thread
+from random import random
+from sys import exc_info
+from threading import Event, Lock, Thread
+from time import monotonic, time
 from typing import Any
 
 _logger = getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class RestartPolicy:
+    """How a :class:`Worker` restarts its method after an error.
+
+    The restarts are delayed exponentially, from ``initial_delay`` up to
+    ``maximum_delay`` seconds, and each delay is shortened at random by
+    up to ``jitter`` of itself so that workers failing together do not
+    restart together. The delay is reset once the method runs for
+    ``maximum_delay`` seconds before raising. Regardless of the delay,
+    there are at most ``maximum_restart_count`` restarts in any
+    ``restart_window`` seconds.
+    """
+
+    initial_delay: float = 0.01
+    maximum_delay: float = 1
+    multiplier: float = 2
+    jitter: float = 0.5
+    maximum_restart_count: int = 10
+    restart_window: float = 1
+
+
+@dataclass(frozen=True)
+class WorkerStatistics:
+    name: str
+    alive: bool
+    restart_count: int
+    last_exception: str | None
+    """The representation of the last error raised by the method."""
+    last_exception_time: float | None
+    """When the last error was raised (in seconds since the epoch)."""
+
+
 class Worker(Thread):
     """A worker is an extension to Python's ``threading.Thread``.
 
-    The worker method restarts automatically when an error is raised.
+    The worker method restarts automatically when an error is raised,
+    after a delay given by the restart policy. The restarts stop once
+    the stoppage, if any, is set.
+    Unless named otherwise, the worker is named after its method.
 
     >>> from logging import basicConfig, CRITICAL
     >>> basicConfig(level=CRITICAL)
@@ -24,26 +64,11 @@ class Worker(Thread):
     >>> worker.join()
     >>> counter
     5
+    >>> worker.statistics.restart_count
+    4
+    >>> worker.statistics.last_exception
+    'ValueError()'
     """
-    @staticmethod
-    def wrap(function: Callable[..., object]) -> Callable[..., object]:
-        def wrapper(*args: Any, **kwargs: Any) -> object:
-            status = True
-            result = None
-
-            while status:
-                status = False
-
-                try:
-                    result = function(*args, **kwargs)
-                except:  # noqa: E722
-                    _logger.exception('Exception raised during function call')
-
-                    status = True
-
-            return result
-
-        return wrapper
 
     def __init__(
             self,
@@ -54,12 +79,83 @@ class Worker(Thread):
             kwargs: Mapping[str, Any] | None = None,
             *,
             daemon: bool | None = None,
+            restart_policy: RestartPolicy = RestartPolicy(),
+            stoppage: Event | None = None,
     ) -> None:
         super().__init__(
             group,
-            None if target is None else self.wrap(target),
-            name,
+            None if target is None else self._restart,
+            getattr(target, '__qualname__', None) if name is None else name,
             args,
             kwargs,
             daemon=daemon,
         )
+
+        self.restart_policy = restart_policy
+        self._function = target
+        self._stoppage = Event() if stoppage is None else stoppage
+        self._restart_count = 0
+        self._last_exception: str | None = None
+        self._last_exception_time: float | None = None
+        self._statistics_lock = Lock()
+
+    @property
+    def statistics(self) -> WorkerStatistics:
+        with self._statistics_lock:
+            return WorkerStatistics(
+                self.name,
+                self.is_alive(),
+                self._restart_count,
+                self._last_exception,
+                self._last_exception_time,
+            )
+
+    def _restart(self, *args: Any, **kwargs: Any) -> object:
+        assert self._function is not None
+
+        policy = self.restart_policy
+        delay = policy.initial_delay
+        restart_times = deque[float](maxlen=policy.maximum_restart_count)
+
+        while True:
+            start_time = monotonic()
+
+            try:
+                return self._function(*args, **kwargs)
+            except:  # noqa: E722
+                end_time = monotonic()
+
+                if end_time - start_time >= policy.maximum_delay:
+                    delay = policy.initial_delay
+
+                timeout = delay * (1 - policy.jitter * random())
+
+                if (
+                        restart_times
+                        and len(restart_times) == restart_times.maxlen
+                ):
+                    timeout = max(
+                        timeout,
+                        restart_times[0] + policy.restart_window - end_time,
+                    )
+
+                _logger.exception(
+                    (
+                        'Exception raised during function call, restarting'
+                        f' in {timeout:.3f} seconds'
+                    ),
+                )
+
+                with self._statistics_lock:
+                    self._last_exception = repr(exc_info()[1])
+                    self._last_exception_time = time()
+
+            if self._stoppage.wait(timeout):
+                return None
+
+            restart_times.append(monotonic())
+
+            delay = min(delay * policy.multiplier, policy.maximum_delay)
+
+            with self._statistics_lock:
+                self._restart_count += 1